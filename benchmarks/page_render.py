@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+📄 End-to-end page render benchmark
+
+Drives every sidebar page of the dashboard headlessly with Streamlit's AppTest
+against mock_meraki_api.py fixtures at several network counts, and records per
+page and scale:
+  - wall time of a cold render (caches cleared) and of a warm rerun
+  - Meraki API calls issued (and 429s) as counted by the mock server
+  - peak Python heap during the cold render (tracemalloc)
+
+Results are written as JSON; pass a previous file with --baseline to flag
+regressions in wall time, API calls or memory.
+
+Usage:
+    python benchmarks/page_render.py [--networks 10,100,1000] [--pages 메인화면,스위치 포트]
+                                     [--output page_render.json] [--baseline old.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from mock_meraki_api import MockDataset, start_in_thread
+
+APP_PATH = os.path.join(ROOT, "meraki_dashboard_complete_final.py")
+
+PAGES = ["메인화면", "트래픽 분석", "클라이언트 분석", "스위치 포트", "디바이스 상태 알림", "라이센스 정보"]
+
+# Relative slowdown tolerated before a result is flagged, plus an absolute floor
+# so millisecond-level noise on tiny fixtures is not reported
+TIME_TOLERANCE = 0.20
+TIME_FLOOR_S = 0.25
+MEMORY_TOLERANCE = 0.20
+
+
+def install_fixture_config(base_url):
+    """
+    Make `from config import ...` in the app resolve to benchmark settings, so a
+    developer's real config.py (and API key) is never used
+    """
+    config = types.ModuleType("config")
+    config.MERAKI_API_KEY = "mock-benchmark-key"
+    config.MERAKI_BASE_URL = base_url
+    config.DEFAULT_ORGANIZATION = None
+    config.DEFAULT_NETWORKS = []
+    config.DEFAULT_TIMESPAN = "Last 24 hours"
+    config.DEFAULT_RESOLUTION = "5 minutes"
+    config.DEFAULT_BANDWIDTH_ANALYSIS = ["WAN Uplinks (Primary/Secondary)", "Peak vs Average Analysis"]
+    config.SHOW_DEBUG_INFO = False
+    config.ALLOWED_ORGANIZATION_IDS = None
+    config.PREFETCH_ENABLED = False   # background loads would skew per-page call counts
+    config.TRAFFIC_HISTORY_ENABLED = False
+    # Local stores go to a scratch directory instead of data/ in the tree
+    store_dir = tempfile.mkdtemp(prefix="meraki-bench-")
+    config.TIMESERIES_DB = os.path.join(store_dir, "timeseries.db")
+    config.WEBHOOK_HISTORY_DB = os.path.join(store_dir, "webhook_history.db")
+    sys.modules["config"] = config
+    os.environ["MERAKI_BASE_URL"] = base_url
+
+
+def render(page, network_names, timeout, quiet):
+    """
+    Run one render of `page` in a fresh session; returns (AppTest, seconds).
+    Streamlit caches are process-wide, so a second call measures a warm render.
+    """
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.session_state["logged_in"] = True
+    at.session_state["username"] = "benchmark"
+    at.session_state["current_page"] = page
+    at.session_state["selected_networks"] = network_names
+    sink = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext():
+        start = time.perf_counter()
+        at.run()
+        elapsed = time.perf_counter() - start
+    return at, elapsed
+
+
+def bench_page(page, networks, server, network_names, args):
+    """Cold render plus warm rerun of a single page"""
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    server.stats.reset()
+
+    if args.memory:
+        tracemalloc.start()
+    at, cold = render(page, network_names, args.timeout, not args.show_app_output)
+    peak_mb = None
+    if args.memory:
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        tracemalloc.stop()
+    cold_stats = server.stats.snapshot()
+
+    server.stats.reset()
+    warm_at, warm = render(page, network_names, args.timeout, not args.show_app_output)
+    warm_stats = server.stats.snapshot()
+
+    return {
+        "page": page,
+        "networks": networks,
+        "cold_s": round(cold, 3),
+        "warm_s": round(warm, 3),
+        "api_calls": sum(v for k, v in cold_stats.items() if k != "rate_limited"),
+        "api_calls_warm": sum(v for k, v in warm_stats.items() if k != "rate_limited"),
+        "rate_limited": cold_stats.get("rate_limited", 0),
+        "peak_mb": round(peak_mb, 1) if peak_mb is not None else None,
+        "calls_by_route": cold_stats,
+        "exceptions": [e.message for e in list(at.exception) + list(warm_at.exception)],
+    }
+
+
+def compare(results, baseline):
+    """Return human readable regression lines against a previous results file"""
+    previous = {(r["page"], r["networks"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        old = previous.get((r["page"], r["networks"]))
+        if not old:
+            continue
+        label = f"{r['page']} @ {r['networks']} networks"
+        for field in ("cold_s", "warm_s"):
+            if r[field] > old[field] * (1 + TIME_TOLERANCE) and r[field] - old[field] > TIME_FLOOR_S:
+                regressions.append(f"{label}: {field} {old[field]:.2f}s -> {r[field]:.2f}s")
+        for field in ("api_calls", "api_calls_warm"):
+            if r[field] > old[field]:
+                regressions.append(f"{label}: {field} {old[field]} -> {r[field]}")
+        if r["peak_mb"] and old.get("peak_mb") and r["peak_mb"] > old["peak_mb"] * (1 + MEMORY_TOLERANCE):
+            regressions.append(f"{label}: peak_mb {old['peak_mb']:.1f} -> {r['peak_mb']:.1f}")
+        if r["exceptions"] and not old.get("exceptions"):
+            regressions.append(f"{label}: new exception {r['exceptions'][0][:80]}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard page render benchmark")
+    parser.add_argument("--networks", default="10,100,1000", help="comma separated network counts")
+    parser.add_argument("--devices-per-network", type=int, default=10)
+    parser.add_argument("--clients-per-network", type=int, default=50)
+    parser.add_argument("--pages", default=",".join(PAGES), help="comma separated page names")
+    parser.add_argument("--latency-ms", type=float, default=0, help="mock API latency per call")
+    parser.add_argument("--rate-limit", type=float, default=0, help="mock API req/s per org (0 disables)")
+    parser.add_argument("--timeout", type=float, default=900, help="seconds allowed per render")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip tracemalloc (faster)")
+    parser.add_argument("--show-app-output", action="store_true", help="do not swallow the app's print output")
+    parser.add_argument("--output", default="page_render.json")
+    parser.add_argument("--baseline", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    scales = [int(n) for n in args.networks.split(",") if n.strip()]
+    pages = [p.strip() for p in args.pages.split(",") if p.strip()]
+
+    print("📄 Page render benchmark")
+    print(f"  scales: {scales} networks x {args.devices_per_network} devices, pages: {len(pages)}")
+    print("=" * 96)
+    print(f"  {'page':<14} {'nets':>5} {'cold s':>8} {'warm s':>8} {'calls':>7} {'warm':>6} {'429':>5} {'peak MB':>8}  notes")
+
+    results = []
+    for networks in scales:
+        dataset = MockDataset(networks=networks, devices_per_network=args.devices_per_network,
+                              clients_per_network=args.clients_per_network)
+        server, base_url = start_in_thread(port=0, dataset=dataset, rate_limit=args.rate_limit,
+                                           latency_ms=args.latency_ms)
+        install_fixture_config(base_url)
+        network_names = [n["name"] for nets in dataset.networks.values() for n in nets]
+        try:
+            for page in pages:
+                r = bench_page(page, networks, server, network_names, args)
+                results.append(r)
+                peak = f"{r['peak_mb']:>8.1f}" if r["peak_mb"] is not None else f"{'-':>8}"
+                notes = f"⚠️ {r['exceptions'][0][:40]}" if r["exceptions"] else ""
+                print(f"  {page:<14} {networks:>5} {r['cold_s']:>8.2f} {r['warm_s']:>8.2f} "
+                      f"{r['api_calls']:>7} {r['api_calls_warm']:>6} {r['rate_limited']:>5} {peak}  {notes}")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "streamlit": st.__version__,
+            "devices_per_network": args.devices_per_network,
+            "clients_per_network": args.clients_per_network,
+            "latency_ms": args.latency_ms,
+            "rate_limit": args.rate_limit,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print("=" * 96)
+    print(f"  results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f))
+        if regressions:
+            print(f"  ❌ {len(regressions)} regression(s) vs {args.baseline}:")
+            for line in regressions:
+                print(f"     - {line}")
+            sys.exit(1)
+        print(f"  ✅ no regressions vs {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
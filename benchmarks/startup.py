@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+🚦 Cold start benchmark
+
+Two measurements, each in fresh interpreters so nothing is already imported:
+  1. import-time profile (python -X importtime) of the dashboard modules and the
+     heavy third-party packages, with the slowest nested imports of each
+  2. login page first paint: a cold AppTest run of the dashboard while logged
+     out, checked against LOGIN_FIRST_PAINT_TARGET_S, plus which heavy modules
+     (pandas, plotly, meraki, ...) were imported to get there (should be none)
+
+Usage:
+    python benchmarks/startup.py [--runs 3] [--top 8] [--output startup.json]
+
+Exits non-zero when the median login first paint misses the target or a heavy
+module is imported before login.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median cold login render (AppTest script run, excluding `import streamlit`)
+LOGIN_FIRST_PAINT_TARGET_S = 0.5
+
+# Must not be imported by the app to render the login page (streamlit itself already
+# pulls in plotly.graph_objects, so only imports beyond `import streamlit` count)
+HEAVY_MODULES = ["pandas", "numpy", "plotly.express", "plotly.graph_objects", "meraki", "matplotlib", "seaborn"]
+
+PROFILED_MODULES = [
+    "streamlit",
+    "pandas",
+    "numpy",
+    "plotly.express",
+    "plotly.graph_objects",
+    "meraki",
+    "meraki_data",
+    "meraki_pages",
+    "meraki_pages.traffic",
+    "meraki_pages.clients",
+]
+
+# Runs inside a fresh interpreter; prints one JSON line
+LOGIN_PROBE = r"""
+import io, contextlib, json, sys, time
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {bench!r})
+start = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+import_s = time.perf_counter() - start
+preloaded = set(sys.modules)
+from page_render import install_fixture_config
+install_fixture_config("http://127.0.0.1:9/api/v1")
+at = AppTest.from_file({app!r}, default_timeout=60)
+with contextlib.redirect_stdout(io.StringIO()):
+    start = time.perf_counter()
+    at.run()
+    render_s = time.perf_counter() - start
+print(json.dumps({{
+    "import_streamlit_s": import_s,
+    "render_s": render_s,
+    "login_form": any(getattr(b, "label", "") for b in at.button) or len(at.text_input) > 0,
+    "heavy_loaded": [m for m in {heavy!r} if m in sys.modules and m not in preloaded],
+    "exceptions": [e.message for e in at.exception],
+}}))
+"""
+
+
+def profile_import(module, top):
+    """Return (cumulative ms, [(ms, name), ...] slowest direct sub-imports) for one module"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True)
+    rows = []   # (cumulative ms, depth, name) in the order -X importtime prints them (children first)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1000, len(name) - len(name.lstrip()), name.strip()))
+    if result.returncode != 0 or not rows:
+        return None, []
+    index = max(i for i, row in enumerate(rows) if row[2] == module)
+    total, depth, _ = rows[index]
+    children = []
+    for ms, child_depth, name in reversed(rows[:index]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 2:
+            children.append((round(ms, 1), name))
+    children.sort(reverse=True)
+    return total, children[:top]
+
+
+def measure_login(runs):
+    """Cold login renders in fresh interpreters with an empty HOME (no saved session)"""
+    probe = LOGIN_PROBE.format(root=ROOT, bench=os.path.join(ROOT, "benchmarks"),
+                               app=os.path.join(ROOT, "meraki_dashboard_complete_final.py"),
+                               heavy=HEAVY_MODULES)
+    samples = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as home:
+            env = dict(os.environ, HOME=home, USERPROFILE=home)
+            env.pop("MERAKI_BASE_URL", None)
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, "-c", probe], cwd=home, env=env,
+                                    capture_output=True, text=True)
+            process_s = time.perf_counter() - start
+        if result.returncode != 0:
+            raise SystemExit(f"login probe failed:\n{result.stderr[-2000:]}")
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        sample["process_s"] = process_s
+        samples.append(sample)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard cold start benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="cold login renders to take the median of")
+    parser.add_argument("--top", type=int, default=8, help="slowest nested imports shown per module")
+    parser.add_argument("--output", default="startup.json")
+    args = parser.parse_args()
+
+    print("🚦 Cold start benchmark")
+    print("=" * 72)
+    print(f"  {'module':<24} {'import ms':>10}  slowest nested imports")
+    profile = {}
+    for module in PROFILED_MODULES:
+        total, nested = profile_import(module, args.top)
+        profile[module] = {"ms": round(total, 1) if total is not None else None, "nested": nested}
+        if total is None:
+            print(f"  {module:<24} {'failed':>10}")
+            continue
+        detail = ", ".join(f"{name} {ms:.0f}" for ms, name in nested[:3])
+        print(f"  {module:<24} {total:>10.1f}  {detail}")
+
+    samples = measure_login(args.runs)
+    render = statistics.median(s["render_s"] for s in samples)
+    process = statistics.median(s["process_s"] for s in samples)
+    heavy = sorted({m for s in samples for m in s["heavy_loaded"]})
+    exceptions = [e for s in samples for e in s["exceptions"]]
+    print("=" * 72)
+    print(f"  login first paint (median of {args.runs}): {render:.3f}s render, "
+          f"{process:.2f}s including interpreter and streamlit import")
+    print(f"  heavy modules imported before login: {', '.join(heavy) or 'none'}")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "target_s": LOGIN_FIRST_PAINT_TARGET_S,
+        },
+        "imports": profile,
+        "login": {"render_s": round(render, 3), "process_s": round(process, 3),
+                  "heavy_loaded": heavy, "exceptions": exceptions, "samples": samples},
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"  results written to {args.output}")
+
+    failed = False
+    if render > LOGIN_FIRST_PAINT_TARGET_S:
+        print(f"  ❌ login first paint {render:.3f}s exceeds target {LOGIN_FIRST_PAINT_TARGET_S:.2f}s")
+        failed = True
+    if heavy:
+        print(f"  ❌ heavy modules imported before login: {', '.join(heavy)}")
+        failed = True
+    if exceptions:
+        print(f"  ❌ login page raised: {exceptions[0][:80]}")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print(f"  ✅ login first paint within {LOGIN_FIRST_PAINT_TARGET_S:.2f}s target")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+📑 Paged table benchmark
+
+Renders a synthetic device table of N rows with Streamlit's AppTest twice:
+  - plain st.dataframe of the whole frame (the old behaviour)
+  - meraki_table.paged_table (search/sort/filter on the server, one page shipped)
+and records script run time and the Arrow payload sent to the browser, for a
+first render and for a search + sort + page change on the paged table.
+
+Usage:
+    python benchmarks/table_paging.py [--rows 1000,10000,50000] [--output table_paging.json]
+
+Exits non-zero if the paged payload grows with the row count.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest
+
+
+def table_app(rows, paged):
+    """AppTest script; runs in the AppTest namespace, so imports are local"""
+    import random
+
+    import pandas as pd
+    import streamlit as st
+
+    from meraki_table import paged_table
+
+    @st.cache_data
+    def frame(n):
+        rng = random.Random(n)
+        statuses = ["online", "offline", "alerting", "dormant"]
+        return pd.DataFrame({
+            "네트워크": [f"Network {i % 100}" for i in range(n)],
+            "디바이스명": [f"device-{i:06d}" for i in range(n)],
+            "모델": [rng.choice(["MS120-8", "MR46", "MX68", "MV12"]) for _ in range(n)],
+            "상태": [rng.choice(statuses) for _ in range(n)],
+            "시리얼": [f"Q2XX-{i:04X}-{rng.randrange(65536):04X}" for i in range(n)],
+            "IP": [f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}" for i in range(n)],
+        })
+
+    df = frame(rows)
+    if paged:
+        status = st.selectbox("상태별 필터", ["전체", "online", "offline", "alerting", "dormant"], key="status")
+        paged_table(df, key="bench", filters={"상태": status})
+    else:
+        st.dataframe(df, use_container_width=True, hide_index=True)
+
+
+def payload_bytes(at):
+    return sum(len(el.proto.arrow_data.data) for el in at.dataframe)
+
+
+def timed_run(at):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        at.run()
+        return time.perf_counter() - start
+
+
+def bench(rows):
+    full = AppTest.from_function(table_app, args=(rows, False), default_timeout=120)
+    timed_run(full)                       # build the cached frame
+    full_s = timed_run(full)
+
+    paged = AppTest.from_function(table_app, args=(rows, True), default_timeout=120)
+    timed_run(paged)
+    paged_s = timed_run(paged)
+    first_payload = payload_bytes(paged)
+
+    paged.text_input(key="bench_search").input("device-00")
+    paged.selectbox(key="bench_sort").set_value("시리얼")
+    paged.selectbox(key="status").set_value("online")
+    interact_s = timed_run(paged)
+    if paged.number_input:
+        paged.number_input(key="bench_page").set_value(2)
+        interact_s = max(interact_s, timed_run(paged))
+
+    return {
+        "rows": rows,
+        "full_s": round(full_s, 4),
+        "full_bytes": payload_bytes(full),
+        "paged_s": round(paged_s, 4),
+        "paged_bytes": first_payload,
+        "paged_interact_s": round(interact_s, 4),
+        "exceptions": [e.message for e in list(full.exception) + list(paged.exception)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paged table benchmark")
+    parser.add_argument("--rows", default="1000,10000,50000", help="comma-separated row counts")
+    parser.add_argument("--output", default="table_paging.json")
+    args = parser.parse_args()
+
+    print("📑 Paged table benchmark")
+    print("=" * 84)
+    print(f"  {'rows':>7} {'full s':>8} {'full KB':>9} {'paged s':>8} {'paged KB':>9} {'search+sort+page s':>19}")
+    results = []
+    for rows in [int(n) for n in args.rows.split(",")]:
+        r = bench(rows)
+        results.append(r)
+        note = f"  ⚠️ {r['exceptions'][0][:40]}" if r["exceptions"] else ""
+        print(f"  {rows:>7} {r['full_s']:>8.3f} {r['full_bytes'] / 1024:>9.1f} {r['paged_s']:>8.3f} "
+              f"{r['paged_bytes'] / 1024:>9.1f} {r['paged_interact_s']:>19.3f}{note}")
+
+    report = {
+        "meta": {"timestamp": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version()},
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print("=" * 84)
+    print(f"  results written to {args.output}")
+
+    # The paged payload is one page regardless of size (allow small variation in cell widths)
+    smallest = min(results, key=lambda r: r["rows"])["paged_bytes"]
+    failed = [r for r in results if r["exceptions"] or r["paged_bytes"] > smallest * 1.5]
+    if failed:
+        print(f"  ❌ paged payload not flat or errors at {', '.join(str(r['rows']) for r in failed)} rows")
+        sys.exit(1)
+    print("  ✅ paged payload flat across row counts")
+
+
+if __name__ == "__main__":
+    main()
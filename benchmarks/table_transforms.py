@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+🧮 Table transform benchmark
+
+Builds the display tables of the traffic and switch port pages from synthetic
+inputs of N rows, once with the previous row-by-row code (iterrows() / per-port
+loops with per-cell f-strings, reproduced below) and once with the vectorized
+column transforms the pages use now:
+  - top applications summary      (traffic.top_apps_summary)
+  - application details table     (traffic.app_details_frame)
+  - cross-network traffic table   (meraki_data.aggregate_cross_network_traffic)
+  - switch port table             (switch_ports.port_status_frame)
+
+Usage:
+    python benchmarks/table_transforms.py [--rows 10000] [--repeat 5] [--output table_transforms.json]
+
+Exits non-zero if a vectorized transform is slower than the code it replaced.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Loader caches warn about the missing Streamlit runtime on import
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+import pandas as pd
+
+from meraki_data import aggregate_cross_network_traffic
+from meraki_pages.switch_ports import port_status_frame
+from meraki_pages.traffic import app_details_frame, top_apps_summary
+
+NETWORK_ROWS = 20   # traffic rows per network in the cross-network input
+
+
+# ---- inputs ----
+
+def app_frame(rows, rng):
+    sent = [rng.uniform(1e3, 5e9) for _ in range(rows)]
+    recv = [rng.uniform(1e3, 2e10) for _ in range(rows)]
+    df = pd.DataFrame({
+        "application": [f"App {i}" for i in range(rows)],
+        "sent": sent,
+        "recv": recv,
+        "numClients": [rng.randint(1, 500) for _ in range(rows)],
+    })
+    df["TotalMB"] = (df["sent"] + df["recv"]) / 1024 / 1024
+    return df
+
+
+def network_traffic(rows, rng):
+    return {
+        f"Network {n}": [{
+            "application": f"App {rng.randrange(rows // 10)}", "destination": None,
+            "sent": rng.uniform(1e3, 5e9), "recv": rng.uniform(1e3, 2e10), "numClients": rng.randint(1, 500),
+        } for _ in range(NETWORK_ROWS)]
+        for n in range(max(1, rows // NETWORK_ROWS))
+    }
+
+
+def switch_ports(rows, rng):
+    statuses = ["Connected", "Disconnected", "Disabled", "Error", None]
+    return [{
+        "portId": str(i % 48 + 1), "status": rng.choice(statuses), "speed": rng.choice(["1 Gbps", "10 Gbps", "", None]),
+        "duplex": rng.choice(["full", "half"]), "enabled": rng.random() < 0.9, "description": None,
+        "type": rng.choice(["access", "trunk"]), "vlan": rng.choice([1, 10, 20, None]), "stpGuard": "disabled",
+        "deviceName": f"switch-{i // 48}",
+    } for i in range(rows)]
+
+
+# ---- previous implementations ----
+
+def legacy_top_apps_summary(top_apps, total_traffic_mb):
+    lines = []
+    for i, (_, app) in enumerate(top_apps.iterrows(), 1):
+        percentage = (app['TotalMB'] / total_traffic_mb) * 100 if total_traffic_mb > 0 else 0
+        lines.append(f"{i}. **{app['application']}**: {app['TotalMB']:.1f}MB ({percentage:.1f}%)")
+    return "  \n".join(lines)
+
+
+def legacy_app_details(top_apps):
+    display_data = []
+    for _, app in top_apps.iterrows():
+        display_data.append({
+            "Application": f"{app['application']} ({app['TotalMB']:.1f}MB)",
+            "Traffic (MB)": f"{app['TotalMB']:.1f}",
+            "Clients": app["numClients"],
+            "Upload (MB)": f"{app['sent']/1024/1024:.1f}",
+            "Download (MB)": f"{app['recv']/1024/1024:.1f}",
+        })
+    return pd.DataFrame(display_data)
+
+
+def legacy_cross_network(traffic_by_network):
+    all_network_traffic = []
+    for name, data in traffic_by_network.items():
+        df = pd.DataFrame(data)
+        df["TotalMB"] = (df["sent"] + df["recv"]) / 1024 / 1024
+        network_apps = df.groupby("application").agg({
+            "TotalMB": "sum", "numClients": "max", "sent": "sum", "recv": "sum"
+        }).reset_index()
+        network_apps["Network"] = name
+        all_network_traffic.append(network_apps)
+    combined = pd.concat(all_network_traffic, ignore_index=True)
+    comprehensive = combined.groupby("application").agg({
+        "TotalMB": "sum", "numClients": "max", "sent": "sum", "recv": "sum",
+        "Network": lambda x: ", ".join(x.unique())
+    }).reset_index().sort_values("TotalMB", ascending=False)
+    rows = []
+    for _, app in comprehensive.iterrows():
+        rows.append({
+            "애플리케이션": app["application"],
+            "총 트래픽 (MB)": f"{app['TotalMB']:.2f}",
+            "총 트래픽 (GB)": f"{app['TotalMB']/1024:.3f}",
+            "최대 클라이언트": app["numClients"],
+            "업로드 (MB)": f"{app['sent']/1024/1024:.2f}",
+            "다운로드 (MB)": f"{app['recv']/1024/1024:.2f}",
+            "네트워크": app["Network"],
+        })
+    return pd.DataFrame(rows)
+
+
+def legacy_port_table(ports):
+    port_analysis = []
+    for port in ports:
+        status = port.get("status") or "N/A"
+        if status.lower() in ["connected", "up", "active"]:
+            colored_status = f'<span style="color: #059669; font-weight: 600;">🟢 {status}</span>'
+        elif status.lower() in ["disconnected", "down", "error", "failed"]:
+            colored_status = f'<span style="color: #dc2626; font-weight: 600;">🔴 {status}</span>'
+        elif status.lower() in ["disabled", "dormant", "inactive"]:
+            colored_status = f'<span style="color: #6b7280; font-weight: 600;">⚫ {status}</span>'
+        else:
+            colored_status = f'<span style="color: #6b7280; font-weight: 600;">⚪ {status}</span>'
+        vlan_value = port.get("vlan", "N/A")
+        if isinstance(vlan_value, (int, float)) and not pd.isna(vlan_value):
+            vlan_value = int(vlan_value)
+        elif vlan_value is None or pd.isna(vlan_value):
+            vlan_value = "N/A"
+        port_analysis.append({
+            "Port ID": port.get("portId", "N/A"), "Status": colored_status,
+            "Speed": port.get("speed", "Null") if port.get("speed") else "Null",
+            "Duplex": port.get("duplex", "N/A"), "Enabled": port.get("enabled", "N/A"),
+            "Description": port.get("description", "N/A"), "Type": port.get("type", "N/A"),
+            "VLAN": vlan_value, "STP Guard": port.get("stpGuard", "N/A"), "Device Name": port.get("deviceName", "N/A"),
+        })
+    return pd.DataFrame(port_analysis)
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Table transform benchmark")
+    parser.add_argument("--rows", type=int, default=10000, help="input rows per transform")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per transform (best is reported)")
+    parser.add_argument("--output", default="table_transforms.json")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    apps = app_frame(args.rows, rng)
+    total_mb = apps["TotalMB"].sum()
+    cases = [
+        ("top_apps_summary", (legacy_top_apps_summary, top_apps_summary), (apps, total_mb)),
+        ("app_details", (legacy_app_details, app_details_frame), (apps,)),
+        ("cross_network", (legacy_cross_network, aggregate_cross_network_traffic), (network_traffic(args.rows, rng),)),
+        ("switch_ports", (legacy_port_table, port_status_frame), (switch_ports(args.rows, rng),)),
+    ]
+
+    print(f"🧮 Table transform benchmark ({args.rows:,} rows, best of {args.repeat})")
+    print("=" * 64)
+    print(f"  {'transform':<20} {'row loop s':>11} {'vectorized s':>13} {'speedup':>9}")
+    results = []
+    for name, (legacy, vectorized), inputs in cases:
+        legacy_s = best_of(args.repeat, legacy, *inputs)
+        vectorized_s = best_of(args.repeat, vectorized, *inputs)
+        results.append({"transform": name, "rows": args.rows, "legacy_s": round(legacy_s, 5),
+                        "vectorized_s": round(vectorized_s, 5), "speedup": round(legacy_s / vectorized_s, 1)})
+        print(f"  {name:<20} {legacy_s:>11.4f} {vectorized_s:>13.4f} {legacy_s / vectorized_s:>8.1f}x")
+
+    report = {
+        "meta": {"timestamp": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                 "pandas": pd.__version__},
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print("=" * 64)
+    print(f"  results written to {args.output}")
+
+    slower = [r["transform"] for r in results if r["speedup"] < 1]
+    if slower:
+        print(f"  ❌ slower than the row loop: {', '.join(slower)}")
+        sys.exit(1)
+    print("  ✅ every transform faster than the row loop")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+🧠 Webhook event history memory benchmark
+
+Measures resident bytes per stored webhook event:
+  - legacy: nested dict per event with the parsed raw payload kept alongside
+  - WebhookEvent: slotted record, interned strings, zlib-compressed raw body
+
+and projects both to 1M events against the 2 GB container memory limit.
+
+Usage:
+    python benchmarks/webhook_memory.py [--events 100000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meraki_webhook_handler import WebhookEvent
+
+CONTAINER_LIMIT_BYTES = 2 * 1024 ** 3
+PROJECTED_EVENTS = 1_000_000
+
+ALERT_TYPES = [
+    ("stopped_reporting", "APs went down", "critical"),
+    ("started_reporting", "APs came up", "informational"),
+    ("switches_went_down", "Switches went down", "critical"),
+    ("settings_changed", "Settings changed", "informational"),
+    ("uplink_status_changed", "Uplink status changed", "warning"),
+]
+MODELS = ["MS225-48LP", "MR46", "MX85", "MV12", "MT10"]
+
+
+def legacy_event(webhook_data):
+    """Event dict as process_webhook built it before the compact representation"""
+    return {
+        "id": webhook_data.get("alertId", "Unknown"),
+        "timestamp": datetime.fromisoformat(webhook_data["occurredAt"].replace("Z", "+00:00")),
+        "type": webhook_data.get("alertType", "Unknown"),
+        "type_id": webhook_data.get("alertTypeId", "Unknown"),
+        "level": webhook_data.get("alertLevel", "informational"),
+        "device": {
+            "name": webhook_data.get("deviceName", "Unknown"),
+            "serial": webhook_data.get("deviceSerial", "Unknown"),
+            "model": webhook_data.get("deviceModel", "Unknown"),
+            "mac": webhook_data.get("deviceMac", "Unknown")
+        },
+        "network": {
+            "id": webhook_data.get("networkId", "Unknown"),
+            "name": webhook_data.get("networkName", "Unknown")
+        },
+        "organization": {
+            "id": webhook_data.get("organizationId", "Unknown"),
+            "name": webhook_data.get("organizationName", "Unknown")
+        },
+        "alert_data": webhook_data.get("alertData", {}),
+        "raw_data": webhook_data
+    }
+
+
+def iter_bodies(count, seed=42):
+    """Yield raw webhook bodies as they arrive on the wire (bytes, freshly allocated strings)"""
+    rng = random.Random(seed)
+    for i in range(count):
+        type_id, alert_type, level = rng.choice(ALERT_TYPES)
+        network = rng.randint(1, 500)
+        device = rng.randint(1, 5000)
+        body = {
+            "version": "0.1",
+            "sharedSecret": "",
+            "sentAt": "2026-10-19T09:00:00.000000Z",
+            "organizationId": "123456",
+            "organizationName": "Benchmark Org",
+            "organizationUrl": "https://n1.meraki.com/o/abc/manage/organization/overview",
+            "networkId": f"L_{network:06d}",
+            "networkName": f"Branch {network}",
+            "networkUrl": f"https://n1.meraki.com/Branch-{network}/n/abc/manage/nodes/list",
+            "deviceSerial": f"Q2XX-{device:04d}-{device * 7 % 10000:04d}",
+            "deviceMac": f"00:11:22:{device // 256 % 256:02x}:{device % 256:02x}:00",
+            "deviceName": f"Device-{device}",
+            "deviceUrl": f"https://n1.meraki.com/Branch-{network}/n/abc/manage/nodes/new_list/{device}",
+            "deviceModel": MODELS[device % len(MODELS)],
+            "alertId": str(600000000000000000 + i),
+            "alertType": alert_type,
+            "alertTypeId": type_id,
+            "alertLevel": level,
+            "occurredAt": f"2026-10-19T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000000Z",
+            "alertData": {"minutes": rng.randint(5, 60)} if level == "critical" else {},
+        }
+        yield json.dumps(body).encode("utf-8")
+
+
+def measure(name, build, count):
+    """Build `count` events with build(raw_body) and report traced bytes per event"""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    store = [build(raw) for raw in iter_bodies(count)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_event = (current - baseline) / count
+    projected = per_event * PROJECTED_EVENTS
+    print(f"  {name:<14} {per_event:>8,.0f} B/event  "
+          f"{count / elapsed:>10,.0f} events/s  "
+          f"1M events ≈ {projected / 1024 ** 2:>7,.0f} MB "
+          f"({projected / CONTAINER_LIMIT_BYTES:.0%} of 2 GB)")
+    del store
+    return per_event
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Webhook event memory benchmark")
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("🧠 Webhook event memory benchmark")
+    print(f"  events: {args.events:,}")
+    print("=" * 78)
+
+    legacy = measure("legacy dict", lambda raw: legacy_event(json.loads(raw)), args.events)
+    compact = measure("WebhookEvent", lambda raw: WebhookEvent(json.loads(raw), raw), args.events)
+
+    print("=" * 78)
+    print(f"  reduction: {legacy / compact:.1f}x smaller per event")
+
+
+if __name__ == "__main__":
+    main()
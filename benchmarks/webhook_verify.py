@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+⏱️ Webhook signature verification benchmark
+
+Measures verifications/second for realistic 2-5 KB Meraki webhook payloads:
+  - legacy: decode body to str, re-encode, build a new HMAC key object per call
+  - verify_webhook: raw bytes + copied keyed HMAC template
+  - verify_webhooks: same, batched over one template lookup
+
+Usage:
+    python benchmarks/webhook_verify.py [--payloads 2000] [--rounds 5]
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from meraki_webhook_handler import verify_webhook, verify_webhooks
+
+SHARED_SECRET = "benchmark-shared-secret-0123456789"
+
+
+def legacy_verify_webhook(data, shared_secret, signature):
+    """Verification as it was done before raw-body handling (decoded str in, re-encoded)"""
+    if not shared_secret or not signature:
+        return False
+    computed_hash = hmac.new(
+        key=shared_secret.encode('utf-8'),
+        msg=data.encode('utf-8'),
+        digestmod=hashlib.sha256
+    ).digest()
+    computed_signature = base64.b64encode(computed_hash).decode()
+    return hmac.compare_digest(computed_signature, signature)
+
+
+def build_payloads(count, seed=42):
+    """Build signed webhook bodies between 2 KB and 5 KB"""
+    rng = random.Random(seed)
+    payloads = []
+    for i in range(count):
+        target_size = rng.randint(2048, 5120)
+        body = {
+            "version": "0.1",
+            "sharedSecret": "",
+            "sentAt": "2026-10-19T09:00:00.000000Z",
+            "organizationId": "123456",
+            "organizationName": "Benchmark Org",
+            "networkId": f"L_{rng.randint(1, 500):06d}",
+            "networkName": f"Branch {rng.randint(1, 500)}",
+            "deviceSerial": f"Q2XX-{rng.randint(0, 9999):04d}-{rng.randint(0, 9999):04d}",
+            "deviceMac": "00:11:22:33:44:55",
+            "deviceName": f"MS-{i}",
+            "deviceModel": rng.choice(["MS225-48LP", "MR46", "MX85", "MV12"]),
+            "alertId": str(600000000000000000 + i),
+            "alertType": rng.choice(["APs went down", "Switches came up", "Settings changed"]),
+            "alertTypeId": rng.choice(["stopped_reporting", "switches_came_up", "settings_changed"]),
+            "alertLevel": rng.choice(["critical", "warning", "informational"]),
+            "occurredAt": "2026-10-19T08:59:58.000000Z",
+            "alertData": {},
+        }
+        raw = json.dumps(body).encode('utf-8')
+        # Pad alertData with change entries until we reach the target size
+        changes = []
+        while len(raw) < target_size:
+            changes.append({"label": f"setting_{len(changes)}", "oldText": "x" * 40, "newText": "y" * 40})
+            body["alertData"] = {"changes": changes}
+            raw = json.dumps(body).encode('utf-8')
+        signature = base64.b64encode(
+            hmac.new(SHARED_SECRET.encode('utf-8'), raw, hashlib.sha256).digest()
+        ).decode()
+        payloads.append((raw, signature))
+    return payloads
+
+
+def run(name, func, rounds, count):
+    """Run func `rounds` times and report the best verifications/second"""
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        ok = func()
+        elapsed = time.perf_counter() - start
+        if not ok:
+            raise RuntimeError(f"{name}: signature verification failed")
+        best = max(best, count / elapsed)
+    print(f"  {name:<18} {best:>12,.0f} verifications/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Webhook HMAC verification benchmark")
+    parser.add_argument("--payloads", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.payloads)
+    sizes = [len(raw) for raw, _ in payloads]
+    # Legacy callers received the already decoded body
+    decoded = [(raw.decode('utf-8'), sig) for raw, sig in payloads]
+
+    print("⏱️ Webhook verification benchmark")
+    print(f"  payloads: {len(payloads)} ({min(sizes)}-{max(sizes)} bytes, avg {sum(sizes) // len(sizes)})")
+    print("=" * 60)
+
+    legacy = run("legacy", lambda: all(legacy_verify_webhook(d, SHARED_SECRET, s) for d, s in decoded),
+                 args.rounds, len(payloads))
+    single = run("verify_webhook", lambda: all(verify_webhook(memoryview(d), SHARED_SECRET, s) for d, s in payloads),
+                 args.rounds, len(payloads))
+    batch = run("verify_webhooks", lambda: all(verify_webhooks(payloads, SHARED_SECRET)),
+                args.rounds, len(payloads))
+
+    print("=" * 60)
+    print(f"  speedup vs legacy: single {single / legacy:.2f}x, batched {batch / legacy:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,11 @@
 # Get your API key from: https://dashboard.meraki.com/organization/settings/api
 MERAKI_API_KEY = "your_meraki_api_key_here"
 
+# API Base URL (Optional)
+# Override to point the dashboard at mock_meraki_api.py for offline testing
+# (the MERAKI_BASE_URL environment variable takes precedence)
+MERAKI_BASE_URL = "https://api.meraki.com/api/v1"
+
 # API Rate Limiting
 API_RATE_LIMIT = 5  # Requests per second
 API_TIMEOUT = 30  # Request timeout in seconds
@@ -63,6 +68,21 @@ DEFAULT_RESOLUTION = "5 minutes"  # Options: "1 minute", "5 minutes", "15 minute
 MAX_WORKERS = 200  # Maximum parallel API workers
 CACHE_TTL = 60  # Cache time-to-live in seconds
 ENABLE_PARALLEL_LOADING = True  # Enable parallel data loading
+API_METRICS_PORT = None  # Serve Prometheus API telemetry at http://<host>:<port>/metrics (e.g. 9108)
+RERUN_TRACE_ENABLED = False  # Write a span trace of every rerun (or set MERAKI_RERUN_TRACE=1)
+RERUN_TRACE_DIR = "logs/traces"  # Chrome trace (.json) + flamegraph (.folded) output
+PREFETCH_ENABLED = True  # Load the next likely page's data in the background after each render
+PREFETCH_RATE_LIMIT = 3.0  # API calls/second prefetching may use (Meraki allows 10/s per organization)
+TABLE_PAGE_SIZE = 50  # Rows per page in device tables (only the visible page is sent to the browser)
+TIMESERIES_DB = "data/timeseries.db"  # SQLite store for bandwidth history (only new intervals are fetched)
+TIMESERIES_RETENTION_DAYS = 31  # Stored history is pruned after this many days
+TRAFFIC_HISTORY_ENABLED = True  # Snapshot application traffic hourly and answer timespans from the stored hour/day/week rollups
+TRAFFIC_TRACK_TTL = 86400  # Stop snapshotting a network's traffic after this many seconds without it being viewed
+ANOMALY_Z_THRESHOLD = 3.0  # Flag hourly app/network traffic this many deviations from its usual level for that hour
+SYSTEM_INFO_REFRESH = 900  # Seconds between background refreshes of device OS version, power and CPU
+SYSTEM_INFO_RATE = 2.0  # Per-device API calls/second of that refresh (appliance CPU has no org-level endpoint)
+UPLINK_HEALTH_WINDOW = 3600  # Seconds of appliance uplink loss/latency behind the WAN health percentiles on 메인화면
+CHART_POINT_BUDGET = 1000  # Max points per time-series chart (long ranges are downsampled, coarser resolution chosen)
 
 # =============================================
 # 🔄 AUTO-REFRESH SETTINGS
@@ -130,6 +150,11 @@ WEBHOOK_SECRET = "your_webhook_secret_here"  # Shared secret for webhook validat
 WEBHOOK_STORE_EVENTS = 1000  # Maximum number of events to store in memory
 WEBHOOK_PORT = 8080  # Port for webhook receiver
 
+# Webhook History Retention
+WEBHOOK_HISTORY_DB = "data/webhook_history.db"  # SQLite file for event history
+WEBHOOK_RAW_RETENTION_DAYS = 7  # Keep full events (with payload) for this many days
+WEBHOOK_ROLLUP_RETENTION_DAYS = 365  # Keep per-hour counts by type/network/device this long
+
 # Webhook Event Types
 WEBHOOK_EVENT_TYPES = [
     "device_status_changed",
@@ -152,10 +177,11 @@ DOCKER_HEADLESS = True  # Run in headless mode
 # =============================================
 
 # Log Levels
-LOG_LEVEL = "INFO"  # Options: DEBUG, INFO, WARNING, ERROR, CRITICAL
+LOG_LEVEL = "INFO"  # Options: DEBUG, INFO, WARNING, ERROR, CRITICAL (env MERAKI_LOG_LEVEL overrides)
 LOG_FILE = "logs/dashboard.log"  # Log file path
 LOG_MAX_SIZE = 10485760  # Max log file size (10MB)
 LOG_BACKUP_COUNT = 5  # Number of backup log files
+LOG_RATE_LIMIT = 20  # Max repeats of the same message per minute (0 disables rate limiting)
 
 # =============================================
 # 🚀 DEPLOYMENT SETTINGS
@@ -26,7 +26,7 @@ def main():
     
     # Core required packages
     required_packages = [
-        "streamlit>=1.28.0",
+        "streamlit>=1.52.0",
         "meraki>=1.35.0", 
         "pandas>=2.0.0",
         "numpy>=1.24.0",
@@ -35,8 +35,6 @@ def main():
     
     # Optional packages
     optional_packages = [
-        "matplotlib>=3.7.0",
-        "seaborn>=0.12.0",
         "openpyxl>=3.1.0"
     ]
     
@@ -0,0 +1,166 @@
+# Traffic anomaly detection
+# Each hourly traffic snapshot (meraki_traffic_history) updates an exponentially weighted mean and
+# variance per (network, application, hour of day), plus one for the network total ("*"), so an app
+# is compared with what it usually does at that time of day. Once a baseline has ANOMALY_WARMUP
+# observations, a bucket whose z-score reaches ANOMALY_Z_THRESHOLD is recorded as an anomaly.
+# Updates are incremental: a new bucket is one vectorized pass over that bucket's applications
+# against the stored state, never a recomputation over the history.
+import os
+import sqlite3
+import threading
+import time
+
+from meraki_lazy import lazy_import
+from meraki_logging import get_logger
+from meraki_timeseries import TIMESERIES_DB, TIMESERIES_RETENTION_DAYS
+
+np = lazy_import("numpy")
+
+log = get_logger("timeseries")
+
+try:
+    from config import ANOMALY_Z_THRESHOLD
+except ImportError:
+    ANOMALY_Z_THRESHOLD = 3.0
+
+ANOMALY_ALPHA = 0.3              # EWMA weight of the newest observation
+ANOMALY_WARMUP = 4               # observations of a baseline before it can flag anything
+STD_FLOOR = 0.1                  # deviation floor as a fraction of the mean (steady series are not all-anomalous)
+MIN_BYTES = 10 * 1024 * 1024     # buckets where both value and baseline are below this are ignored
+NETWORK_TOTAL = "*"              # application name of the per-network total
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS traffic_baseline (
+    network_id TEXT NOT NULL,
+    application TEXT NOT NULL,
+    hour_of_day INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    var REAL NOT NULL,
+    n INTEGER NOT NULL,
+    last_bucket INTEGER NOT NULL,
+    PRIMARY KEY (network_id, application, hour_of_day)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS traffic_anomalies (
+    network_id TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    application TEXT NOT NULL,
+    value REAL NOT NULL,
+    baseline REAL NOT NULL,
+    z REAL NOT NULL,
+    PRIMARY KEY (network_id, bucket, application)
+);
+"""
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _connection():
+    global _conn
+    if _conn is None:
+        directory = os.path.dirname(TIMESERIES_DB)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _conn = sqlite3.connect(TIMESERIES_DB, timeout=30, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.executescript(_SCHEMA)
+    return _conn
+
+
+def update_baselines(network_id, bucket, rows):
+    """
+    Score one hourly getNetworkTraffic snapshot against the baselines for its hour of day, record
+    anomalies and fold the snapshot into the baselines. Returns the anomalies found.
+    """
+    applications = [row.get("application") or "" for row in rows or []]
+    volumes = np.array([(row.get("sent") or 0) + (row.get("recv") or 0) for row in rows or []], dtype=float)
+    names, positions = np.unique(np.array(applications, dtype=object), return_inverse=True)
+    totals = np.bincount(positions, weights=volumes, minlength=len(names)) if len(names) else np.zeros(0)
+    observed = dict(zip(names.tolist(), totals.tolist()))
+    observed[NETWORK_TOTAL] = float(volumes.sum())
+
+    hour_of_day = int(bucket // 3600 % 24)
+    with _lock:
+        conn = _connection()
+        state = {application: (mean, var, n, last) for application, mean, var, n, last in conn.execute(
+            "SELECT application, mean, var, n, last_bucket FROM traffic_baseline "
+            "WHERE network_id = ? AND hour_of_day = ?", (network_id, hour_of_day)
+        )}
+        # Known applications missing from this bucket had no traffic in it (only those big enough to flag)
+        apps = sorted(set(observed) | {app for app, (mean, _, _, _) in state.items() if mean >= MIN_BYTES})
+        previous = np.array([state.get(app, (0.0, 0.0, 0, -1)) for app in apps], dtype=float).reshape(-1, 4)
+        mean, var, n, last = previous.T
+        fresh = last < bucket                     # a re-stored bucket is not counted twice
+        x = np.array([observed.get(app, 0.0) for app in apps])
+
+        std = np.sqrt(var) + STD_FLOOR * mean
+        z = np.divide(x - mean, std, out=np.zeros_like(x), where=std > 0)
+        flagged = fresh & (n >= ANOMALY_WARMUP) & (np.abs(z) >= ANOMALY_Z_THRESHOLD) & (np.maximum(x, mean) >= MIN_BYTES)
+
+        diff = x - mean
+        increment = ANOMALY_ALPHA * diff
+        first = n == 0
+        new_mean = np.where(first, x, mean + increment)
+        new_var = np.where(first, 0.0, (1 - ANOMALY_ALPHA) * (var + diff * increment))
+        update = np.flatnonzero(fresh)
+
+        anomalies = [{"network_id": network_id, "bucket": bucket, "application": apps[i],
+                      "value": float(x[i]), "baseline": float(mean[i]), "z": float(z[i])}
+                     for i in np.flatnonzero(flagged)]
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO traffic_baseline VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(network_id, apps[i], hour_of_day, float(new_mean[i]), float(new_var[i]), int(n[i]) + 1, bucket)
+                 for i in update]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO traffic_anomalies VALUES (?, ?, ?, ?, ?, ?)",
+                [(a["network_id"], a["bucket"], a["application"], a["value"], a["baseline"], a["z"]) for a in anomalies]
+            )
+    if anomalies:
+        log.info("%d traffic anomalies in %s at %s", len(anomalies), network_id, time.strftime("%Y-%m-%d %H:00", time.gmtime(bucket)))
+    return anomalies
+
+
+def recent_anomalies(network_ids, since):
+    """
+    Anomalies of the given networks from buckets starting at or after `since`, largest |z| first
+    """
+    if not network_ids:
+        return []
+    with _lock:
+        cursor = _connection().execute(
+            "SELECT network_id, bucket, application, value, baseline, z FROM traffic_anomalies "
+            f"WHERE bucket >= ? AND network_id IN ({', '.join('?' * len(network_ids))}) ORDER BY ABS(z) DESC",
+            (since, *network_ids)
+        )
+        return [{"network_id": net, "bucket": bucket, "application": application, "value": value,
+                 "baseline": baseline, "z": z} for net, bucket, application, value, baseline, z in cursor.fetchall()]
+
+
+def baseline_progress(network_ids):
+    """
+    Fewest observations behind any network-total baseline of the given networks (0 = none yet);
+    detection is active once this reaches ANOMALY_WARMUP
+    """
+    if not network_ids:
+        return 0
+    with _lock:
+        row = _connection().execute(
+            f"SELECT MIN(n), COUNT(DISTINCT network_id) FROM traffic_baseline WHERE application = ? "
+            f"AND network_id IN ({', '.join('?' * len(network_ids))})", (NETWORK_TOTAL, *network_ids)
+        ).fetchone()
+    return row[0] if row[0] is not None and row[1] == len(network_ids) else 0
+
+
+def compact_anomalies(now=None):
+    """
+    Drop anomalies, and baselines not updated, within the time-series retention
+    """
+    cutoff = (now or time.time()) - TIMESERIES_RETENTION_DAYS * 86400
+    with _lock:
+        conn = _connection()
+        with conn:
+            conn.execute("DELETE FROM traffic_anomalies WHERE bucket < ?", (cutoff,))
+            conn.execute("DELETE FROM traffic_baseline WHERE last_bucket < ?", (cutoff,))
@@ -0,0 +1,327 @@
+# Meraki API Telemetry
+# Per-operation latency histograms, retry/429 counts and response sizes for every
+# Dashboard API call made through an instrumented meraki.DashboardAPI client.
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from meraki_logging import get_logger
+
+log = get_logger("telemetry")
+
+try:
+    from config import API_METRICS_PORT
+except ImportError:
+    API_METRICS_PORT = None  # Set e.g. 9108 to serve Prometheus metrics at /metrics
+
+# Histogram bucket upper bounds in seconds (Prometheus style, +Inf implied)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Recent samples kept per operation for percentile display
+RECENT_SAMPLES = 512
+
+
+class OperationStats:
+    """
+    Aggregated telemetry for one Meraki operationId (or one loader)
+    """
+    __slots__ = ("calls", "errors", "attempts", "rate_limited", "bytes", "total_seconds",
+                 "max_seconds", "buckets", "recent")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.attempts = 0
+        self.rate_limited = 0
+        self.bytes = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, seconds, error=False):
+        self.calls += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        if error:
+            self.errors += 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.recent.append(seconds)
+
+    def percentile(self, q):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# Process-wide registries; API calls run on parallel_api_calls worker threads
+_lock = threading.Lock()
+_operations = {}     # operationId -> OperationStats
+_loaders = {}        # loader name -> OperationStats
+_started_at = time.time()
+_current = threading.local()
+_metrics_server = None
+_request_gate = None          # called before every logical API call (see set_request_gate)
+_last_rate_limited_at = 0.0   # time.time() of the most recent 429
+
+
+def _stats_for(registry, name):
+    stats = registry.get(name)
+    if stats is None:
+        stats = registry[name] = OperationStats()
+    return stats
+
+
+def instrument_dashboard(dashboard):
+    """
+    Wrap a meraki.DashboardAPI session so every call is recorded.
+    session.request is timed as one logical call (including retries and 429 waits);
+    session._send_request counts individual HTTP attempts, 429s and bytes.
+    Safe to call more than once on the same client.
+    """
+    session = getattr(dashboard, "_session", None)
+    if session is None or getattr(session, "_telemetry_instrumented", False):
+        return dashboard
+
+    request = session.request
+    send_request = session._send_request
+
+    def timed_request(metadata, method, url, **kwargs):
+        operation = metadata.get("operation", "unknown")
+        if _request_gate is not None:
+            _request_gate()
+        outer = getattr(_current, "attempts", None)
+        _current.attempts = {"attempts": 0, "rate_limited": 0, "bytes": 0}
+        start = time.perf_counter()
+        error = False
+        try:
+            return request(metadata, method, url, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            attempts = _current.attempts
+            _current.attempts = outer
+            with _lock:
+                stats = _stats_for(_operations, operation)
+                stats.observe(elapsed, error)
+                stats.attempts += attempts["attempts"]
+                stats.rate_limited += attempts["rate_limited"]
+                stats.bytes += attempts["bytes"]
+
+    def counted_send_request(method, url, **kwargs):
+        response = send_request(method, url, **kwargs)
+        attempts = getattr(_current, "attempts", None)
+        if attempts is not None:
+            attempts["attempts"] += 1
+            if response.status_code == 429:
+                attempts["rate_limited"] += 1
+            try:
+                attempts["bytes"] += len(response.content)
+            except Exception:
+                pass
+        if response.status_code == 429:
+            _mark_rate_limited()
+        return response
+
+    session.request = timed_request
+    session._send_request = counted_send_request
+    session._telemetry_instrumented = True
+    return dashboard
+
+
+def _mark_rate_limited():
+    global _last_rate_limited_at
+    _last_rate_limited_at = time.time()
+
+
+def set_request_gate(gate):
+    """
+    Install a callable run before each Meraki API call (outside the latency timer),
+    e.g. the prefetcher's rate budget. None removes it.
+    """
+    global _request_gate
+    _request_gate = gate
+
+
+def seconds_since_rate_limited():
+    """
+    Seconds since the last HTTP 429 from the Dashboard API (inf if none yet)
+    """
+    if not _last_rate_limited_at:
+        return float("inf")
+    return time.time() - _last_rate_limited_at
+
+
+def observe_loader(name, seconds, error=False):
+    """
+    Record the wall time of a data loader (replaces ad-hoc duration prints)
+    """
+    with _lock:
+        _stats_for(_loaders, name).observe(seconds, error)
+
+
+def _summarize(registry):
+    rows = []
+    for name, stats in registry.items():
+        rows.append({
+            "name": name,
+            "calls": stats.calls,
+            "errors": stats.errors,
+            "retries": max(0, stats.attempts - stats.calls),
+            "rate_limited": stats.rate_limited,
+            "total_s": round(stats.total_seconds, 3),
+            "avg_ms": round(stats.total_seconds / stats.calls * 1000, 1) if stats.calls else 0.0,
+            "p50_ms": round(stats.percentile(0.50) * 1000, 1),
+            "p95_ms": round(stats.percentile(0.95) * 1000, 1),
+            "max_ms": round(stats.max_seconds * 1000, 1),
+            "kb": round(stats.bytes / 1024, 1),
+        })
+    rows.sort(key=lambda r: r["total_s"], reverse=True)
+    return rows
+
+
+def get_api_telemetry():
+    """
+    Snapshot of per-operation and per-loader telemetry, slowest total first
+    """
+    with _lock:
+        return {
+            "operations": _summarize(_operations),
+            "loaders": _summarize(_loaders),
+            "since": _started_at,
+        }
+
+
+def reset_api_telemetry():
+    global _started_at
+    with _lock:
+        _operations.clear()
+        _loaders.clear()
+        _started_at = time.time()
+
+
+def render_prometheus():
+    """
+    Prometheus text exposition of all recorded telemetry
+    """
+    lines = []
+
+    def histogram(metric, label, registry, help_text):
+        lines.append(f"# HELP {metric}_seconds {help_text}")
+        lines.append(f"# TYPE {metric}_seconds histogram")
+        for name, stats in sorted(registry.items()):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += count
+                lines.append(f'{metric}_seconds_bucket{{{label}="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_seconds_bucket{{{label}="{name}",le="+Inf"}} {stats.calls}')
+            lines.append(f'{metric}_seconds_sum{{{label}="{name}"}} {stats.total_seconds:.6f}')
+            lines.append(f'{metric}_seconds_count{{{label}="{name}"}} {stats.calls}')
+
+    def counter(metric, label, registry, attr, help_text):
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for name, stats in sorted(registry.items()):
+            lines.append(f'{metric}{{{label}="{name}"}} {getattr(stats, attr)}')
+
+    with _lock:
+        histogram("meraki_api_request", "operation", _operations,
+                  "Meraki Dashboard API call latency including retries")
+        counter("meraki_api_errors_total", "operation", _operations, "errors",
+                "Meraki API calls that raised")
+        counter("meraki_api_attempts_total", "operation", _operations, "attempts",
+                "HTTP attempts including retries")
+        counter("meraki_api_rate_limited_total", "operation", _operations, "rate_limited",
+                "HTTP 429 responses")
+        counter("meraki_api_response_bytes_total", "operation", _operations, "bytes",
+                "Response body bytes received")
+        histogram("dashboard_loader", "loader", _loaders, "Dashboard data loader wall time")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port=None, host="0.0.0.0"):
+    """
+    Serve /metrics on a background thread (once per process).
+    Returns the server, or None when no port is configured.
+    """
+    global _metrics_server
+    port = port or API_METRICS_PORT
+    if not port:
+        return None
+    with _lock:
+        if _metrics_server is None:
+            try:
+                _metrics_server = ThreadingHTTPServer((host, int(port)), _MetricsHandler)
+            except OSError as e:
+                log.warning("API metrics endpoint not started on port %s: %s", port, e)
+                return None
+            _metrics_server.daemon_threads = True
+            threading.Thread(target=_metrics_server.serve_forever, daemon=True).start()
+    return _metrics_server
+
+
+def render_api_diagnostics():
+    """
+    Render the per-endpoint telemetry tables (used by the sidebar diagnostics panel)
+    """
+    import pandas as pd
+    import streamlit as st
+
+    telemetry = get_api_telemetry()
+    operations = telemetry["operations"]
+
+    total_calls = sum(r["calls"] for r in operations)
+    total_429 = sum(r["rate_limited"] for r in operations)
+    total_time = sum(r["total_s"] for r in operations)
+    st.caption(f"API 호출 {total_calls:,}회 · 429 {total_429:,}회 · 누적 {total_time:.1f}초")
+
+    if operations:
+        st.dataframe(
+            pd.DataFrame(operations).rename(columns={"name": "operation"})[
+                ["operation", "calls", "total_s", "p50_ms", "p95_ms", "max_ms", "retries", "rate_limited", "errors", "kb"]
+            ],
+            use_container_width=True, hide_index=True
+        )
+    else:
+        st.info("아직 기록된 API 호출이 없습니다.")
+
+    if telemetry["loaders"]:
+        st.dataframe(
+            pd.DataFrame(telemetry["loaders"]).rename(columns={"name": "loader"})[
+                ["loader", "calls", "total_s", "avg_ms", "p95_ms", "max_ms"]
+            ],
+            use_container_width=True, hide_index=True
+        )
+
+    if API_METRICS_PORT:
+        st.caption(f"Prometheus: http://<host>:{API_METRICS_PORT}/metrics")
+    if st.button("🔄 통계 초기화", key="api_telemetry_reset"):
+        reset_api_telemetry()
+        st.rerun()
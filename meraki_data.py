@@ -0,0 +1,1393 @@
+# Meraki Dashboard Data Layer
+# Cached Meraki Dashboard API loaders shared by the dashboard script and the page
+# modules in meraki_pages. Each page declares which of these it needs, so a rerun
+# only fetches data for the page being shown.
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import streamlit as st
+
+from meraki_device_status import record_snapshot
+from meraki_events import ingest, iter_device_events
+from meraki_export import event_log_chunks, export_bundle, export_file, export_filename
+from meraki_rollup import build_rollup
+from meraki_system_info import schedule_collection
+from meraki_timeseries import (client_bandwidth_history, plan_resolution, uplink_loss_latency_history,
+                               uplink_usage_history)
+from meraki_traffic_history import track_network, traffic_history
+from meraki_api_telemetry import instrument_dashboard, observe_loader
+from meraki_rerun_tracer import traced_cache_data
+from meraki_logging import get_logger
+from meraki_lazy import lazy_import
+
+log = get_logger("data")
+
+# Imported on first use; see meraki_lazy
+meraki = lazy_import("meraki")
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+try:
+    from config import SHOW_DEBUG_INFO
+except ImportError:
+    SHOW_DEBUG_INFO = False
+
+# API base URL - point at mock_meraki_api.py for offline testing and benchmarks
+try:
+    from config import MERAKI_BASE_URL
+except ImportError:
+    MERAKI_BASE_URL = "https://api.meraki.com/api/v1"
+MERAKI_BASE_URL = os.environ.get("MERAKI_BASE_URL", MERAKI_BASE_URL).rstrip("/")
+
+try:
+    from config import UPLINK_HEALTH_WINDOW
+except ImportError:
+    UPLINK_HEALTH_WINDOW = 3600   # seconds of uplink loss/latency behind the WAN health percentiles
+
+# Set up thread-local warning suppression
+_thread_local = threading.local()
+
+def setup_thread_warnings():
+    """Setup warning suppression for each thread"""
+    if not hasattr(_thread_local, 'warnings_setup'):
+        import warnings
+        import os
+        # Set environment variable for this thread
+        os.environ["STREAMLIT_LOGGER_LEVEL"] = "ERROR"
+        warnings.filterwarnings("ignore", message=".*missing ScriptRunContext.*")
+        warnings.filterwarnings("ignore", category=UserWarning, module="streamlit")
+        warnings.filterwarnings("ignore", category=RuntimeWarning, module="streamlit")
+        _thread_local.warnings_setup = True
+
+# Initialize API
+@st.cache_resource
+def init_api(key):
+    if not key:
+        return None
+    try:
+        return instrument_dashboard(meraki.DashboardAPI(key, base_url=MERAKI_BASE_URL, suppress_logging=True))
+    except Exception as e:
+        st.error(f"Failed to initialize Meraki API: {e}")
+        return None
+
+# Parallel processing helper functions
+def suppress_streamlit_warnings():
+    """Suppress Streamlit warnings in parallel threads"""
+    import warnings
+    import logging
+    
+    # Suppress specific warnings
+    warnings.filterwarnings("ignore", message=".*missing ScriptRunContext.*")
+    warnings.filterwarnings("ignore", category=UserWarning, module="streamlit")
+    warnings.filterwarnings("ignore", category=RuntimeWarning, module="streamlit")
+    
+    # Suppress logging warnings
+    logging.getLogger("streamlit.runtime.scriptrunner.script_runner").setLevel(logging.ERROR)
+    logging.getLogger("streamlit.runtime.scriptrunner").setLevel(logging.ERROR)
+
+def safe_api_call(func, *args, **kwargs):
+    """Safely execute API call with error handling"""
+    try:
+        # Setup thread-specific warning suppression
+        setup_thread_warnings()
+        suppress_streamlit_warnings()
+        return func(*args, **kwargs)
+    except Exception as e:
+        log.debug("API call failed: %s - %s", func.__name__, e)
+        return None
+
+def parallel_api_calls(api_calls, max_workers=100):  # EXTREME workers for 10-second target
+    """Execute multiple API calls in parallel with EXTREME worker count for 10-second target"""
+    results = {}
+    if not api_calls:
+        return results
+    
+    # Suppress warnings at the start of parallel execution
+    suppress_streamlit_warnings()
+    
+    # EXTREME optimize worker count for 10-second target
+    if len(api_calls) < max_workers:
+        max_workers = len(api_calls)
+    
+    # EXTREME max workers for fastest processing
+    max_workers = min(max_workers, 200)  # Increased to 200 for maximum speed
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Submit all tasks; each runs in a copy of the caller's context so a
+        # background prefetch stays low priority on the worker threads too
+        future_to_key = {
+            executor.submit(contextvars.copy_context().run, safe_api_call, call['func'],
+                            *call.get('args', []), **call.get('kwargs', {})): call['key']
+            for call in api_calls
+        }
+        
+        # Collect results as they complete
+        for future in as_completed(future_to_key):
+            key = future_to_key[future]
+            try:
+                result = future.result()
+                results[key] = result
+            except Exception as e:
+                log.debug("Failed to get result for %s: %s", key, e)
+                results[key] = None
+    
+    return results
+
+def parallel_data_loading(load_functions, api_key, **common_params):
+    """Load multiple data types in parallel"""
+    api_calls = []
+    
+    for func_name, func in load_functions.items():
+        # Prepare function arguments
+        args = [api_key]
+        if 'org_id' in common_params:
+            args.append(common_params['org_id'])
+        if 'network_id' in common_params:
+            args.append(common_params['network_id'])
+        if 'timespan' in common_params:
+            args.append(common_params['timespan'])
+        if 'resolution' in common_params:
+            args.append(common_params['resolution'])
+        
+        api_calls.append({
+            'key': func_name,
+            'func': func,
+            'args': args
+        })
+    
+    return parallel_api_calls(api_calls)
+
+
+# Get all organizations without filtering (filtering will be done at network level)
+@traced_cache_data(ttl=300, show_spinner="조직 정보 로딩 중...")  # Cache for 5 minutes
+def get_all_organizations(key):
+    """Get list of all organizations without filtering"""
+    try:
+        from datetime import datetime
+        
+        start_time = datetime.now()
+        
+        api = init_api(key)
+        if not api:
+            log.warning("Failed to initialize API")
+            # Don't cache failed results
+            raise Exception("Failed to initialize Meraki API")
+        
+        # Get all organizations
+        log.debug("Getting all organizations...")
+        
+        try:
+            organizations = api.organizations.getOrganizations()
+            log.debug("Found %s total organizations", len(organizations))
+            
+            if not organizations or len(organizations) == 0:
+                log.warning("No organizations returned from API")
+                # Don't cache empty results
+                raise Exception("No organizations found - API returned empty list")
+                
+        except Exception as api_error:
+            log.warning("getOrganizations failed: %s: %s", type(api_error).__name__, api_error,
+                        exc_info=log.isEnabledFor(logging.DEBUG))
+            # Re-raise to prevent caching
+            raise
+        
+        # Convert to simple list format
+        org_list = []
+        for org in organizations:
+            org_list.append({
+                'id': org.get('id'),
+                'name': org.get('name', 'Unknown')
+            })
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        observe_loader("get_all_organizations", duration)
+        
+        return org_list
+        
+    except Exception as e:
+        log.error("Error in get_all_organizations: %s: %s", type(e).__name__, e, exc_info=True)
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to get organizations: {e}")
+        # Re-raise to prevent caching failed results
+        raise
+
+
+# Load all organizations (no filtering at organization level) - Optimized for speed
+@traced_cache_data(ttl=300, show_spinner="조직 목록 로딩 중...")  # Reduced TTL
+def load_orgs(key):
+    """Load all organizations - filtering will be done at network level"""
+    try:
+        # Get all organizations
+        all_orgs = get_all_organizations(key)
+        
+        log.debug("Final organization list: %s organizations", len(all_orgs))
+        
+        return all_orgs
+    except Exception as e:
+        log.error("Error in load_orgs: %s", e)
+        st.error(f"Failed to load organizations: {e}")
+        # Re-raise to prevent caching
+        raise
+
+# Ultra-fast critical data loading for immediate display
+@traced_cache_data(ttl=15, show_spinner="중요 데이터 로딩 중...")  # Ultra-short TTL
+def load_critical_data_fast(key, org_id):
+    """Load only critical data for immediate display"""
+    try:
+        log.debug("Loading critical data for immediate display...")
+        start_time = datetime.now()
+        
+        # Load only the most essential data
+        devices = load_devices(key, org_id)
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        observe_loader("load_critical_data_fast", duration)
+        return devices
+        
+    except Exception as e:
+        log.error("Error loading critical data: %s", e)
+        return []
+
+# EXTREME SPEED: Minimal data loading for 10-second target
+@traced_cache_data(ttl=5, show_spinner="초고속 로딩 중...")  # Ultra-minimal TTL
+def load_dashboard_data_parallel(key, org_id, network_ids, timespan, resolution):
+    """Load ONLY essential data for 10-second target"""
+    try:
+        start_time = datetime.now()
+        
+        # ONLY load absolutely essential data - NO optional data
+        essential_functions = {
+            'devices': load_devices
+            # Removed ALL other functions for maximum speed
+        }
+        
+        # Load ONLY essential data
+        log.debug("Loading ONLY essential data...")
+        org_results = parallel_data_loading(essential_functions, key, org_id=org_id)
+        
+        # Skip network data loading for speed - only load if absolutely necessary
+        network_results = {}
+        for network_id in network_ids:
+            network_results[network_id] = {
+                'clients_overview': {},
+                'clients': [],
+                'traffic': {},
+                'bandwidth': [],
+                'limits': [],
+                'wan_bandwidth': []
+            }
+        
+        # Skip switch ports for speed
+        switch_ports = {}
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        observe_loader("load_dashboard_data_parallel", duration)
+        
+        return {
+            'org_data': org_results,
+            'network_data': network_results,
+            'switch_ports': switch_ports,
+            'load_time': duration,
+            'performance_metrics': {
+                'networks_processed': len(network_ids),
+                'essential_functions_processed': len(essential_functions),
+                'total_api_calls': len(essential_functions),  # Only 1 API call!
+                'avg_time_per_call': duration / len(essential_functions) if len(essential_functions) > 0 else 0
+            }
+        }
+        
+    except Exception as e:
+        log.error("Error in extreme speed loading: %s", e)
+        st.error(f"Failed to load dashboard data: {e}")
+        return {
+            'org_data': {},
+            'network_data': {},
+            'switch_ports': {},
+            'load_time': 0,
+            'performance_metrics': {}
+        }
+
+# Load organization licensing entitlements
+@traced_cache_data(ttl=3600)
+def load_licensing_entitlements(key):
+    """Load available licensing entitlements"""
+    try:
+        api = init_api(key)
+        if not api:
+            return []
+        
+        entitlements = api.organizations.getOrganizationLicensingSubscriptionEntitlements()
+        return entitlements
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.write(f"Could not load licensing entitlements: {e}")
+        return []
+
+# Load organization subscriptions
+@traced_cache_data(ttl=3600)
+def load_licensing_subscriptions(key):
+    """Load organization subscriptions"""
+    try:
+        api = init_api(key)
+        if not api:
+            return []
+        
+        subscriptions = api.organizations.getOrganizationLicensingSubscriptionSubscriptions()
+        return subscriptions
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.write(f"Could not load subscriptions: {e}")
+        return []
+
+# Load networks without filtering
+@traced_cache_data(ttl=300)
+def load_networks(key, org_id):
+    """Load all networks without filtering"""
+    try:
+        api = init_api(key)
+        if not api:
+            log.warning("Failed to initialize API")
+            return []
+        
+        # Get all networks
+        log.debug("Getting all networks...")
+        all_networks = api.organizations.getOrganizationNetworks(org_id)
+        log.debug("Found %s total networks", len(all_networks))
+        
+        return all_networks
+        
+    except Exception as e:
+        log.error("Error in load_networks: %s", e)
+        st.error(f"Failed to load networks: {e}")
+        return []
+
+# Load device statuses with full pagination support
+@traced_cache_data(ttl=180)
+def load_devices(key, org_id):
+    try:
+        api = init_api(key)
+        if not api:
+            return []
+        
+        all_devices = []
+        fetch_started = time.time()
+        
+        # First request with perPage=1000 (maximum allowed)
+        devices = api.organizations.getOrganizationDevicesStatuses(org_id, perPage=1000)
+        all_devices.extend(devices)
+        
+        # If we got exactly 1000 devices, there might be more - implement pagination
+        while len(devices) == 1000:
+            try:
+                # Get next page using the last device as starting point
+                last_device_serial = devices[-1].get('serial', '')
+                devices = api.organizations.getOrganizationDevicesStatuses(
+                    org_id, 
+                    perPage=1000,
+                    startingAfter=last_device_serial
+                )
+                if devices:
+                    all_devices.extend(devices)
+                else:
+                    break
+            except Exception as pagination_error:
+                # If pagination fails, just use what we have
+                if SHOW_DEBUG_INFO:
+                    st.warning(f"Pagination failed, using {len(all_devices)} devices: {pagination_error}")
+                break
+        
+        if SHOW_DEBUG_INFO:
+            st.info(f"Loaded {len(all_devices)} total devices from organization")
+        
+        # Webhook patches older than this fetch are now part of the snapshot
+        record_snapshot(org_id, fetch_started)
+        build_rollup(org_id, all_devices, fetch_started)
+        # OS version, power and CPU are refreshed in the background for the whole organization
+        schedule_collection(api, org_id, all_devices)
+        
+        return all_devices
+        
+    except Exception as e:
+        st.error(f"Failed to load devices: {e}")
+        return []
+
+# ULTRA-FAST device details loading - optimized for speed
+@traced_cache_data(ttl=60)  # Reduced TTL for faster updates
+def load_device_details(key, org_id):
+    """Load device details with minimal API calls for maximum speed"""
+    try:
+        log.debug("ULTRA-FAST device details loading...")
+        start_time = datetime.now()
+        
+        api = init_api(key)
+        if not api:
+            return []
+        
+        # ONLY get device statuses (includes most essential info)
+        # Skip getOrganizationDevices call to save time
+        fetch_started = time.time()
+        device_statuses = api.organizations.getOrganizationDevicesStatuses(org_id, perPage=1000)
+        record_snapshot(org_id, fetch_started, source="details")
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        observe_loader("load_device_details", duration)
+        
+        return device_statuses
+    except Exception as e:
+        log.error("Error loading device details: %s", e)
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load device details: {e}")
+        return []
+
+# ULTRA-FAST device firmware loading - optimized for speed
+@traced_cache_data(ttl=300)  # Reduced TTL for faster updates
+def load_device_firmware(key, org_id):
+    """Load device firmware information with minimal API calls"""
+    try:
+        log.debug("ULTRA-FAST firmware loading...")
+        start_time = datetime.now()
+        
+        api = init_api(key)
+        if not api:
+            return {}
+        
+        # Get firmware information for all devices
+        firmware_info = api.organizations.getOrganizationFirmwareUpgrades(org_id)
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        observe_loader("load_device_firmware", duration)
+        
+        return firmware_info
+    except Exception as e:
+        log.error("Error loading firmware: %s", e)
+        if SHOW_DEBUG_INFO:
+            st.write(f"Could not load firmware info: {e}")
+        return {}
+
+# Load device performance metrics
+@traced_cache_data(ttl=300)
+def load_device_performance(key, org_id, device_serial):
+    """Uplink loss/latency samples of one device, sliced from the org-wide history"""
+    return [row for row in load_uplink_samples(key, org_id) if row["serial"] == device_serial]
+
+# Load uplink loss/latency of every appliance in the organization
+@traced_cache_data(ttl=60)
+def load_uplink_samples(key, org_id, window=UPLINK_HEALTH_WINDOW):
+    """Stored org-wide uplink loss/latency samples, refreshed with one API call per interval"""
+    try:
+        api = init_api(key)
+        if not api:
+            return []
+        return uplink_loss_latency_history(api, org_id, window)
+    except Exception as e:
+        log.error("Error loading uplink loss/latency: %s", e)
+        if SHOW_DEBUG_INFO:
+            st.write(f"Could not load uplink loss/latency: {e}")
+        return []
+
+# Per-uplink loss/latency percentiles
+def uplink_percentiles(samples):
+    """
+    One row per (networkId, serial, uplink) with the sample count and the median and 95th
+    percentile of loss and latency, worst 95th-percentile loss first
+    """
+    columns = ["networkId", "serial", "uplink", "samples", "lossP50", "lossP95", "latencyP50", "latencyP95"]
+    if not samples:
+        return pd.DataFrame(columns=columns)
+    df = pd.DataFrame.from_records(samples, columns=["networkId", "serial", "uplink", "lossPercent", "latencyMs"])
+    grouped = df.groupby(["networkId", "serial", "uplink"], sort=False)[["lossPercent", "latencyMs"]]
+    quantiles = grouped.quantile([0.5, 0.95]).unstack()
+    quantiles.columns = ["lossP50", "lossP95", "latencyP50", "latencyP95"]
+    quantiles.insert(0, "samples", grouped.size())
+    return quantiles.reset_index().sort_values(["lossP95", "latencyP95"], ascending=False, ignore_index=True)[columns]
+
+# WAN health of the organization
+@traced_cache_data(ttl=60)
+def load_uplink_health(key, org_id, window=UPLINK_HEALTH_WINDOW):
+    """Per-uplink loss/latency percentiles over the last `window` seconds"""
+    return uplink_percentiles(load_uplink_samples(key, org_id, window))
+
+# Load network traffic data - Using actual Meraki API endpoints
+@traced_cache_data(ttl=300)
+def load_traffic(key, network_id, timespan):
+    """Load network traffic data using actual Meraki API"""
+    try:
+        api = init_api(key)
+        if api:
+            # Summed from collected hourly snapshots once enough history exists
+            track_network(api, network_id)
+            stored = traffic_history(network_id, timespan, ("combined",))
+            if stored is not None:
+                return stored["combined"]
+            # Use the actual Meraki API endpoint for network traffic
+            return api.networks.getNetworkTraffic(network_id, timespan=timespan)
+        return []
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load traffic data: {e}")
+        return []
+
+# Load comprehensive traffic data from all device types
+@traced_cache_data(ttl=300)
+def load_comprehensive_traffic(key, network_id, timespan):
+    """Load traffic data from all device types and combine them"""
+    try:
+        api = init_api(key)
+        if not api:
+            return {}
+        
+        # Check if timespan exceeds Meraki API limits (30 days = 2592000 seconds)
+        max_timespan = 2592000  # 30 days in seconds
+        if timespan > max_timespan:
+            if SHOW_DEBUG_INFO:
+                st.warning(f"⚠️ 요청된 시간 범위({timespan/86400:.1f}일)가 Meraki API 최대 제한(30일)을 초과합니다. 30일로 제한합니다.")
+            timespan = max_timespan
+        
+        # Any timespan is a sum of collected hour/day/week buckets once enough history exists
+        track_network(api, network_id)
+        stored = traffic_history(network_id, timespan)
+        if stored is not None:
+            return stored
+        
+        device_types = ['combined', 'wireless', 'switch', 'appliance']
+        traffic_data = {}
+        
+        for device_type in device_types:
+            try:
+                # Get traffic data for each device type
+                data = api.networks.getNetworkTraffic(
+                    network_id, 
+                    timespan=timespan,
+                    deviceType=device_type
+                )
+                traffic_data[device_type] = data if data else []
+                
+                if SHOW_DEBUG_INFO:
+                    st.write(f"📊 {device_type.upper()}: {len(data) if data else 0} applications")
+                    
+            except Exception as e:
+                if SHOW_DEBUG_INFO:
+                    st.error(f"Failed to load {device_type} traffic: {e}")
+                traffic_data[device_type] = []
+        
+        # If no data from any device type, try alternative approach
+        if not any(traffic_data.values()):
+            if SHOW_DEBUG_INFO:
+                st.warning("⚠️ 모든 디바이스 타입에서 데이터를 가져올 수 없습니다. 대체 방법을 시도합니다.")
+            
+            # Try with shorter timespan for 30-day requests
+            if timespan >= 2592000:  # 30 days
+                shorter_timespan = 604800  # 7 days
+                if SHOW_DEBUG_INFO:
+                    st.info("🔄 7일 데이터로 재시도합니다...")
+                
+                for device_type in device_types:
+                    try:
+                        data = api.networks.getNetworkTraffic(
+                            network_id, 
+                            timespan=shorter_timespan,
+                            deviceType=device_type
+                        )
+                        traffic_data[device_type] = data if data else []
+                        
+                        if SHOW_DEBUG_INFO:
+                            st.write(f"📊 {device_type.upper()} (7일): {len(data) if data else 0} applications")
+                            
+                    except Exception as e:
+                        if SHOW_DEBUG_INFO:
+                            st.error(f"Failed to load {device_type} traffic (7일): {e}")
+                        traffic_data[device_type] = []
+        
+        return traffic_data
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load comprehensive traffic data: {e}")
+        return {}
+
+# Parallel traffic analysis data loading - Ultra-fast TTL
+@traced_cache_data(ttl=10, show_spinner="트래픽 데이터 로딩 중...")
+def load_traffic_analysis_data_parallel(key, network_ids, timespan, resolution):
+    """Load all traffic analysis data in parallel"""
+    try:
+        start_time = datetime.now()
+        
+        # Prepare API calls for all networks
+        api_calls = []
+        
+        for network_id in network_ids:
+            # Traffic data calls
+            api_calls.extend([
+                {
+                    'key': f'traffic_{network_id}',
+                    'func': load_comprehensive_traffic,
+                    'args': [key, network_id, timespan]
+                },
+                {
+                    'key': f'app_traffic_{network_id}',
+                    'func': load_app_traffic,
+                    'args': [key, network_id, timespan]
+                },
+                {
+                    'key': f'bandwidth_{network_id}',
+                    'func': load_net_bw,
+                    'args': [key, network_id, timespan]
+                },
+                {
+                    'key': f'wan_bandwidth_{network_id}',
+                    'func': load_wan_bandwidth,
+                    'args': [key, network_id, timespan, resolution]
+                },
+                {
+                    'key': f'limits_{network_id}',
+                    'func': load_limits,
+                    'args': [key, network_id]
+                }
+            ])
+        
+        # Execute all calls in parallel with maximum workers for speed
+        results = parallel_api_calls(api_calls, max_workers=100)
+        
+        # Organize results by network
+        organized_results = {}
+        for network_id in network_ids:
+            organized_results[network_id] = {
+                'traffic': results.get(f'traffic_{network_id}', {}),
+                'app_traffic': results.get(f'app_traffic_{network_id}', []),
+                'bandwidth': results.get(f'bandwidth_{network_id}', []),
+                'wan_bandwidth': results.get(f'wan_bandwidth_{network_id}', []),
+                'limits': results.get(f'limits_{network_id}', [])
+            }
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        observe_loader("load_traffic_analysis_data_parallel", duration)
+        
+        return {
+            'network_data': organized_results,
+            'load_time': duration
+        }
+        
+    except Exception as e:
+        log.error("Error in parallel traffic analysis loading: %s", e)
+        st.error(f"Failed to load traffic analysis data: {e}")
+        return {
+            'network_data': {},
+            'load_time': 0
+        }
+
+# Combine traffic data from all device types
+def combine_traffic_data(traffic_data):
+    """Combine traffic data from all device types into a single dataset"""
+    if not traffic_data:
+        return pd.DataFrame()
+
+    combined_data = []
+
+    for device_type, data in traffic_data.items():
+        if data:
+            for item in data:
+                # Add device type to each item
+                item_copy = item.copy()
+                item_copy['deviceType'] = device_type
+                combined_data.append(item_copy)
+
+    if not combined_data:
+        return pd.DataFrame()
+
+    try:
+        # Convert to DataFrame and aggregate by application
+        df = pd.DataFrame(combined_data)
+        
+        # Check if we have the required columns
+        required_columns = ['application', 'sent', 'recv', 'numClients']
+        if not all(col in df.columns for col in required_columns):
+            return pd.DataFrame()
+        
+        # Group by application and sum the values with error handling
+        agg_dict = {
+            'sent': 'sum',
+            'recv': 'sum', 
+            'numClients': 'sum'
+        }
+        
+        if 'activeTime' in df.columns:
+            agg_dict['activeTime'] = 'sum'
+        if 'flows' in df.columns:
+            agg_dict['flows'] = 'sum'
+        if 'deviceType' in df.columns:
+            agg_dict['deviceType'] = lambda x: ', '.join(sorted([str(v) for v in x.unique() if v is not None and str(v) != 'nan']))
+        if 'protocol' in df.columns:
+            agg_dict['protocol'] = lambda x: ', '.join(sorted([str(v) for v in x.unique() if v is not None and str(v) != 'nan']))
+        if 'port' in df.columns:
+            agg_dict['port'] = lambda x: ', '.join(map(str, sorted([v for v in x.unique() if v is not None and str(v) != 'nan'])))
+        if 'destination' in df.columns:
+            agg_dict['destination'] = lambda x: ', '.join(sorted([str(v) for v in x.unique() if v is not None and str(v) != 'nan']))
+        
+        aggregated = df.groupby('application').agg(agg_dict).reset_index()
+        
+        return aggregated
+        
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Error in combine_traffic_data: {e}")
+        return pd.DataFrame()
+
+# Aggregate application traffic across networks
+def aggregate_cross_network_traffic(traffic_by_network):
+    """
+    One application table over {network name: getNetworkTraffic rows}: the rows of every network
+    go into a single frame with the network as a categorical column and are grouped once
+    """
+    names = [name for name, rows in traffic_by_network.items() if rows]
+    if not names:
+        return pd.DataFrame()
+
+    df = pd.DataFrame.from_records([row for name in names for row in traffic_by_network[name]],
+                                   columns=["application", "sent", "recv", "numClients"])
+    df["Network"] = pd.Categorical.from_codes(
+        np.repeat(np.arange(len(names)), [len(traffic_by_network[name]) for name in names]), categories=names
+    )
+
+    aggregated = df.groupby("application", sort=False).agg(
+        sent=("sent", "sum"), recv=("recv", "sum"), numClients=("numClients", "max")
+    )
+    pairs = df.drop_duplicates(["application", "Network"])
+    members = pairs["Network"].astype(str).groupby(pairs["application"], sort=False)
+    aggregated["NetworkCount"] = members.size()
+    aggregated["Networks"] = members.agg(list)
+    aggregated["sent_MB"] = aggregated["sent"] / (1024 * 1024)
+    aggregated["recv_MB"] = aggregated["recv"] / (1024 * 1024)
+    aggregated["TotalMB"] = aggregated["sent_MB"] + aggregated["recv_MB"]
+    aggregated["TotalGB"] = aggregated["TotalMB"] / 1024
+    return aggregated.reset_index().sort_values("TotalMB", ascending=False, ignore_index=True)
+
+# Load network bandwidth usage history
+@traced_cache_data(ttl=300)
+def load_network_bandwidth(key, network_id, timespan):
+    """Load network bandwidth usage history"""
+    try:
+        api = init_api(key)
+        if api:
+            # Use network bandwidth usage history API (via the local store)
+            return client_bandwidth_history(api, network_id, timespan)
+        return []
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load bandwidth data: {e}")
+        return []
+
+# Load application traffic (separate function for app-specific analysis)
+@traced_cache_data(ttl=300)
+def load_app_traffic(key, network_id, timespan):
+    """Load application-specific traffic data"""
+    try:
+        api = init_api(key)
+        if api:
+            track_network(api, network_id)
+            stored = traffic_history(network_id, timespan, ("combined",))
+            if stored is not None:
+                return stored["combined"]
+            return api.networks.getNetworkTraffic(network_id, timespan=timespan)
+        return []
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load application traffic data: {e}")
+        return []
+
+# Load network clients with usage data
+@traced_cache_data(ttl=300)
+def load_network_clients(key, network_id):
+    """Load network clients with usage information - fetches all clients (up to 5000)"""
+    try:
+        api = init_api(key)
+        if api:
+            # Use perPage=5000 to get all clients instead of default 10
+            return api.networks.getNetworkClients(network_id, perPage=5000)
+        return []
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load network clients: {e}")
+        return []
+
+# Parallel client analysis data loading - Ultra-fast TTL
+@traced_cache_data(ttl=10, show_spinner="클라이언트 데이터 로딩 중...")
+def load_client_analysis_data_parallel(key, network_ids, timespan, resolution):
+    """Load all client analysis data in parallel"""
+    try:
+        start_time = datetime.now()
+        
+        # Prepare API calls for all networks
+        api_calls = []
+        
+        for network_id in network_ids:
+            # Client data calls
+            api_calls.extend([
+                {
+                    'key': f'clients_{network_id}',
+                    'func': load_network_clients,
+                    'args': [key, network_id]
+                },
+                {
+                    'key': f'clients_overview_{network_id}',
+                    'func': load_network_clients_overview,
+                    'args': [key, network_id]
+                },
+                {
+                    'key': f'bandwidth_{network_id}',
+                    'func': load_net_bw,
+                    'args': [key, network_id, timespan]
+                }
+            ])
+        
+        # Execute all calls in parallel with maximum workers for speed
+        results = parallel_api_calls(api_calls, max_workers=100)
+        
+        # Organize results by network
+        organized_results = {}
+        for network_id in network_ids:
+            organized_results[network_id] = {
+                'clients': results.get(f'clients_{network_id}', []),
+                'clients_overview': results.get(f'clients_overview_{network_id}', {}),
+                'bandwidth': results.get(f'bandwidth_{network_id}', [])
+            }
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        observe_loader("load_client_analysis_data_parallel", duration)
+        
+        return {
+            'network_data': organized_results,
+            'load_time': duration
+        }
+        
+    except Exception as e:
+        log.error("Error in parallel client analysis loading: %s", e)
+        st.error(f"Failed to load client analysis data: {e}")
+        return {
+            'network_data': {},
+            'load_time': 0
+        }
+
+# Load network clients overview for total count
+@traced_cache_data(ttl=300)
+def load_network_clients_overview(key, network_id):
+    """Load network clients overview for total count and summary"""
+    try:
+        api = init_api(key)
+        if api:
+            return api.networks.getNetworkClientsOverview(network_id)
+        return {}
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load network clients overview: {e}")
+        return {}
+
+# Load network bandwidth history
+@traced_cache_data(ttl=300)
+def load_net_bw(key, network_id, timespan):
+    try:
+        api = init_api(key)
+        if api:
+            # Stored history plus only the interval since the last refresh; the endpoint has no
+            # resolution parameter, so the chart downsamples the returned series instead
+            return client_bandwidth_history(api, network_id, timespan)
+        return []
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load bandwidth data: {e}")
+        return []
+
+# Load traffic shaping limits
+@traced_cache_data(ttl=300)
+def load_limits(key, network_id):
+    try:
+        api = init_api(key)
+        if api:
+            return api.networks.getNetworkApplianceTrafficShapingUplinkBandwidth(network_id)
+        return []
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load traffic limits: {e}")
+        return []
+
+# Load switch port data
+@traced_cache_data(ttl=300)
+def load_switch_ports(key, org_id):
+    try:
+        dash = init_api(key)
+        if not dash:
+            return {}
+        
+        devices = dash.organizations.getOrganizationDevices(org_id)
+        switches = [d for d in devices if d.get("productType") == "switch"]
+        out = {}
+        
+        for sw in switches:
+            try:
+                ports = dash.switch.getDeviceSwitchPorts(sw["serial"])
+                statuses = dash.switch.getDeviceSwitchPortsStatuses(sw["serial"])
+                combined = []
+                
+                for p in ports:
+                    sid = p["portId"]
+                    info = next((s for s in statuses if s["portId"] == sid), {})
+                    combined.append({**p, **info})
+                
+                out[sw["name"]] = combined
+            except Exception as e:
+                if SHOW_DEBUG_INFO:
+                    st.warning(f"Failed to load ports for switch {sw['name']}: {e}")
+                continue
+                
+        return out
+    except Exception as e:
+        st.error(f"Failed to load switch ports: {e}")
+        return {}
+
+# Load WAN uplink bandwidth data
+@traced_cache_data(ttl=300)
+def load_wan_bandwidth(key, network_id, timespan, resolution):
+    try:
+        api = init_api(key)
+        if not api:
+            return []
+        
+        # Get WAN uplink usage per interface (stored history plus the interval since the last refresh)
+        resolution = plan_resolution("uplink_usage", timespan, resolution)
+        bandwidth_data = uplink_usage_history(api, network_id, timespan, resolution)
+        
+        if SHOW_DEBUG_INFO:
+            st.write("🔍 Debug: Bandwidth Data Structure")
+            st.write(f"Data entries: {len(bandwidth_data)}")
+            if bandwidth_data:
+                st.write(f"First entry structure: {list(bandwidth_data[0].keys())}")
+        
+        return bandwidth_data
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load WAN bandwidth data: {e}")
+        return []
+
+# Load device status events and alerts
+@traced_cache_data(ttl=300)
+def load_device_alerts(key, org_id, device_serial, timespan=86400):
+    """Load detailed alert information for a specific device"""
+    try:
+        api = init_api(key)
+        if not api:
+            return {}
+        
+        alerts = {}
+        
+        # Get device status events (last 24 hours by default)
+        try:
+            events = api.organizations.getOrganizationDevicesStatusesHistory(
+                organizationId=org_id,
+                serials=[device_serial],
+                timespan=timespan
+            )
+            if events:
+                alerts['status_events'] = events
+        except Exception as e:
+            if SHOW_DEBUG_INFO:
+                st.write(f"Could not load status events: {e}")
+        
+        # Uplink performance from the org-wide loss/latency history
+        performance = load_device_performance(key, org_id, device_serial)
+        if performance:
+            alerts['performance'] = performance
+        
+        # Get device security events (if available)
+        try:
+            security = api.organizations.getOrganizationDevicesSecurityEvents(
+                organizationId=org_id,
+                serials=[device_serial],
+            )
+            if security:
+                alerts['security'] = security
+        except Exception as e:
+            if SHOW_DEBUG_INFO:
+                st.write(f"Could not load security events: {e}")
+        
+        return alerts
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load device alerts: {e}")
+        return {}
+
+# Parallel device alerts data loading - Ultra-fast TTL
+@traced_cache_data(ttl=10, show_spinner="디바이스 알림 데이터 로딩 중...")
+def load_device_alerts_data_parallel(key, org_id, device_serials, timespan=86400):
+    """Load device alerts data for multiple devices in parallel"""
+    try:
+        start_time = datetime.now()
+        
+        # Prepare API calls for all devices
+        api_calls = []
+        
+        for device_serial in device_serials:
+            # Device-specific alert calls
+            api_calls.extend([
+                {
+                    'key': f'status_events_{device_serial}',
+                    'func': lambda api, org_id, serial, timespan: api.organizations.getOrganizationDevicesStatusesHistory(
+                        organizationId=org_id,
+                        serials=[serial],
+                        timespan=timespan
+                    ),
+                    'args': [key, org_id, device_serial, timespan]
+                },
+                {
+                    'key': f'security_{device_serial}',
+                    'func': lambda api, org_id, serial: api.organizations.getOrganizationDevicesSecurityEvents(
+                        organizationId=org_id,
+                        serials=[serial]
+                    ),
+                    'args': [key, org_id, device_serial]
+                }
+            ])
+        
+        # Execute all calls in parallel with maximum workers for speed
+        results = parallel_api_calls(api_calls, max_workers=100)
+        
+        # Uplink performance of every device comes from one org-wide loss/latency history
+        performance = {}
+        for row in load_uplink_samples(key, org_id):
+            performance.setdefault(row['serial'], []).append(row)
+        
+        # Organize results by device
+        organized_results = {}
+        for device_serial in device_serials:
+            organized_results[device_serial] = {
+                'status_events': results.get(f'status_events_{device_serial}', []),
+                'performance': performance.get(device_serial, []),
+                'security': results.get(f'security_{device_serial}', [])
+            }
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        observe_loader("load_device_alerts_data_parallel", duration)
+        
+        return {
+            'device_data': organized_results,
+            'load_time': duration
+        }
+        
+    except Exception as e:
+        log.error("Error in parallel device alerts loading: %s", e)
+        st.error(f"Failed to load device alerts data: {e}")
+        return {
+            'device_data': {},
+            'load_time': 0
+        }
+
+# Load organization configuration changes
+@traced_cache_data(ttl=300)
+def load_configuration_changes(key, org_id, per_page=100):
+    """Load organization configuration changes"""
+    try:
+        api = init_api(key)
+        if not api:
+            return {}
+        
+        # Get configuration changes
+        try:
+            changes = api.organizations.getOrganizationConfigurationChanges(
+                organizationId=org_id,
+                perPage=per_page
+            )
+            return changes
+        except Exception as e:
+            if SHOW_DEBUG_INFO:
+                st.write(f"Could not load configuration changes: {e}")
+            return {}
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load configuration changes: {e}")
+        return {}
+
+# Load organization license overview - Enhanced with better error handling
+@traced_cache_data(ttl=60)  # Reduced TTL for faster updates
+def load_license_overview(key, org_id):
+    """Load organization license overview with enhanced error handling"""
+    try:
+        log.debug("Loading license overview for org %s", org_id)
+        
+        api = init_api(key)
+        if not api:
+            log.warning("Failed to initialize API")
+            return {}
+        
+        # Try multiple API endpoints for license information
+        license_data = {}
+        
+        # Method 1: Try getOrganizationLicensesOverview
+        try:
+            log.debug("Trying getOrganizationLicensesOverview...")
+            overview = api.organizations.getOrganizationLicensesOverview(organizationId=org_id)
+            if overview:
+                license_data.update(overview)
+                log.debug("getOrganizationLicensesOverview successful")
+            else:
+                log.warning("getOrganizationLicensesOverview returned empty")
+        except Exception as e:
+            log.warning("getOrganizationLicensesOverview failed: %s", e)
+        
+        # Method 2: Try getOrganizationLicensingCotermLicenses
+        try:
+            log.debug("Trying getOrganizationLicensingCotermLicenses...")
+            coterm_licenses = api.organizations.getOrganizationLicensingCotermLicenses(organizationId=org_id)
+            if coterm_licenses:
+                license_data['coterm_licenses'] = coterm_licenses
+                log.debug("getOrganizationLicensingCotermLicenses successful")
+            else:
+                log.warning("getOrganizationLicensingCotermLicenses returned empty")
+        except Exception as e:
+            log.warning("getOrganizationLicensingCotermLicenses failed: %s", e)
+        
+        # Method 3: Try getOrganizationLicensingCotermLicensesOverview
+        try:
+            log.debug("Trying getOrganizationLicensingCotermLicensesOverview...")
+            coterm_overview = api.organizations.getOrganizationLicensingCotermLicensesOverview(organizationId=org_id)
+            if coterm_overview:
+                license_data.update(coterm_overview)
+                log.debug("getOrganizationLicensingCotermLicensesOverview successful")
+            else:
+                log.warning("getOrganizationLicensingCotermLicensesOverview returned empty")
+        except Exception as e:
+            log.warning("getOrganizationLicensingCotermLicensesOverview failed: %s", e)
+        
+        log.debug("License overview loaded: %s fields", len(license_data))
+        
+        return license_data
+        
+    except Exception as e:
+        log.error("Error in load_license_overview: %s", e)
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load license overview: {e}")
+        return {}
+
+
+# Helper function to parse date format
+def parse_date(date_string):
+    """Parse ISO 8601 date string and return readable format"""
+    if not date_string or date_string == 'N/A':
+        return 'N/A'
+    
+    try:
+        from datetime import datetime
+        # Parse ISO 8601 format (2016-01-07T20:35:14Z)
+        if 'T' in date_string and date_string.endswith('Z'):
+            # Remove Z and parse
+            date_string = date_string[:-1]
+            dt = datetime.fromisoformat(date_string)
+            # Return formatted date (YYYY-MM-DD HH:MM:SS)
+            return dt.strftime('%Y-%m-%d %H:%M:%S')
+        else:
+            return date_string
+    except Exception:
+        return date_string
+
+# Load organization detailed licenses
+@traced_cache_data(ttl=300)
+def load_detailed_licenses(key, org_id, per_page=100):
+    """Load organization detailed license information"""
+    try:
+        api = init_api(key)
+        if not api:
+            return []
+        
+        # Get detailed licenses using direct HTTP request
+        try:
+            import requests
+            
+            # API endpoint and headers
+            url = f"{MERAKI_BASE_URL}/organizations/{org_id}/licensing/coterm/licenses"
+            headers = {
+                'X-Cisco-Meraki-API-Key': key,
+                'Accept': 'application/json'
+            }
+            params = {
+                'perPage': per_page
+            }
+            
+            # Make HTTP request
+            response = requests.get(url, headers=headers, params=params)
+            
+            if response.status_code == 200:
+                licenses = response.json()
+                log.debug("Coterm licenses for org %s: HTTP 200, %d entries", org_id, len(licenses) if licenses else 0)
+                return licenses
+            else:
+                log.warning("Coterm licenses for org %s: HTTP %s", org_id, response.status_code)
+                return []
+                
+        except Exception as e:
+            log.warning("Coterm licenses for org %s failed: %s", org_id, e, exc_info=log.isEnabledFor(logging.DEBUG))
+            
+            if SHOW_DEBUG_INFO:
+                import traceback
+                st.write(f"Could not load detailed licenses: {e}")
+                st.write(f"Error type: {type(e)}")
+                st.write(f"Traceback: {traceback.format_exc()}")
+            return []
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load detailed licenses: {e}")
+        return []
+
+# Load network-wide alerts
+@traced_cache_data(ttl=300)
+def load_network_alerts(key, network_id, timespan=86400):
+    """Load network-wide alerts and events"""
+    try:
+        api = init_api(key)
+        if not api:
+            return {}
+        
+        alerts = {}
+        
+        # Get network events
+        try:
+            events = api.networks.getNetworkEvents(
+                networkId=network_id,
+                timespan=timespan,
+                eventTypes=['alert', 'warning', 'error']
+            )
+            if events:
+                alerts['network_events'] = events
+        except Exception as e:
+            if SHOW_DEBUG_INFO:
+                st.write(f"Could not load network events: {e}")
+        
+        # Get network health alerts
+        try:
+            health = api.networks.getNetworkHealthAlerts(networkId=network_id)
+            if health:
+                alerts['health_alerts'] = health
+        except Exception as e:
+            if SHOW_DEBUG_INFO:
+                st.write(f"Could not load health alerts: {e}")
+        
+        return alerts
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load network alerts: {e}")
+        return {}
+
+# Load all network clients
+@traced_cache_data(ttl=300)
+def get_all_network_clients(key, network_id):
+    """Load all network clients with perPage=5000 to get complete list"""
+    try:
+        api = init_api(key)
+        if api:
+            # Use perPage=5000 to get all clients instead of default 10
+            return api.networks.getNetworkClients(network_id, perPage=5000)
+        return []
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load network clients: {e}")
+        return []
+
+# Load client usage histories for all clients
+@traced_cache_data(ttl=300)
+def get_clients_usage_histories(key, network_id, timespan, resolution):
+    try:
+        api = init_api(key)
+        if not api:
+            return []
+        
+        # Get all clients first
+        clients = get_all_network_clients(key, network_id)
+        if not clients:
+            return []
+        
+        # Extract MAC addresses
+        mac_addresses = [client['mac'] for client in clients if 'mac' in client]
+        
+        if not mac_addresses:
+            return []
+        
+        # Process in chunks of 50 (Meraki API limit)
+        chunk_size = 50
+        all_results = []
+        
+        for i in range(0, len(mac_addresses), chunk_size):
+            chunk = mac_addresses[i:i + chunk_size]
+            try:
+                chunk_results = api.networks.getNetworkClientsBandwidthUsageHistory(
+                    network_id, 
+                    timespan=timespan, 
+                    resolution=resolution,
+                    macs=chunk
+                )
+                all_results.extend(chunk_results)
+            except Exception as e:
+                if SHOW_DEBUG_INFO:
+                    st.warning(f"Failed to load bandwidth history for chunk {i//chunk_size + 1}: {e}")
+                continue
+        
+        return all_results
+    except Exception as e:
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load client usage histories: {e}")
+        return []
+
+# Refresh the local event store before an event log export
+def refresh_device_events(key, network_id, product_type=None, since=None):
+    """
+    Bring the stored events of a network's product type up to date back to `since`; False if
+    the refresh failed. Exports read a device's events from the store either way, newest first.
+    """
+    try:
+        api = init_api(key)
+        if not api:
+            log.warning("API 초기화 실패 - network_id: %s", network_id)
+            return False
+        
+        # Only events newer than the stream's cursor (and any older part not stored yet) are fetched
+        ingest(api, network_id, product_type, since=since)
+        return True
+    except Exception as e:
+        log.warning("getNetworkEvents failed for network %s: %s: %s", network_id, type(e).__name__, e)
+        if SHOW_DEBUG_INFO:
+            st.error(f"Failed to load events for {network_id}: {e}")
+        return False
+
+# Event log download of one device
+def export_device_events(key, network_id, device_serial, product_type=None, timespan=86400, fmt="txt", compress=False):
+    """File object with the device's event log in `fmt`, streamed from the event store"""
+    since = time.time() - timespan
+    refresh_device_events(key, network_id, product_type, since)
+    return export_file(event_log_chunks(iter_device_events(device_serial, since), device_serial, fmt), compress)
+
+# Event log download of several devices
+def export_event_bundle(key, devices, timespan=86400, fmt="txt"):
+    """ZIP with one event log per device; each (network, product type) stream is refreshed once"""
+    since = time.time() - timespan
+    for network_id, product_type in {(d.get("networkId"), d.get("productType")) for d in devices}:
+        refresh_device_events(key, network_id, product_type, since)
+    return export_bundle(
+        (export_filename(f"{d.get('name') or d['serial']}_{d['serial']}_events", fmt),
+         event_log_chunks(iter_device_events(d["serial"], since), d["serial"], fmt))
+        for d in devices if d.get("serial")
+    )
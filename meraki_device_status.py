@@ -0,0 +1,202 @@
+# Meraki Device Status Overlay
+# Keeps webhook-driven status changes on top of the cached device snapshot
+import os
+import sqlite3
+import threading
+import time
+
+from meraki_webhook_history import WEBHOOK_HISTORY_DB
+
+# Webhook alert types that tell us a device changed state.
+# Meraki uses per-product alertTypeIds for the same "went down / came up" event.
+DEVICE_DOWN_ALERT_TYPES = {
+    "stopped_reporting",          # Access points went down
+    "appliances_went_down",
+    "switches_went_down",
+    "cellular_gateways_went_down",
+    "cameras_went_down",
+    "sensors_went_down",
+}
+
+DEVICE_UP_ALERT_TYPES = {
+    "started_reporting",          # Access points came up
+    "appliances_came_up",
+    "switches_came_up",
+    "cellular_gateways_came_up",
+    "cameras_came_up",
+    "sensors_came_up",
+}
+
+# Alert types after which the whole org snapshot should be refetched
+CONFIG_CHANGE_ALERT_TYPES = {
+    "settings_changed",
+}
+
+# Patches and invalidations are written by whichever process receives the webhook (the
+# receiver runs separately from Streamlit) and read by the dashboard, so they live in the
+# webhook history database rather than in module globals. Snapshot times are per process:
+# they describe the cached device lists this process serves.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS status_patches (
+    org_id TEXT NOT NULL,
+    serial TEXT NOT NULL,
+    status TEXT NOT NULL,
+    received_at REAL NOT NULL,
+    occurred_at TEXT,
+    alert_type TEXT,
+    PRIMARY KEY (org_id, serial)
+);
+
+CREATE TABLE IF NOT EXISTS invalidated_orgs (
+    org_id TEXT PRIMARY KEY,
+    received_at REAL NOT NULL
+);
+"""
+
+_lock = threading.Lock()
+_conn = None
+_snapshot_times = {}     # (org_id, source) -> time.time() the snapshot's fetch started
+
+
+def _connection():
+    global _conn
+    if _conn is None:
+        directory = os.path.dirname(WEBHOOK_HISTORY_DB)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _conn = sqlite3.connect(WEBHOOK_HISTORY_DB, timeout=30, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.executescript(_SCHEMA)
+    return _conn
+
+
+def classify_alert(webhook_data):
+    """
+    Map a webhook payload to 'down', 'up', 'config' or None
+    """
+    alert_type_id = webhook_data.get("alertTypeId") or ""
+    if alert_type_id in DEVICE_DOWN_ALERT_TYPES:
+        return "down"
+    if alert_type_id in DEVICE_UP_ALERT_TYPES:
+        return "up"
+    if alert_type_id in CONFIG_CHANGE_ALERT_TYPES:
+        return "config"
+
+    # Fall back to the human readable alert type for ids we don't know yet
+    alert_type = (webhook_data.get("alertType") or "").lower()
+    if "went down" in alert_type or "stopped reporting" in alert_type:
+        return "down"
+    if "came up" in alert_type or "started reporting" in alert_type:
+        return "up"
+    if "settings changed" in alert_type:
+        return "config"
+    return None
+
+
+def record_snapshot(org_id, fetched_at=None, source="devices"):
+    """
+    Mark a fresh device snapshot for an organization.
+    Patches received before the fetch started are already reflected in the snapshot; they are
+    dropped once every snapshot this process serves for the org is newer than them.
+    """
+    fetched_at = fetched_at or time.time()
+    with _lock:
+        _snapshot_times[(org_id, source)] = fetched_at
+        oldest = min(t for (org, _), t in _snapshot_times.items() if org == org_id)
+        conn = _connection()
+        with conn:
+            conn.execute("DELETE FROM status_patches WHERE org_id = ? AND received_at <= ?", (org_id, oldest))
+            conn.execute("DELETE FROM invalidated_orgs WHERE org_id = ? AND received_at <= ?", (org_id, fetched_at))
+
+
+def snapshot_time(org_id, source="devices"):
+    """
+    When the fetch of the org's last `source` snapshot started in this process, or None
+    """
+    with _lock:
+        return _snapshot_times.get((org_id, source))
+
+
+def apply_webhook_event(webhook_data):
+    """
+    Record the effect of a webhook on the device snapshot.
+    Returns the classification ('down', 'up', 'config') or None if the event is not relevant.
+    """
+    kind = classify_alert(webhook_data)
+    if kind is None:
+        return None
+
+    org_id = webhook_data.get("organizationId")
+    if not org_id:
+        return None
+
+    if kind == "config":
+        with _lock:
+            conn = _connection()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO invalidated_orgs VALUES (?, ?)", (org_id, time.time()))
+        return kind
+
+    serial = webhook_data.get("deviceSerial")
+    if not serial:
+        return None
+
+    with _lock:
+        conn = _connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO status_patches VALUES (?, ?, ?, ?, ?, ?)",
+                (org_id, serial, "offline" if kind == "down" else "online", time.time(),
+                 webhook_data.get("occurredAt"), webhook_data.get("alertType"))
+            )
+    return kind
+
+
+def status_patches(org_id, since=None):
+    """
+    Pending webhook patches for an organization received after `since`: serial -> patch
+    """
+    with _lock:
+        rows = _connection().execute(
+            "SELECT serial, status, received_at, occurred_at, alert_type FROM status_patches "
+            "WHERE org_id = ? AND received_at > ?",
+            (org_id, since or 0)
+        ).fetchall()
+    return {
+        serial: {"status": status, "received_at": received_at, "occurredAt": occurred_at, "alertType": alert_type}
+        for serial, status, received_at, occurred_at, alert_type in rows
+    }
+
+
+def apply_status_patches(org_id, devices, source="devices"):
+    """
+    Return the device list with webhook patches applied.
+    Only patches newer than the `source` snapshot are used, and only patched entries are
+    copied; the cached list itself is never mutated.
+    """
+    if not devices:
+        return devices
+    patches = status_patches(org_id, snapshot_time(org_id, source))
+    if not patches:
+        return devices
+
+    patched = []
+    for device in devices:
+        patch = patches.get(device.get("serial"))
+        if patch and device.get("status") != patch["status"]:
+            device = {**device, "status": patch["status"], "statusSource": "webhook"}
+            if patch.get("occurredAt"):
+                device["lastReportedAt"] = patch["occurredAt"]
+        patched.append(device)
+    return patched
+
+
+def consume_invalidation(org_id):
+    """
+    Return True once if a config change webhook asked for this org's snapshot to be refetched
+    """
+    with _lock:
+        conn = _connection()
+        with conn:
+            return conn.execute("DELETE FROM invalidated_orgs WHERE org_id = ?", (org_id,)).rowcount > 0
@@ -0,0 +1,66 @@
+# Chart downsampling
+# A month of 5-minute buckets is 8,640 points per line, far more than a chart is wide. Series are
+# reduced on the server before they reach Plotly so each chart ships at most CHART_POINT_BUDGET
+# points whatever the range. Largest-Triangle-Three-Buckets (LTTB) keeps the peaks and dips that
+# plain striding or averaging would drop.
+from meraki_lazy import lazy_import
+
+np = lazy_import("numpy")
+
+try:
+    from config import CHART_POINT_BUDGET
+except ImportError:
+    CHART_POINT_BUDGET = 1000   # points per chart, about one per horizontal pixel
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Positions of the `threshold` points LTTB keeps from (x, y), first and last included
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # threshold - 2 buckets between the fixed first and last points
+    bounds = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.intp) + 1
+    bounds[-1] = n - 1
+    sizes = np.diff(bounds)
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    mean_x = (cum_x[bounds[1:]] - cum_x[bounds[:-1]]) / sizes
+    mean_y = (cum_y[bounds[1:]] - cum_y[bounds[:-1]]) / sizes
+    # Each bucket is scored against the average of the next one (the last point for the last bucket)
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        area = np.abs((x[a] - next_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample(df, x, columns, budget=None):
+    """
+    Rows of df (sorted by x) kept for charting `columns` against x within `budget` points.
+    Each column gets an equal share of the budget, so a peak in any one line survives.
+    """
+    budget = budget or CHART_POINT_BUDGET
+    if len(df) <= budget or not columns:
+        return df
+    xs = df[x]
+    if xs.dtype.kind == "M":
+        xs = xs.to_numpy(dtype="datetime64[ns]").astype("int64").astype(float)
+    else:
+        xs = xs.to_numpy(dtype=float)
+    share = max(3, budget // len(columns))
+    keep = np.unique(np.concatenate([
+        lttb_indices(xs, df[column].fillna(0).to_numpy(dtype=float), share) for column in columns
+    ]))
+    return df.iloc[keep]
@@ -0,0 +1,206 @@
+# Network event store
+# "📄 로그 생성" called getNetworkEvents for one device at a time (up to 1,000 events, refetching
+# the whole network when the device filter came back empty), so every click was a fresh download
+# and a device's log depended on what fit in one page. Events are now ingested per
+# (network, productType) and kept locally, indexed by device serial and time:
+#   - the first ingest of a stream starts at the beginning of the requested range
+#   - later ingests page forward from the stored cursor (startingAfter = newest event stored)
+#   - a range reaching further back than what is stored is filled backwards (endingBefore)
+# A device log for any range is then one indexed query.
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from meraki_logging import get_logger
+from meraki_timeseries import TIMESERIES_DB, TIMESERIES_RETENTION_DAYS, format_ts, parse_ts
+
+log = get_logger("data")
+
+EVENT_REFRESH = 60       # seconds a stream is served from the store before its tail is fetched again
+EVENTS_PER_PAGE = 1000   # getNetworkEvents maximum
+MAX_PAGES = 20           # pages per direction per ingest; a longer backlog continues on the next one
+COMPACTION_INTERVAL = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS network_events (
+    network_id TEXT NOT NULL,
+    product_type TEXT NOT NULL,
+    ts REAL NOT NULL,
+    serial TEXT NOT NULL,
+    event TEXT NOT NULL,
+    PRIMARY KEY (network_id, product_type, ts, event)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS network_events_serial ON network_events (serial, ts);
+
+CREATE TABLE IF NOT EXISTS event_streams (
+    network_id TEXT NOT NULL,
+    product_type TEXT NOT NULL,
+    oldest REAL NOT NULL,
+    cursor TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (network_id, product_type)
+);
+"""
+
+_lock = threading.Lock()
+_conn = None
+_last_compaction = 0.0
+_stats = {"ingests": 0, "api_calls": 0, "events_fetched": 0, "queries": 0}
+
+
+def _connection():
+    global _conn
+    if _conn is None:
+        directory = os.path.dirname(TIMESERIES_DB)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _conn = sqlite3.connect(TIMESERIES_DB, timeout=30, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.executescript(_SCHEMA)
+    return _conn
+
+
+def _fetch_page(api, network_id, product_type, **cursor):
+    # One page of getNetworkEvents, oldest first
+    params = {"perPage": EVENTS_PER_PAGE, **cursor}
+    if product_type:
+        params["productType"] = product_type
+    page = api.networks.getNetworkEvents(network_id, total_pages=1, **params)
+    events = page.get("events", []) if isinstance(page, dict) else page or []
+    _stats["api_calls"] += 1
+    return sorted((e for e in events if isinstance(e, dict) and e.get("occurredAt")), key=lambda e: e["occurredAt"])
+
+
+def _store(network_id, product_type, events):
+    with _lock:
+        conn = _connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO network_events VALUES (?, ?, ?, ?, ?)",
+                [(network_id, product_type, parse_ts(e["occurredAt"]), e.get("deviceSerial") or "",
+                  json.dumps(e, sort_keys=True, ensure_ascii=False)) for e in events]
+            )
+    _stats["events_fetched"] += len(events)
+
+
+def _save_stream(network_id, product_type, oldest, cursor, synced_at):
+    with _lock:
+        conn = _connection()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO event_streams VALUES (?, ?, ?, ?, ?)",
+                         (network_id, product_type, oldest, cursor, synced_at))
+
+
+def ingest(api, network_id, product_type=None, since=None, now=None):
+    """
+    Bring the stored events of one (network, productType) stream up to date and make sure they
+    reach back to `since`. Returns the number of events fetched.
+    """
+    product_type = product_type or ""
+    now = now or time.time()
+    since = since if since is not None else now - 86400
+    with _lock:
+        stream = _connection().execute(
+            "SELECT oldest, cursor, synced_at FROM event_streams WHERE network_id = ? AND product_type = ?",
+            (network_id, product_type)
+        ).fetchone()
+    _stats["ingests"] += 1
+    if stream is None:
+        oldest, cursor, synced_at = since, format_ts(since), 0.0
+    else:
+        oldest, cursor, synced_at = stream
+    fetched = 0
+
+    # Older than anything stored: page backwards from the oldest stored event
+    if since < oldest:
+        before = format_ts(oldest)
+        for _ in range(MAX_PAGES):
+            events = _fetch_page(api, network_id, product_type, endingBefore=before)
+            _store(network_id, product_type, events)
+            fetched += len(events)
+            if len(events) < EVENTS_PER_PAGE:
+                oldest = since
+                break
+            before = events[0]["occurredAt"]
+            oldest = parse_ts(before)
+            if oldest <= since:
+                break
+        _save_stream(network_id, product_type, oldest, cursor, synced_at)
+
+    # New events since the cursor
+    if now - synced_at >= EVENT_REFRESH:
+        for _ in range(MAX_PAGES):
+            events = _fetch_page(api, network_id, product_type, startingAfter=cursor)
+            _store(network_id, product_type, events)
+            fetched += len(events)
+            if events:
+                cursor = events[-1]["occurredAt"]
+            if len(events) < EVENTS_PER_PAGE:
+                break
+        _save_stream(network_id, product_type, oldest, cursor, now)
+    if fetched:
+        log.debug("Ingested %d events of %s (%s)", fetched, network_id, product_type or "all")
+    if now - _last_compaction >= COMPACTION_INTERVAL:
+        compact(now)
+    return fetched
+
+
+def device_events(serial, start=None, end=None):
+    """
+    Stored events of one device between `start` and `end` (epoch seconds), newest first
+    """
+    with _lock:
+        cursor = _connection().execute(
+            "SELECT event FROM network_events WHERE serial = ? AND ts >= ? AND ts <= ? ORDER BY ts DESC",
+            (serial, start if start is not None else 0, end if end is not None else float("inf"))
+        )
+        _stats["queries"] += 1
+        return [json.loads(event) for event, in cursor.fetchall()]
+
+
+def iter_device_events(serial, start=None, end=None, batch=1000):
+    """
+    device_events() as an iterator that reads `batch` events at a time, for exports that should
+    not hold a device's whole history in memory
+    """
+    last = (end if end is not None else float("inf"), "\uffff")
+    while True:
+        with _lock:
+            rows = _connection().execute(
+                "SELECT ts, event FROM network_events WHERE serial = ? AND ts >= ? "
+                "AND (ts < ? OR (ts = ? AND event < ?)) ORDER BY ts DESC, event DESC LIMIT ?",
+                (serial, start if start is not None else 0, last[0], last[0], last[1], batch)
+            ).fetchall()
+        for _, event in rows:
+            yield json.loads(event)
+        if len(rows) < batch:
+            return
+        last = rows[-1]
+
+
+def compact(now=None):
+    """
+    Drop events (and move stream starts) past the time-series retention. Returns events deleted.
+    """
+    global _last_compaction
+    now = now or time.time()
+    cutoff = now - TIMESERIES_RETENTION_DAYS * 86400
+    with _lock:
+        conn = _connection()
+        with conn:
+            deleted = conn.execute("DELETE FROM network_events WHERE ts < ?", (cutoff,)).rowcount
+            conn.execute("UPDATE event_streams SET oldest = ? WHERE oldest < ?", (cutoff, cutoff))
+        _last_compaction = now
+    return deleted
+
+
+def get_event_stats():
+    """
+    Ingest/API call/event counters since startup, for diagnostics
+    """
+    with _lock:
+        return dict(_stats)
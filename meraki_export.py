@@ -0,0 +1,121 @@
+# Event log export
+# Event logs used to be built with repeated `+=` (quadratic in the number of events) and parked in
+# st.session_state until the download button served them. Exports are now written from an event
+# iterator in chunks of EXPORT_CHUNK_EVENTS straight into one buffer, optionally gzip-compressed,
+# and st.download_button generates them only when it is clicked (the buffer is the only copy
+# besides the one Streamlit serves).
+import csv
+import gzip
+import io
+import json
+import zipfile
+from datetime import datetime
+from itertools import chain, islice
+
+EXPORT_CHUNK_EVENTS = 500
+
+# format -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "txt": ("txt", "text/plain"),
+    "csv": ("csv", "text/csv"),
+    "jsonl": ("jsonl", "application/x-ndjson"),
+}
+
+CSV_FIELDS = ["occurredAt", "type", "category", "description", "deviceSerial", "deviceName",
+              "productType", "clientId", "clientDescription", "eventData"]
+
+
+def _chunks(pieces, size=EXPORT_CHUNK_EVENTS):
+    # Join consecutive pieces `size` at a time (one join per chunk instead of one copy per piece)
+    pieces = iter(pieces)
+    while True:
+        chunk = "".join(islice(pieces, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _text_blocks(events, device_serial):
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    events = iter(events)
+    first = next(events, None)
+    if first is None:
+        yield (f"No events found for device {device_serial}\nGenerated on: {generated}\n" + "=" * 80 + "\n\n"
+               "No event data available.")
+        return
+    yield f"Event Log for Device: {device_serial}\nGenerated on: {generated}\n" + "=" * 80 + "\n\n"
+    for i, event in enumerate(chain([first], events), 1):
+        if not isinstance(event, dict):
+            yield f"Event {i}: Invalid event data format\n" + "-" * 40 + "\n"
+            continue
+        yield (f"Event {i}:\n"
+               f"Timestamp: {event.get('occurredAt', 'N/A')}\n"
+               f"Type: {event.get('type', 'N/A')}\n"
+               f"Category: {event.get('category', 'N/A')}\n"
+               f"Description: {event.get('description', 'N/A')}\n" + "-" * 40 + "\n")
+
+
+def _csv_chunks(events):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    events = (e for e in events if isinstance(e, dict))
+    while True:
+        batch = list(islice(events, EXPORT_CHUNK_EVENTS))
+        writer.writerows([
+            [json.dumps(e.get(field), ensure_ascii=False) if field == "eventData" else e.get(field) for field in CSV_FIELDS]
+            for e in batch
+        ])
+        yield buffer.getvalue()
+        if len(batch) < EXPORT_CHUNK_EVENTS:
+            return
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def event_log_chunks(events, device_serial, fmt="txt"):
+    """
+    The event log of one device in `fmt` (see EXPORT_FORMATS) as an iterator of text chunks
+    """
+    if fmt == "csv":
+        return _csv_chunks(events)
+    if fmt == "jsonl":
+        return _chunks(json.dumps(e, ensure_ascii=False) + "\n" for e in events if isinstance(e, dict))
+    return _chunks(_text_blocks(events, device_serial))
+
+
+def export_filename(name, fmt="txt", compress=False):
+    """File name of an export: name.<ext>[.gz]"""
+    return f"{name}.{EXPORT_FORMATS[fmt][0]}" + (".gz" if compress else "")
+
+
+def export_mime(fmt="txt", compress=False):
+    return "application/gzip" if compress else EXPORT_FORMATS[fmt][1]
+
+
+def export_file(chunks, compress=False):
+    """
+    Write text chunks (UTF-8, optionally gzip) to a buffer rewound for reading
+    """
+    buffer = io.BytesIO()
+    target = gzip.GzipFile(fileobj=buffer, mode="wb") if compress else buffer
+    for chunk in chunks:
+        target.write(chunk.encode("utf-8"))
+    if compress:
+        target.close()
+    buffer.seek(0)
+    return buffer
+
+
+def export_bundle(files):
+    """
+    ZIP (deflated) of (file name, text chunks) pairs, each member streamed in as it is generated
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as bundle:
+        for name, chunks in files:
+            with bundle.open(name, "w") as member:
+                for chunk in chunks:
+                    member.write(chunk.encode("utf-8"))
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,65 @@
+# Meraki Dashboard Deferred Imports
+# plotly, pandas and the meraki SDK together cost close to a second to import, and the
+# login page needs none of them. lazy_import() returns a stand-in module that performs
+# the real import on first attribute access, so e.g. plotly loads only when a page
+# actually builds a chart. Each deferred import's cost is recorded for profiling.
+import importlib
+import sys
+import threading
+import time
+import types
+
+_lock = threading.Lock()
+_timings = {}   # module name -> seconds spent in the deferred import
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module placeholder that imports `name` on first attribute access
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self):
+        target = self.__dict__["_lazy_target"]
+        if target is None:
+            with _lock:
+                target = self.__dict__["_lazy_target"]
+                if target is None:
+                    already_loaded = self.__name__ in sys.modules
+                    start = time.perf_counter()
+                    target = importlib.import_module(self.__name__)
+                    if not already_loaded:
+                        _timings[self.__name__] = time.perf_counter() - start
+                    self.__dict__["_lazy_target"] = target
+        return target
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "deferred"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name):
+    """
+    Return `name` if it is already imported, otherwise a LazyModule for it
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def import_timings():
+    """
+    Seconds spent in each deferred import that has happened in this process
+    """
+    with _lock:
+        return dict(_timings)
@@ -0,0 +1,116 @@
+# Meraki Dashboard Logging
+# Leveled, rate-limited logging for the dashboard and its helper modules.
+# Messages use %-style arguments so nothing is formatted unless the level is enabled;
+# per-rerun diagnostics are DEBUG, so the default level costs one level check per call.
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+
+try:
+    from config import LOG_LEVEL
+except ImportError:
+    LOG_LEVEL = "WARNING"
+
+try:
+    from config import LOG_FILE
+except ImportError:
+    LOG_FILE = None
+
+try:
+    from config import LOG_MAX_SIZE, LOG_BACKUP_COUNT
+except ImportError:
+    LOG_MAX_SIZE = 10485760
+    LOG_BACKUP_COUNT = 5
+
+try:
+    from config import LOG_RATE_LIMIT
+except ImportError:
+    LOG_RATE_LIMIT = 20  # Records per message template per LOG_RATE_WINDOW
+
+LOG_RATE_WINDOW = 60
+
+LOG_LEVEL = os.environ.get("MERAKI_LOG_LEVEL", LOG_LEVEL)
+
+ROOT_LOGGER = "meraki_dashboard"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Pass at most `limit` records per (logger, level, message template) per `window` seconds.
+    The first record after a suppressed stretch reports how many were dropped.
+    """
+
+    def __init__(self, limit=LOG_RATE_LIMIT, window=LOG_RATE_WINDOW):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._buckets = {}   # key -> [window_start, passed, suppressed]
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if not self.limit:
+            return True
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or now - bucket[0] >= self.window:
+                suppressed = bucket[2] if bucket else 0
+                self._buckets[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} [{suppressed} similar messages suppressed]"
+                return True
+            if bucket[1] < self.limit:
+                bucket[1] += 1
+                return True
+            bucket[2] += 1
+            return False
+
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def _configure():
+    global _configured
+    with _configure_lock:
+        if _configured:
+            return
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(getattr(logging, str(LOG_LEVEL).upper(), logging.WARNING))
+        root.propagate = False
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        rate_limit = RateLimitFilter()
+
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(formatter)
+        console.addFilter(rate_limit)
+        root.addHandler(console)
+
+        if LOG_FILE:
+            try:
+                directory = os.path.dirname(LOG_FILE)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                file_handler = logging.handlers.RotatingFileHandler(
+                    LOG_FILE, maxBytes=LOG_MAX_SIZE, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+                )
+                file_handler.setFormatter(formatter)
+                file_handler.addFilter(rate_limit)
+                root.addHandler(file_handler)
+            except OSError as e:
+                root.warning("File logging disabled (%s): %s", LOG_FILE, e)
+        _configured = True
+
+
+def get_logger(name=None):
+    """
+    Return the dashboard logger (or a named child of it), configuring handlers on first use
+    """
+    _configure()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}" if name else ROOT_LOGGER)
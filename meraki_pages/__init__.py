@@ -0,0 +1,91 @@
+# Dashboard pages
+# Each sidebar page lives in its own module and is imported the first time it is shown.
+# A page module declares the data it needs in DATA and draws itself with render(ctx);
+# only the declared data is fetched on a rerun, so e.g. the license page never loads devices.
+# An optional prefetch(ctx) warms the same loader caches in the background (meraki_prefetch).
+import importlib
+
+from meraki_data import load_critical_data_fast, load_device_details, load_devices
+from meraki_device_status import apply_status_patches, consume_invalidation
+from meraki_logging import get_logger
+from meraki_rollup import get_rollup, rollup_view
+from meraki_rerun_tracer import mark_section
+
+log = get_logger("pages")
+
+# Sidebar label -> module in this package
+PAGES = {
+    "메인화면": "main",
+    "트래픽 분석": "traffic",
+    "클라이언트 분석": "clients",
+    "스위치 포트": "switch_ports",
+    "디바이스 상태 알림": "device_alerts",
+    "라이센스 정보": "licenses",
+}
+DEFAULT_PAGE = "메인화면"
+
+
+class PageContext:
+    """
+    Selection state shared by every page; declared DATA entries are added as attributes
+    """
+
+    def __init__(self, api_key, org_id, sel_nets, net_map, timespan, resolution, **features):
+        self.api_key = api_key
+        self.org_id = org_id
+        self.sel_nets = sel_nets
+        self.net_map = net_map
+        self.timespan = timespan
+        self.resolution = resolution
+        for name, enabled in features.items():
+            setattr(self, name, enabled)
+
+
+def _selected_devices(ctx):
+    # A settings_changed webhook invalidates this org's snapshot; device up/down
+    # webhooks only patch the affected entries so the 180s TTL can stay in place
+    if consume_invalidation(ctx.org_id):
+        log.debug("Webhook config change - refreshing device snapshot")
+        load_devices.clear(ctx.api_key, ctx.org_id)
+        load_critical_data_fast.clear(ctx.api_key, ctx.org_id)
+        load_device_details.clear(ctx.api_key, ctx.org_id)
+
+    devices = apply_status_patches(ctx.org_id, load_critical_data_fast(ctx.api_key, ctx.org_id))
+    selected = [d for d in devices if d["networkId"] in ctx.sel_nets]
+    log.debug("Devices: %d in org, %d in %d selected networks", len(devices), len(selected), len(ctx.sel_nets))
+    return selected
+
+
+def _status_rollup(ctx):
+    # Counts pre-aggregated when the snapshot was ingested; declare after "devices" so a
+    # webhook-invalidated snapshot is refetched (and re-rolled up) first
+    devices = None
+    if get_rollup(ctx.org_id) is None:
+        devices = load_critical_data_fast(ctx.api_key, ctx.org_id)
+    return rollup_view(ctx.org_id, ctx.sel_nets, devices)
+
+
+# DATA name -> loader(ctx)
+DATA_PROVIDERS = {
+    "devices": _selected_devices,
+    "rollup": _status_rollup,
+}
+
+
+def load_page(name):
+    """
+    Import (once per process) and return the module for a sidebar page
+    """
+    return importlib.import_module(f"{__name__}.{PAGES.get(name, PAGES[DEFAULT_PAGE])}")
+
+
+def render_page(name, ctx):
+    """
+    Fetch the data the page declares, then render it
+    """
+    page = load_page(name)
+    for dependency in page.DATA:
+        mark_section(f"data: {dependency}")
+        setattr(ctx, dependency, DATA_PROVIDERS[dependency](ctx))
+    mark_section(f"page: {name}")
+    page.render(ctx)
@@ -0,0 +1,265 @@
+# 클라이언트 분석 page
+# Client analysis: client counts and usage per selected network
+import streamlit as st
+
+from meraki_data import load_client_analysis_data_parallel, load_comprehensive_traffic
+from meraki_lazy import lazy_import
+from meraki_logging import get_logger
+from meraki_table import search_select
+
+log = get_logger("pages")
+
+pd = lazy_import("pandas")
+go = lazy_import("plotly.graph_objects")
+
+DATA = ()
+
+
+def render(ctx):
+    api_key = ctx.api_key
+    sel_nets = ctx.sel_nets
+    net_map = ctx.net_map
+    timespan = ctx.timespan
+    resolution = ctx.resolution
+    enable_clients = ctx.enable_clients
+
+    st.header("👥 개별 클라이언트 분석 (특정 클라이언트의 상세 트래픽)")
+    
+    if not enable_clients:
+        st.info("🔧 사이드바에서 클라이언트 분석을 활성화하여 클라이언트 데이터를 확인하세요")
+    else:
+        # Load client data only when user visits this page (on-demand loading)
+        
+        with st.spinner("클라이언트 데이터 로딩 중..."):
+            client_data = load_client_analysis_data_parallel(api_key, sel_nets, timespan, resolution)
+        
+        log.debug("Client analysis data loaded in %.2f seconds", client_data['load_time'])
+        
+        # 클라이언트 선택 섹션
+        st.markdown("### 📋 클라이언트 선택")
+        
+        # Extract data from parallel results
+        all_clients = []
+        network_clients_map = {}
+        total_clients_overview = 0
+        
+        for net_id in sel_nets:
+            display_name = next((name for name, nid in net_map.items() if nid == net_id), f"Network_{net_id}")
+            
+            # Get data from parallel results
+            network_data = client_data['network_data'].get(net_id, {})
+            clients_data = network_data.get('clients', [])
+            clients_overview = network_data.get('clients_overview', {})
+            
+            # Get total client count from overview
+            if clients_overview and 'counts' in clients_overview:
+                total_clients_overview += clients_overview['counts'].get('total', 0)
+            elif clients_overview and 'total' in clients_overview:
+                total_clients_overview += clients_overview['total']
+            
+            if clients_data:
+                network_clients_map[net_id] = {
+                    'display_name': display_name,
+                    'clients': clients_data
+                }
+                for client in clients_data:
+                    client['network_id'] = net_id
+                    client['network_name'] = display_name
+                    all_clients.append(client)
+        
+        if not all_clients:
+            st.warning("선택된 네트워크에서 클라이언트를 찾을 수 없습니다.")
+        else:
+            # 클라이언트 선택 UI
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                # 클라이언트 선택 드롭다운
+                client_options = []
+                for i, client in enumerate(all_clients):
+                    client_name = client.get('description', client.get('hostname', f"Client_{i}"))
+                    client_mac = client.get('mac', 'Unknown')
+                    network_name = client.get('network_name', 'Unknown')
+                    client_id = f"{client_name} ({client_mac}) - {network_name}"
+                    client_options.append((client_id, i))
+                
+                # Only matches of the search box are sent to the browser (large client lists)
+                selected_client_idx = search_select(
+                    "클라이언트를 선택하세요",
+                    [idx for _, idx in client_options],
+                    key="client_analysis_select",
+                    format_func=lambda x: client_options[x][0],
+                    help="분석할 클라이언트를 선택하세요"
+                )
+            
+            if selected_client_idx is None:
+                return
+            
+            # 선택된 클라이언트 정보
+            selected_client = all_clients[selected_client_idx]
+            client_name = selected_client.get('description', selected_client.get('hostname', 'Unknown'))
+            client_mac = selected_client.get('mac', 'Unknown')
+            client_ip = selected_client.get('ip', 'Unknown')
+            client_vlan = selected_client.get('vlan', 'Unknown')
+            client_network = selected_client.get('network_name', 'Unknown')
+            
+            st.markdown("---")
+            st.subheader(f"👤 {client_name}")
+            
+            # 클라이언트 기본 정보
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.markdown(f"**🖥️ 클라이언트명:**<br><span class='client-name'>{client_name}</span>", unsafe_allow_html=True)
+                st.markdown(f"**🌐 네트워크:**<br><span class='client-name'>{client_network}</span>", unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"**📡 MAC 주소:**<br><span class='mac-address'>{client_mac}</span>", unsafe_allow_html=True)
+                st.markdown(f"**🔢 IP 주소:**<br><span class='mac-address'>{client_ip}</span>", unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown(f"**🏷️ VLAN:**<br><span class='client-name'>{client_vlan}</span>", unsafe_allow_html=True)
+                status_text = "온라인" if selected_client.get('status') == 'Online' else "오프라인"
+                st.markdown(f"**📶 연결 상태:**<br><span class='client-name'>{status_text}</span>", unsafe_allow_html=True)
+            
+            with col4:
+                # 클라이언트 사용량 정보
+                usage = selected_client.get('usage', {})
+                sent = usage.get('sent', 0)
+                recv = usage.get('recv', 0)
+                
+                st.markdown(f"**📤 전송량:**<br><span class='client-name'>{sent / (1024*1024):.2f} MB</span>", unsafe_allow_html=True)
+                st.markdown(f"**📥 수신량:**<br><span class='client-name'>{recv / (1024*1024):.2f} MB</span>", unsafe_allow_html=True)
+            
+            # 클라이언트별 트래픽 분석
+            st.markdown("---")
+            st.subheader("📊 클라이언트 트래픽 분석")
+            
+            # 클라이언트별 애플리케이션 트래픽 분석
+            client_network_id = selected_client.get('network_id')
+            
+            # 해당 네트워크의 모든 디바이스 타입 트래픽 데이터 로드
+            comprehensive_traffic = load_comprehensive_traffic(api_key, client_network_id, timespan)
+            
+            if comprehensive_traffic:
+                # 클라이언트별 트래픽 필터링
+                client_traffic = []
+                for device_type, traffic_data in comprehensive_traffic.items():
+                    if traffic_data:
+                        for app in traffic_data:
+                            # 클라이언트 MAC이나 IP로 필터링 (실제로는 더 정교한 매칭 필요)
+                            if (client_mac in str(app.get('destination', '')) or 
+                                client_ip in str(app.get('destination', '')) or
+                                client_mac in str(app.get('source', '')) or
+                                client_ip in str(app.get('source', ''))):
+                                app_copy = app.copy()
+                                app_copy['deviceType'] = device_type
+                                client_traffic.append(app_copy)
+                
+            if client_traffic:
+                # 클라이언트 트래픽 데이터프레임 생성
+                client_df = pd.DataFrame(client_traffic)
+                client_df["sent_MB"] = client_df["sent"] / (1024 * 1024)
+                client_df["recv_MB"] = client_df["recv"] / (1024 * 1024)
+                client_df["TotalMB"] = client_df["sent_MB"] + client_df["recv_MB"]
+                
+                # 클라이언트 트래픽 메트릭
+                total_sent_mb = client_df["sent_MB"].sum()
+                total_recv_mb = client_df["recv_MB"].sum()
+                total_traffic_mb = total_sent_mb + total_recv_mb
+                total_clients = client_df["numClients"].sum()
+                        
+                col1, col2, col3, col4 = st.columns(4)
+                        
+                with col1:
+                    st.metric("📊 총 트래픽", f"{total_traffic_mb:.2f} MB")
+                    st.metric("📤 업로드", f"{total_sent_mb:.2f} MB")
+                        
+                with col2:
+                    st.metric("📥 다운로드", f"{total_recv_mb:.2f} MB")
+                    st.metric("👥 관련 클라이언트", f"{total_clients}")
+                        
+                with col3:
+                    # 상위 애플리케이션
+                    top_apps = client_df.nlargest(5, "TotalMB")
+                    st.metric("🔥 상위 앱", top_apps.iloc[0]["application"] if len(top_apps) > 0 else "N/A")
+                    st.metric("📱 앱 수", f"{len(client_df)}개")
+                        
+                with col4:
+                    # 디바이스 타입 분포
+                    device_types = client_df["deviceType"].value_counts()
+                    st.metric("🔌 주요 디바이스", device_types.index[0] if len(device_types) > 0 else "N/A")
+                    st.metric("📊 디바이스 타입", f"{len(device_types)}개")
+                
+                # 클라이언트 애플리케이션 트래픽 차트
+                st.markdown("---")
+                st.subheader("📈 클라이언트 애플리케이션 트래픽")
+                
+                if len(client_df) > 0:
+                    # 상위 10개 애플리케이션 차트
+                    top_10_apps = client_df.nlargest(10, "TotalMB")
+                    
+                    # Use plotly graph objects directly to avoid narwhals compatibility issues
+                    fig = go.Figure(data=[
+                        go.Bar(
+                            x=top_10_apps["TotalMB"],
+                            y=top_10_apps["application"],
+                            orientation='h',
+                            text=top_10_apps["TotalMB"].round(1),
+                            texttemplate='%{text:.1f}MB',
+                            textposition='outside',
+                            marker=dict(
+                                color=top_10_apps["TotalMB"],
+                                colorscale='Viridis',
+                                showscale=True
+                            )
+                        )
+                    ])
+                    fig.update_layout(
+                        title=f"{client_name} - 상위 애플리케이션 트래픽",
+                        xaxis_title="Total MB",
+                        yaxis_title="Application",
+                        height=400
+                    )
+                    
+                    fig.update_layout(
+                        height=max(400, len(top_10_apps) * 30),
+                        xaxis_title="트래픽 (MB)",
+                        yaxis_title="애플리케이션",
+                        showlegend=False
+                    )
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                # 클라이언트 상세 테이블
+                st.markdown("---")
+                st.subheader("📋 클라이언트 상세 트래픽 테이블")
+                
+                display_df = client_df[['application', 'TotalMB', 'sent_MB', 'recv_MB', 'numClients', 'deviceType', 'protocol', 'port']].copy()
+                display_df = display_df.sort_values('TotalMB', ascending=False)
+                display_df['TotalMB'] = display_df['TotalMB'].round(2)
+                display_df['sent_MB'] = display_df['sent_MB'].round(2)
+                display_df['recv_MB'] = display_df['recv_MB'].round(2)
+                        
+                st.dataframe(
+                    display_df.rename(columns={
+                        'application': '애플리케이션',
+                        'TotalMB': '총 트래픽 (MB)',
+                        'sent_MB': '업로드 (MB)',
+                        'recv_MB': '다운로드 (MB)',
+                        'numClients': '클라이언트 수',
+                        'deviceType': '디바이스 타입',
+                        'protocol': '프로토콜',
+                        'port': '포트'
+                    }),
+                    use_container_width=True,
+                    hide_index=True
+                )
+
+
+def prefetch(ctx):
+    """
+    Warm the client analysis cache render() reads, with the same arguments
+    """
+    if ctx.enable_clients:
+        load_client_analysis_data_parallel(ctx.api_key, ctx.sel_nets, ctx.timespan, ctx.resolution)
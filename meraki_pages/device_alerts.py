@@ -0,0 +1,167 @@
+# 디바이스 상태 알림 page
+# Device status alerts and recent configuration changes
+from datetime import datetime
+
+import streamlit as st
+
+from meraki_data import load_configuration_changes, load_critical_data_fast, load_device_alerts_data_parallel
+from meraki_logging import get_logger
+
+log = get_logger("pages")
+
+DATA = ("devices",)
+
+
+def render(ctx):
+    api_key = ctx.api_key
+    org_id = ctx.org_id
+    net_map = ctx.net_map
+    filtered = ctx.devices
+    enable_alerts = ctx.enable_alerts
+
+    st.header("🚨 디바이스 상태 알림 (디바이스 상태 모니터링 및 오류 감지)")
+    
+    if not enable_alerts:
+        st.info("🔧 알림 및 오류 분석을 위해 사이드바에서 활성화해주세요")
+    else:
+        # Load device alerts data only when user visits this page (on-demand loading)
+        
+        # Get device serials for parallel loading
+        device_serials = [d.get('serial') for d in filtered if d.get('serial')]
+        
+        if device_serials:
+            with st.spinner("디바이스 알림 데이터 로딩 중..."):
+                alerts_data = load_device_alerts_data_parallel(api_key, org_id, device_serials)
+            log.debug("Device alerts data loaded in %.2f seconds", alerts_data['load_time'])
+        else:
+            alerts_data = {'device_data': {}, 'load_time': 0}
+            log.warning("No device serials found for alerts loading")
+        
+        # Filter devices by status
+        offline_devices = [d for d in filtered if d["status"] == "offline"]
+        alerting_devices = [d for d in filtered if d["status"] == "alerting"]
+        online_devices = [d for d in filtered if d["status"] == "online"]
+        dormant_devices = [d for d in filtered if d["status"] == "dormant"]
+        
+        # Simple status summary
+        total_devices = len(filtered)
+        total_issues = len(offline_devices) + len(alerting_devices)
+        
+        if total_issues > 0:
+            # Show critical issues
+            st.error(f"🚨 **{total_issues} 디바이스에 문제가 있습니다**")
+            
+            # Device status breakdown
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("✅ Online", len(online_devices), delta_color="normal")
+            with col2:
+                st.metric("❌ Offline", len(offline_devices), delta_color="inverse")
+            with col3:
+                st.metric("⚠️ Alerting", len(alerting_devices), delta_color="inverse")
+            with col4:
+                st.metric("😴 Dormant", len(dormant_devices), delta_color="normal")
+            
+            st.markdown("---")
+            
+            # Show problematic devices
+            if offline_devices:
+                st.error("❌ **오프라인 디바이스**")
+                for device in offline_devices:
+                    network_name = next((name for name, net_id in net_map.items() if net_id == device["networkId"]), "Unknown")
+                    st.write(f"• **{device.get('name', 'Unknown')}** ({network_name})")
+                    st.write(f"  - Model: {device.get('model', 'N/A')}")
+                    st.write(f"  - Serial: {device.get('serial', 'N/A')}")
+                    st.write("---")
+            
+            if alerting_devices:
+                st.warning("⚠️ **알림 디바이스**")
+                for device in alerting_devices:
+                    network_name = next((name for name, net_id in net_map.items() if net_id == device["networkId"]), "Unknown")
+                    st.write(f"• **{device.get('name', 'Unknown')}** ({network_name})")
+                    st.write(f"  - Model: {device.get('model', 'N/A')}")
+                    st.write(f"  - Serial: {device.get('serial', 'N/A')}")
+                    st.write("---")
+        else:
+            # All systems operational
+            st.success("✅ **모든 시스템 정상 작동**")
+            st.info("디바이스 상태 문제가 감지되지 않았습니다.")
+            
+            # Simple health summary
+            if total_devices > 0:
+                # Only decrease health for confirmed errors (offline, alerting)
+                # Dormant devices don't affect health score
+                confirmed_errors = len(offline_devices) + len(alerting_devices)
+                if confirmed_errors == 0:
+                    health_percentage = 100.0
+                else:
+                    health_percentage = ((total_devices - confirmed_errors) / total_devices) * 100
+                
+                st.metric("Network Health", f"{health_percentage:.1f}%", 
+                         delta_color="normal" if health_percentage == 100 else "inverse")
+    
+    # Configuration Changes Section
+    st.markdown("---")
+    st.subheader("📋 설정 변경 내역 (조직 설정 변경 기록)")
+    
+    # Fixed per_page value
+    per_page = 3000
+    
+    # Generate text report button
+    if st.button("📄 Generate Text Report", key="generate_config_report", use_container_width=True):
+        with st.spinner("Loading configuration changes..."):
+            config_changes = load_configuration_changes(api_key, org_id, per_page)
+            
+            if config_changes:
+                st.success(f"✅ Loaded {len(config_changes)} configuration changes")
+                
+                # Convert all data to text format without preprocessing
+                text_content = "=== MERAKI CONFIGURATION CHANGES REPORT ===\n"
+                text_content += f"Organization ID: {org_id}\n"
+                text_content += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                text_content += f"Total Records: {len(config_changes)}\n"
+                text_content += "=" * 50 + "\n\n"
+                
+                # Add each configuration change as raw text
+                for i, change in enumerate(config_changes, 1):
+                    text_content += f"--- Configuration Change #{i} ---\n"
+                    text_content += f"Raw Data: {str(change)}\n"
+                    text_content += "\n"
+                
+                # Store in session state for download
+                st.session_state['config_changes_text'] = text_content
+                st.session_state['config_changes_filename'] = f"meraki_config_changes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+                st.rerun()
+            else:
+                st.warning("No configuration changes found or failed to load data")
+    
+    # Show download button if text content is ready
+    if 'config_changes_text' in st.session_state:
+        st.markdown("#### 📥 설정 변경 보고서 내보내기")
+        st.download_button(
+            label="📥 Download Configuration Changes as Text File",
+            data=st.session_state['config_changes_text'],
+            file_name=st.session_state['config_changes_filename'],
+            mime="text/plain",
+            key="download_config_changes",
+            width='stretch'
+        )
+        
+        # Clear the session state after showing download button
+        if st.button("🗑️ 보고서 초기화", key="clear_config_report"):
+            del st.session_state['config_changes_text']
+            del st.session_state['config_changes_filename']
+            st.rerun()
+
+
+def prefetch(ctx):
+    """
+    Warm the alerts cache render() reads. Uses the cached device snapshot directly:
+    webhook invalidations are left for the foreground rerun to consume.
+    """
+    if not ctx.enable_alerts:
+        return
+    devices = load_critical_data_fast(ctx.api_key, ctx.org_id)
+    device_serials = [d.get('serial') for d in devices if d["networkId"] in ctx.sel_nets and d.get('serial')]
+    if device_serials:
+        load_device_alerts_data_parallel(ctx.api_key, ctx.org_id, device_serials)
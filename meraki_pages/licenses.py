@@ -0,0 +1,233 @@
+# 라이센스 정보 page
+# License overview and co-termination license details
+from datetime import datetime
+
+import streamlit as st
+
+from meraki_data import SHOW_DEBUG_INFO, init_api, load_detailed_licenses, load_license_overview, parse_date
+from meraki_lazy import lazy_import
+from meraki_logging import get_logger
+
+log = get_logger("pages")
+
+pd = lazy_import("pandas")
+
+DATA = ()
+
+
+def render(ctx):
+    api_key = ctx.api_key
+    org_id = ctx.org_id
+
+    st.header("📄 라이센스 정보 (조직 라이센스 현황 및 상세 정보)")
+    
+    # Load license data only when user visits this page (on-demand loading)
+    
+    with st.spinner("라이센스 데이터 로딩 중..."):
+        license_overview = load_license_overview(api_key, org_id)
+    
+    log.debug("License data loaded on-demand")
+    
+    # Add CSS to prevent text truncation in metrics and increase font size
+    st.markdown("""
+    <style>
+    /* Prevent text truncation in metrics and increase font size */
+    div[data-testid="stMetricValue"] {
+        white-space: nowrap !important;
+        overflow: visible !important;
+        text-overflow: unset !important;
+        font-size: 2rem !important;
+        font-weight: 600 !important;
+    }
+    div[data-testid="stMetricLabel"] {
+        white-space: nowrap !important;
+        overflow: visible !important;
+        text-overflow: unset !important;
+        font-size: 1.1rem !important;
+        font-weight: 500 !important;
+    }
+    /* Increase column width for metrics */
+    div[data-testid="column"] {
+        min-width: 200px !important;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # License Overview Section
+    st.subheader("📊 라이센스 개요")
+    
+    
+    if license_overview:
+            
+            # Display overview metrics
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                if 'status' in license_overview:
+                    status = license_overview['status']
+                    st.metric("📋 라이센스 상태", status)
+            
+            with col2:
+                if 'expirationDate' in license_overview:
+                    exp_date = license_overview['expirationDate']
+                    # Format date for better display
+                    if exp_date and exp_date != 'N/A':
+                        try:
+                            # Parse and format date
+                            parsed_date = datetime.fromisoformat(exp_date.replace('Z', '+00:00'))
+                            formatted_date = parsed_date.strftime('%Y-%m-%d')
+                        except:
+                            formatted_date = exp_date
+                    else:
+                        formatted_date = exp_date
+                    st.metric("📅 만료일", formatted_date)
+            
+            with col3:
+                if 'licensedDeviceCounts' in license_overview:
+                    device_counts = license_overview['licensedDeviceCounts']
+                    total_devices = sum(device_counts.values()) if device_counts else 0
+                    st.metric("🔢 총 라이센스 디바이스", total_devices)
+            
+            with col4:
+                if 'usedDeviceCounts' in license_overview:
+                    used_counts = license_overview['usedDeviceCounts']
+                    total_used = sum(used_counts.values()) if used_counts else 0
+                    st.metric("📱 사용 중인 디바이스", total_used)
+            
+            # Display license comparison table
+            st.markdown("---")
+            st.markdown("#### 📋 라이센스 개수")
+            
+            # Debug: Show what's in license_overview
+            if SHOW_DEBUG_INFO:
+                st.write("Debug - license_overview keys:", list(license_overview.keys()))
+                st.write("Debug - license_overview values:", license_overview)
+            
+            # Create license comparison table
+            license_data = []
+            
+            # Get licensed and used device counts
+            licensed_counts = license_overview.get('licensedDeviceCounts', {})
+            used_counts = license_overview.get('usedDeviceCounts', {})
+            
+            # Get all product types from both dictionaries
+            all_products = set(licensed_counts.keys()) | set(used_counts.keys())
+            
+            for product in sorted(all_products):
+                license_limit = licensed_counts.get(product, 0)
+                
+                # Format license limit (show "free" for 0, or specific number)
+                if license_limit == 0:
+                    limit_display = "무제한"
+                else:
+                    limit_display = str(license_limit)
+                
+                license_data.append({
+                    "제품 타입": product,
+                    "라이센스 개수": limit_display
+                })
+            
+            if license_data:
+                license_df = pd.DataFrame(license_data)
+                # Make table smaller and center-aligned
+                st.dataframe(
+                    license_df, 
+                    use_container_width=False,
+                    hide_index=True,
+                    column_config={
+                        "제품 타입": st.column_config.TextColumn("제품 타입", width="medium"),
+                        "라이센스 한도": st.column_config.TextColumn("라이센스 한도", width="small")
+                    }
+                )
+            else:
+                st.info("라이센스 개요에서 표시할 수 있는 데이터가 없습니다.")
+                if SHOW_DEBUG_INFO:
+                    st.write("Debug - license_data is empty")
+                    st.write("Debug - licensed_counts:", licensed_counts)
+                    st.write("Debug - used_counts:", used_counts)
+    else:
+        st.warning("⚠️ 라이센스 개요 정보를 가져올 수 없습니다")
+        st.info("💡 가능한 원인:")
+        st.write("• API 키에 라이센스 정보 접근 권한이 없을 수 있습니다")
+        st.write("• 조직에 라이센스 정보가 없을 수 있습니다")
+        st.write("• 네트워크 연결 문제일 수 있습니다")
+        
+        # Try to load with different methods
+        st.write("🔄 다른 방법으로 라이센스 정보를 시도합니다...")
+        try:
+            # Try to get basic organization info
+            api = init_api(api_key)
+            if api:
+                org_info = api.organizations.getOrganization(organizationId=org_id)
+                st.write(f"조직 정보: {org_info.get('name', 'Unknown')}")
+        except Exception as e:
+            st.write(f"조직 정보 로딩 실패: {e}")
+    
+    # Detailed Licenses Section - Auto load with per_page=1000
+    st.markdown("---")
+    st.subheader("📋 상세 라이센스 목록")
+    
+    with st.spinner("상세 라이센스 정보를 로딩 중..."):
+        detailed_licenses = load_detailed_licenses(api_key, org_id, per_page=1000)
+        
+        # Debug information
+        if SHOW_DEBUG_INFO:
+            st.write(f"Debug: detailed_licenses type: {type(detailed_licenses)}")
+            st.write(f"Debug: detailed_licenses length: {len(detailed_licenses) if detailed_licenses else 'None'}")
+            if detailed_licenses:
+                st.write(f"Debug: First license sample: {detailed_licenses[0] if len(detailed_licenses) > 0 else 'Empty'}")
+        
+        if detailed_licenses:
+            st.success(f"✅ {len(detailed_licenses)}개의 상세 라이센스 정보를 로드했습니다")
+            
+            # Create detailed licenses table
+            licenses_data = []
+            for license_info in detailed_licenses:
+                # Extract editions information
+                editions = license_info.get('editions', [])
+                edition_info = ""
+                if editions:
+                    edition_list = []
+                    for edition in editions:
+                        edition_name = edition.get('edition', 'N/A')
+                        product_type = edition.get('productType', 'N/A')
+                        edition_list.append(f"{edition_name} ({product_type})")
+                    edition_info = ", ".join(edition_list)
+                else:
+                    edition_info = "N/A"
+                
+                # Extract counts information
+                counts = license_info.get('counts', [])
+                count_info = ""
+                if counts:
+                    count_list = []
+                    for count in counts:
+                        model = count.get('model', 'N/A')
+                        count_num = count.get('count', 0)
+                        count_list.append(f"{model}: {count_num}")
+                    count_info = ", ".join(count_list)
+                else:
+                    count_info = "N/A"
+                
+                licenses_data.append({
+                    "라이센스 키": license_info.get('key', 'N/A'),
+                    "기간 (일)": license_info.get('duration', 'N/A'),
+                    "모드": license_info.get('mode', 'N/A'),
+                    "시작일": parse_date(license_info.get('startedAt', 'N/A')),
+                    "클레임일": parse_date(license_info.get('claimedAt', 'N/A')),
+                    "에디션": edition_info,
+                    "모델별 수량": count_info
+                })
+            
+            licenses_df = pd.DataFrame(licenses_data)
+            
+            # Display the table
+            st.dataframe(licenses_df, use_container_width=True, hide_index=True)
+
+
+def prefetch(ctx):
+    """
+    Warm the license caches render() reads, with the same arguments
+    """
+    load_license_overview(ctx.api_key, ctx.org_id)
+    load_detailed_licenses(ctx.api_key, ctx.org_id, per_page=1000)
@@ -0,0 +1,591 @@
+# 메인화면 page
+# Main overview: device status summary, issues and per-device event logs
+from datetime import datetime
+
+import streamlit as st
+
+from meraki_data import export_device_events, export_event_bundle, load_uplink_health
+from meraki_export import EXPORT_FORMATS, export_filename, export_mime
+from meraki_lazy import lazy_import
+from meraki_logging import get_logger
+from meraki_system_info import system_info
+from meraki_table import paged_table, search_select
+
+log = get_logger("pages")
+
+pd = lazy_import("pandas")
+
+DATA = ("devices", "rollup")
+
+EXPORT_FORMAT_LABELS = {"txt": "텍스트", "csv": "CSV", "jsonl": "JSONL"}
+
+LOSS_WARN = 1.0       # 95th percentile loss (%) from which an uplink counts as degraded
+LATENCY_WARN = 100    # 95th percentile latency (ms) from which an uplink counts as degraded
+
+
+def render(ctx):
+    api_key = ctx.api_key
+    sel_nets = ctx.sel_nets
+    net_map = ctx.net_map
+    filtered = ctx.devices
+    rollup = ctx.rollup
+    net_names = {net_id: name for name, net_id in net_map.items()}
+
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        st.header("📊 실시간 네트워크 상태")
+    #with col2:
+    #    st.markdown("")  # Add some spacing
+    #    if st.button("🔄 새로고침", key="main_refresh", help="데이터를 새로고침하고 경과시간을 초기화합니다"):
+    #        st.session_state.data_load_time = datetime.now()
+    #        st.cache_data.clear()
+    #        st.rerun()
+    
+    # Calculate metrics by product type (pre-aggregated when the device snapshot was ingested)
+    total_d = rollup.total
+    
+    # Devices by product type and status
+    product_stats = rollup.by_product
+    product_type_map = {
+        'appliance': '🔒 Appliance',
+        'switch': '🔌 Switch', 
+        'wireless': '📶 Wireless AP',
+        'camera': '📹 Camera',
+        'sensor': '🌡️ Sensor',
+        'cellularGateway': '📱 Cellular Gateway'
+    }
+    
+    # Display product-based device status
+
+    
+    if product_stats:
+        # Define the desired display order
+        display_order = ['appliance', 'switch', 'wireless', 'camera', 'sensor', 'cellularGateway']
+        
+        # Filter to only show product types that exist in the data
+        available_products = [pt for pt in display_order if pt in product_stats]
+        
+        # Create columns based on number of available product types (max 4 columns)
+        num_products = len(available_products)
+        if num_products <= 4:
+            cols = st.columns(num_products)
+        else:
+            # If more than 4 products, use 4 columns and wrap
+            cols = st.columns(4)
+        
+        col_idx = 0
+        for product_type in available_products:
+            if product_type in product_stats:
+                stats = product_stats[product_type]
+            with cols[col_idx % len(cols)]:
+                # Get product display name
+                display_name = product_type_map.get(product_type, f"📱 {product_type.title()}")
+                
+                st.markdown(f"### {display_name}")
+                
+                # Display status counts with colors
+                st.markdown(f"""
+                <div style="padding: 10px; border-radius: 8px; background: #f8fafc; border: 1px solid #e5e7eb;">
+                    <div style="margin-bottom: 8px;">
+                        <span style="color: #059669; font-weight: 600; font-size: 1.1rem;">온라인: {stats['online']}</span>
+                    </div>
+                    <div style="margin-bottom: 8px;">
+                        <span style="color: #dc2626; font-weight: 600; font-size: 1.1rem;">오프라인: {stats['offline']}</span>
+                    </div>
+                    <div style="margin-bottom: 8px;">
+                        <span style="color: #d97706; font-weight: 600; font-size: 1.1rem;">경고: {stats['alerting']}</span>
+                    </div>
+                    <div>
+                        <span style="color: #6b7280; font-weight: 600; font-size: 1.1rem;">비활성: {stats['dormant']}</span>
+                    </div>
+                    <hr style="margin: 10px 0; border: 1px solid #e5e7eb;">
+                    <div style="text-align: center;">
+                        <strong>총 {stats['total']}대</strong>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            col_idx += 1
+    
+    # WAN health of the selected networks' appliances (one org-wide loss/latency history)
+    if 'appliance' in product_stats:
+        _wan_health(load_uplink_health(api_key, ctx.org_id), sel_nets, net_names)
+    
+     # 지정된 메트릭들을 숨김 처리 (🏥 네트워크 상태, 🚨 중요 알림, 📡 상태)
+    
+    # Get devices with issues
+    offline_devices = rollup.issues["offline"]
+    alerting_devices = rollup.issues["alerting"]
+    
+    # Real-time Alert Dashboard - only show if there are alerts
+    if offline_devices or alerting_devices:
+        st.markdown("---")
+        st.subheader("🚨 실시간 알림 대시보드")
+        # Create alert cards
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if offline_devices:
+                st.error(f"❌ **오프라인 디바이스: {len(offline_devices)}**")
+                for device in offline_devices[:5]:  # Show first 5
+                    network_name = net_names.get(device["networkId"], "Unknown")
+                    st.write(f"• **{device.get('name', 'Unknown')}** ({network_name}) - {device.get('model', 'N/A')}")
+                if len(offline_devices) > 5:
+                    st.write(f"... 및 {len(offline_devices) - 5}개 더")
+        
+        with col2:
+            if alerting_devices:
+                st.warning(f"⚠️ **경고 디바이스: {len(alerting_devices)}**")
+                for device in alerting_devices[:5]:  # Show first 5
+                    network_name = net_names.get(device["networkId"], "Unknown")
+                    st.write(f"• **{device.get('name', 'Unknown')}** ({network_name}) - {device.get('model', 'N/A')}")
+                if len(alerting_devices) > 5:
+                    st.write(f"... 및 {len(alerting_devices) - 5}개 더")
+        
+        # Quick action buttons
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("🔄 상태 새로고침", key="refresh_status"):
+                st.session_state.data_load_time = datetime.now()
+                st.cache_data.clear()
+                st.rerun()
+        with col2:
+            if st.button("📊 모든 문제 보기", key="view_issues"):
+                st.session_state.show_detailed_alerts = not st.session_state.get('show_detailed_alerts', False)
+                st.rerun()
+    
+    # Show detailed alerts if requested
+    if st.session_state.get('show_detailed_alerts', False):
+        st.markdown("---")
+        st.subheader("🚨 상세 알림 정보")
+        
+        if offline_devices or alerting_devices:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if offline_devices:
+                    st.error(f"❌ **OFFLINE DEVICES: {len(offline_devices)}**")
+                    for device in offline_devices:
+                        network_name = net_names.get(device["networkId"], "Unknown")
+                        with st.expander(f"🔴 {device.get('name', 'Unknown')} ({network_name})", expanded=True):
+                            st.write("**Device Details:**")
+                            st.write(f"- **Name:** {device.get('name', 'Unknown')}")
+                            st.write(f"- **Model:** {device.get('model', 'N/A')}")
+                            st.write(f"- **Serial:** {device.get('serial', 'N/A')}")
+                            st.write(f"- **MAC:** {device.get('mac', 'N/A')}")
+                            st.write(f"- **IP:** {device.get('lanIp', 'N/A')}")
+                            st.write(f"- **Network:** {network_name}")
+                            st.write(f"- **Status:** {device.get('status', 'N/A')}")
+                            st.write(f"- **Last Seen:** {device.get('lastReportedAt', 'N/A')}")
+                            
+                            # Additional device information
+                            if device.get('tags'):
+                                st.write(f"- **Tags:** {', '.join(device.get('tags', []))}")
+                            if device.get('address'):
+                                st.write(f"- **Address:** {device.get('address', 'N/A')}")
+                            if device.get('notes'):
+                                st.write(f"- **Notes:** {device.get('notes', 'N/A')}")
+            
+            with col2:
+                if alerting_devices:
+                    st.warning(f"⚠️ **ALERTING DEVICES: {len(alerting_devices)}**")
+                    for device in alerting_devices:
+                        network_name = net_names.get(device["networkId"], "Unknown")
+                        with st.expander(f"🟡 {device.get('name', 'Unknown')} ({network_name})", expanded=True):
+                            st.write("**Device Details:**")
+                            st.write(f"- **Name:** {device.get('name', 'Unknown')}")
+                            st.write(f"- **Model:** {device.get('model', 'N/A')}")
+                            st.write(f"- **Serial:** {device.get('serial', 'N/A')}")
+                            st.write(f"- **MAC:** {device.get('mac', 'N/A')}")
+                            st.write(f"- **IP:** {device.get('lanIp', 'N/A')}")
+                            st.write(f"- **Network:** {network_name}")
+                            st.write(f"- **Status:** {device.get('status', 'N/A')}")
+                            st.write(f"- **Last Seen:** {device.get('lastReportedAt', 'N/A')}")
+                            
+                            # Additional device information
+                            if device.get('tags'):
+                                st.write(f"- **Tags:** {', '.join(device.get('tags', []))}")
+                            if device.get('address'):
+                                st.write(f"- **Address:** {device.get('address', 'N/A')}")
+                            if device.get('notes'):
+                                st.write(f"- **Notes:** {device.get('notes', 'N/A')}")
+                            
+                            # Load and display detailed alert information - HIDDEN (숨김 처리)
+                            # st.markdown("---")
+                            # st.subheader("🚨 Alert Details")
+                            
+                            # if device.get('serial'):
+                            #     # Load device-specific alerts
+                            #     device_alerts = load_device_alerts(api_key, org_id, device.get('serial'))
+                            #     
+                            #     if device_alerts:
+                            #         # Display status events
+                            #         if device_alerts.get('status_events'):
+                            #             st.write("**📊 Status Events:**")
+                            #             status_events = device_alerts['status_events']
+                            #             # Safely handle the response - check if it's a list
+                            #             if isinstance(status_events, list) and len(status_events) > 0:
+                            #                 # Show last 5 events
+                            #                 for event in status_events[-5:]:
+                            #                     event_time = event.get('ts', 'N/A')
+                            #                     event_status = event.get('status', 'N/A')
+                            #                     st.write(f"- {event_time}: {event_status}")
+                            #             else:
+                            #                 st.info("Status events data format not as expected")
+                            #         
+                            #         # Display performance issues
+                            #         if device_alerts.get('performance'):
+                            #             st.write("**📈 Performance Issues:**")
+                            #             performance_data = device_alerts['performance']
+                            #             # Safely handle the response - check if it's a list
+                            #             if isinstance(performance_data, list) and len(performance_data) > 0:
+                            #                 # Show last 3 performance entries
+                            #                 for perf in performance_data[-3:]:
+                            #                     loss = perf.get('lossPercent', 'N/A')
+                            #                     latency = perf.get('latencyMs', 'N/A')
+                            #                     st.write(f"- Loss: {loss}%, Latency: {latency}ms")
+                            #             else:
+                            #                 st.info("Performance data format not as expected")
+                            #         
+                            #         # Display security events
+                            #         if device_alerts.get('security'):
+                            #             st.write("**🔒 Security Events:**")
+                            #             security_data = device_alerts['security']
+                            #             # Safely handle the response - check if it's a list
+                            #             if isinstance(security_data, list) and len(security_data) > 0:
+                            #                 # Show last 3 security events
+                            #                 for sec in security_data[-3:]:
+                            #                     event_type = sec.get('eventType', 'N/A')
+                            #                     event_time = sec.get('occurredAt', 'N/A')
+                            #                     st.write(f"- {event_time}: {event_type}")
+                            #             else:
+                            #                 st.info("Security events data format not as expected")
+                            #         
+                            #         if not any([device_alerts.get('status_events'), device_alerts.get('performance'), device_alerts.get('security')]):
+                            #             st.info("No specific alert details available for this device")
+                            #     else:
+                            #         st.info("Loading alert details...")
+                                
+                                # Load network-wide alerts for this device's network - HIDDEN (숨김 처리)
+                                # network_alerts = load_network_alerts(api_key, device["networkId"])
+                                # if network_alerts:
+                                #     st.markdown("---")
+                                #     st.subheader("🌐 Network Alerts")
+                                #     
+                                #     if network_alerts.get('network_events'):
+                                #         st.write("**📡 Network Events:**")
+                                #         network_events = network_alerts['network_events']
+                                #         # Safely handle the response - check if it's a list
+                                #         if isinstance(network_events, list) and len(network_events) > 0:
+                                #             # Show last 3 network events
+                                #             for event in network_events[-3:]:
+                                #                 event_type = event.get('type', 'N/A')
+                                #                 event_time = event.get('occurredAt', 'N/A')
+                                #                 event_desc = event.get('description', 'N/A')
+                                #                 st.write(f"- {event_time}: {event_type} - {event_desc}")
+                                #         else:
+                                #             st.info("Network events data format not as expected")
+                                #     
+                                #     if network_alerts.get('health_alerts'):
+                                #         st.write("**🏥 Health Alerts:**")
+                                #         health_alerts = network_alerts['health_alerts']
+                                #         # Safely handle the response - check if it's a list
+                                #         if isinstance(health_alerts, list) and len(health_alerts) > 0:
+                                #             # Show last 3 health alerts
+                                #             for alert in health_alerts[-3:]:
+                                #                 alert_type = alert.get('type', 'N/A')
+                                #                 alert_time = alert.get('occurredAt', 'N/A')
+                                #                 st.write(f"- {alert_time}: {alert_type}")
+                                #         else:
+                                #             st.info("Health alerts data format not as expected")
+                                #     
+                                #     if not any([network_alerts.get('network_events'), network_alerts.get('health_alerts')]):
+                                #         st.info("No network alerts available")
+                                # else:
+                                #     st.info("Loading network alerts...")
+                            # else:
+                            #     st.warning("⚠️ Device serial number not available - cannot load detailed alerts")
+            
+            # Summary and actions
+            st.markdown("---")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("총 문제", len(offline_devices) + len(alerting_devices))
+            with col2:
+                st.metric("오프라인 디바이스", len(offline_devices))
+            with col3:
+                st.metric("경고 디바이스", len(alerting_devices))
+            
+            if st.button("🔒 상세 알림 숨기기", key="hide_alerts"):
+                st.session_state.show_detailed_alerts = False
+                st.rerun()
+        else:
+            st.success("✅ **중요한 문제가 발견되지 않았습니다!** 모든 디바이스가 정상 작동 중입니다.")
+            if st.button("🔒 상세 알림 숨기기", key="hide_alerts"):
+                st.session_state.show_detailed_alerts = False
+                st.rerun()
+    
+
+    # 네트워크별 디바이스 세부사항만 유지 (col2 부분을 독립적으로 표시)
+    if total_d > 0:
+        st.subheader("🔍 디바이스 세부사항")
+        if filtered:
+            # Status counts per network come from the rollup; devices are grouped once for the tables
+            collected_info = system_info(ctx.org_id)
+            devices_by_network = {}
+            for device in filtered:
+                devices_by_network.setdefault(device["networkId"], []).append(device)
+            
+            # Display network breakdown
+            for network_idx, net_id in enumerate(n for n in sel_nets if n in rollup.by_network):
+                network = net_names.get(net_id, "Unknown")
+                counts = rollup.by_network[net_id]
+                with st.expander(f"🌐 {network} ({sum(counts.values())} devices)", expanded=True):
+                        col1, col2, col3, col4 = st.columns(4)
+                        with col1:
+                            st.metric("✅ 온라인", counts["online"])
+                        with col2:
+                            st.metric("❌ 오프라인", counts["offline"])
+                        with col3:
+                            st.metric("⚠️ 경고", counts["alerting"])
+                        with col4:
+                            st.metric("😴 비활성", counts["dormant"])
+                        
+                        # Show detailed device list for this network
+                        network_device_list = devices_by_network.get(net_id, [])
+                        if network_device_list:
+                            st.markdown("**📋 디바이스 세부사항:**")
+                            
+                            # System info is collected org-wide in the background; missing fields show N/A
+                            device_details = []
+                            for device in network_device_list:
+                                info = collected_info.get(device.get("serial"), {})
+                                os_version = info.get("firmware", "N/A")
+                                power_status = info.get("power", "N/A")
+                                cpu_usage = f"{info['cpu']:.0f}%" if "cpu" in info else "N/A"
+                                
+                                # Format status with colors for display
+                                status = device.get("status", "Unknown")
+                                if status == "online":
+                                    status_display = "🟢 온라인"
+                                elif status == "offline":
+                                    status_display = "🔴 오프라인"
+                                elif status == "alerting":
+                                    status_display = "🟡 경고"
+                                else:
+                                    status_display = f"⚪ {status}"
+                                
+                                # Format power status with colors
+                                if power_status == "on":
+                                    power_display = "🟢 On"
+                                elif power_status == "off":
+                                    power_display = "🔴 Off"
+                                else:
+                                    power_display = power_status
+                                
+                                device_details.append({
+                                    "번호": len(device_details) + 1,
+                                    "디바이스명": device.get("name", "Unknown"),
+                                    "모델": device.get("model", "N/A"),
+                                    "시리얼": device.get("serial", "N/A"),
+                                    "상태": status_display,
+                                    "MAC": device.get("mac", "N/A"),
+                                    "IP": device.get("lanIp", "N/A"),
+                                    "OS 버전": os_version,
+                                    "전원 상태": power_display,
+                                    "CPU 사용률": cpu_usage
+                                })
+                            
+                            # Create DataFrame and display one page of it
+                            device_df = pd.DataFrame(device_details)
+                            _network_device_table(device_df, network_idx)
+                            
+                            _event_log_download(api_key, network_idx, network_device_list)
+        else:
+            st.warning("⚠️ 선택된 네트워크에서 디바이스를 찾을 수 없습니다.")
+            st.info("💡 네트워크 필터링 과정에서 디바이스가 있는 네트워크만 표시되어야 합니다. 이 메시지가 표시되면 네트워크 필터링을 확인하세요.")
+    
+    # Add comprehensive device status table - MOVED OUTSIDE OF NETWORK LOOP
+    if total_d > 0:
+        st.markdown("---")
+        st.subheader("📊 종합 디바이스 상태 테이블")
+        
+        if filtered:
+            _comprehensive_device_table(_comprehensive_device_frame(filtered, net_map, ctx.org_id), net_map)
+        else:
+            st.info("선택된 네트워크에서 디바이스를 찾을 수 없습니다")
+    else:
+        st.warning("선택된 네트워크에서 디바이스를 찾을 수 없습니다")
+
+
+@st.fragment
+def _event_log_download(api_key, network_idx, network_device_list):
+    """
+    Device picker and event log downloads (one device, or every device as a ZIP) for one
+    network. Runs as a fragment so picking a device or format reruns only this block.
+    """
+    # Add event log download with selectbox for better handling of many devices
+    st.markdown("**📄 이벤트 로그 다운로드:**")
+
+    # Create device options for selectbox
+    device_options = []
+    for i, device in enumerate(network_device_list):
+        device_name = device.get("name", "Unknown")
+        device_serial = device.get("serial", "N/A")
+        device_options.append((f"{i+1}. {device_name} ({device_serial})", i))
+
+    # Get network_id safely
+    network_id = ""
+    if network_device_list:
+        network_id = network_device_list[0].get("networkId", "")
+
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        selected_device_idx = search_select(
+            "디바이스를 선택하세요",
+            [idx for _, idx in device_options],
+            key=f"event_log_select_{network_idx}_{network_id}_{len(network_device_list)}",
+            format_func=lambda x: device_options[x][0],
+            help="이벤트 로그를 다운로드할 디바이스를 선택하세요"
+        )
+    with col2:
+        fmt = st.selectbox("형식", list(EXPORT_FORMATS), format_func=EXPORT_FORMAT_LABELS.get,
+                           key=f"event_log_format_{network_idx}_{network_id}")
+    with col3:
+        st.markdown("&nbsp;")  # 빈 공간 (selectbox 라벨과 같은 높이)
+        compress = st.checkbox("gzip 압축", key=f"event_log_gzip_{network_idx}_{network_id}")
+    if selected_device_idx is None:
+        return
+
+    selected_device = network_device_list[selected_device_idx]
+    device_name = selected_device.get("name", "Unknown")
+    device_serial = selected_device.get("serial", "N/A")
+    product_type = selected_device.get("productType", "")
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    # The log is generated when a button is clicked, streamed from the local event store
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label=f"📥 {device_name} 이벤트 로그",
+            data=lambda: export_device_events(api_key, network_id, device_serial, product_type,
+                                              fmt=fmt, compress=compress),
+            file_name=export_filename(f"{device_name}_{device_serial}_events_{stamp}", fmt, compress),
+            mime=export_mime(fmt, compress),
+            key=f"download_btn_{network_idx}_{device_serial}_{network_id}",
+            help=f"{device_name}의 이벤트 로그 다운로드",
+            on_click="ignore",
+            use_container_width=True
+        )
+    with col2:
+        st.download_button(
+            label=f"📦 전체 디바이스 로그 ({len(network_device_list)}대, ZIP)",
+            data=lambda: export_event_bundle(api_key, network_device_list, fmt=fmt),
+            file_name=f"{network_id}_events_{stamp}.zip",
+            mime="application/zip",
+            key=f"download_bundle_{network_idx}_{network_id}",
+            help="이 네트워크의 모든 디바이스 이벤트 로그를 하나의 ZIP으로 다운로드",
+            on_click="ignore",
+            use_container_width=True
+        )
+
+
+@st.fragment
+def _network_device_table(device_df, network_idx):
+    """
+    One network's device table, paged so large networks only send the visible rows
+    """
+    paged_table(device_df, key=f"network_devices_{network_idx}",
+                search_columns=["디바이스명", "모델", "시리얼", "MAC", "IP"])
+
+
+def _comprehensive_device_frame(filtered, net_map, org_id):
+    """
+    One row per selected device for the comprehensive table. Built in the full run so the
+    fragment's filter/page reruns reuse the same frame (and its table index).
+    """
+    net_names = {net_id: name for name, net_id in net_map.items()}
+    collected_info = system_info(org_id)
+    comprehensive_devices = []
+    for device in filtered:
+        network_name = net_names.get(device["networkId"], "Unknown")
+        comprehensive_devices.append({
+            "네트워크": network_name,
+            "디바이스명": device.get("name", "Unknown"),
+            "모델": device.get("model", "N/A"),
+            "상태": device.get("status", "Unknown"),
+            "시리얼": device.get("serial", "N/A"),
+            "MAC": device.get("mac", "N/A"),
+            "IP": device.get("lanIp", "N/A"),
+            "펌웨어": collected_info.get(device.get("serial"), {}).get("firmware") or device.get("firmware", "N/A"),
+            "마지막 확인": device.get("lastReportedAt", "N/A")
+        })
+
+    return pd.DataFrame(comprehensive_devices)
+
+
+@st.fragment
+def _comprehensive_device_table(comprehensive_df, net_map):
+    """
+    Comprehensive device table with status/network filters. Runs as a fragment so
+    changing a filter reruns only this table.
+    """
+    # Add status-based filtering
+    col1, col2 = st.columns(2)
+    with col1:
+        status_filter = st.selectbox("상태별 필터", ["전체", "online", "offline", "alerting", "dormant"], key="comprehensive_status_filter")
+    with col2:
+        network_filter = st.selectbox("네트워크별 필터", ["전체"] + list(net_map.keys()), key="comprehensive_network_filter")
+
+    # Filters, search and sorting run on the server; only the visible page is sent
+    filtered_df = paged_table(comprehensive_df, key="comprehensive_devices",
+                              search_columns=["디바이스명", "모델", "시리얼", "MAC", "IP"],
+                              filters={"상태": status_filter, "네트워크": network_filter})
+
+    # Summary statistics
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("총 디바이스", len(filtered_df))
+    with col2:
+        st.metric("온라인", len(filtered_df[filtered_df["상태"] == "online"]))
+    with col3:
+        st.metric("오프라인", len(filtered_df[filtered_df["상태"] == "offline"]))
+    with col4:
+        st.metric("경고", len(filtered_df[filtered_df["상태"] == "alerting"]))
+    with col5:
+        st.metric("비활성", len(filtered_df[filtered_df["상태"] == "dormant"]))
+
+
+def _wan_health(health, sel_nets, net_names):
+    """
+    Uplink count, degraded uplinks and the worst uplinks by 95th percentile loss
+    """
+    health = health[health["networkId"].isin(sel_nets)]
+    if health.empty:
+        return
+    st.markdown("---")
+    st.subheader("🌐 WAN 업링크 상태")
+    degraded = (health["lossP95"] >= LOSS_WARN) | (health["latencyP95"] >= LATENCY_WARN)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("업링크", len(health))
+    col2.metric("성능 저하", int(degraded.sum()))
+    col3.metric("손실 p95 (중앙값)", f"{health['lossP95'].median():.1f}%")
+    col4.metric("지연 p95 (중앙값)", f"{health['latencyP95'].median():.0f}ms")
+
+    table = health.head(10).assign(network=health["networkId"].map(net_names).fillna(health["networkId"]))
+    st.dataframe(
+        table,
+        use_container_width=True,
+        hide_index=True,
+        column_order=["network", "serial", "uplink", "lossP50", "lossP95", "latencyP50", "latencyP95", "samples"],
+        column_config={
+            "network": "네트워크",
+            "serial": "시리얼",
+            "uplink": "업링크",
+            "lossP50": st.column_config.NumberColumn("손실 p50 (%)", format="%.1f"),
+            "lossP95": st.column_config.NumberColumn("손실 p95 (%)", format="%.1f"),
+            "latencyP50": st.column_config.NumberColumn("지연 p50 (ms)", format="%.0f"),
+            "latencyP95": st.column_config.NumberColumn("지연 p95 (ms)", format="%.0f"),
+            "samples": st.column_config.NumberColumn("샘플"),
+        },
+    )
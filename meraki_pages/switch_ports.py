@@ -0,0 +1,196 @@
+# 스위치 포트 page
+# Switch port status across the organization
+import streamlit as st
+
+from meraki_data import load_switch_ports
+from meraki_lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+DATA = ()
+
+# Status text -> colour marker shown in front of it in the port table
+STATUS_ICONS = {
+    **dict.fromkeys(["connected", "up", "active"], "🟢"),
+    **dict.fromkeys(["disconnected", "down", "error", "failed"], "🔴"),
+    **dict.fromkeys(["warning", "degraded", "partial"], "🟡"),
+    **dict.fromkeys(["disabled", "dormant", "inactive"], "⚫"),
+}
+PORT_FIELDS = ["portId", "status", "speed", "duplex", "enabled", "description", "type", "vlan", "stpGuard",
+               "deviceName"]
+PORT_COLUMNS = {
+    "Enabled": st.column_config.CheckboxColumn("Enabled"),
+    "VLAN": st.column_config.NumberColumn("VLAN", format="%d"),
+}
+
+
+def port_status_frame(ports):
+    """
+    Port table for one switch built with column operations (one frame, no per-port loop)
+    """
+    df = pd.DataFrame.from_records(ports, columns=PORT_FIELDS)
+    status = df["status"].fillna("N/A").astype(str)
+    speed = df["speed"].astype("string")
+    return pd.DataFrame({
+        "Port ID": df["portId"].fillna("N/A"),
+        "Status": status.str.lower().map(STATUS_ICONS).fillna("⚪") + " " + status,
+        "Speed": speed.where(speed.notna() & (speed != ""), "Null"),
+        "Duplex": df["duplex"].fillna("N/A"),
+        "Enabled": df["enabled"],
+        "Description": df["description"].fillna("N/A"),
+        "Type": df["type"].fillna("N/A"),
+        "VLAN": pd.to_numeric(df["vlan"], errors="coerce").astype("Int64"),
+        "STP Guard": df["stpGuard"].fillna("N/A"),
+        "Device Name": df["deviceName"].fillna("N/A"),
+    })
+
+
+def render(ctx):
+    api_key = ctx.api_key
+    org_id = ctx.org_id
+    enable_switch_ports = ctx.enable_switch_ports
+
+    st.header("🔌 스위치 포트 분석 (포트 상태,설정값) ")
+    
+    if not enable_switch_ports:
+        st.info("🔧 Enable Switch Port Analysis in the sidebar to view port data")
+    else:
+        sw_data = load_switch_ports(api_key, org_id)
+        
+        if not sw_data:
+            st.warning("⚠️ No switch data available")
+        else:
+            _switch_port_panel(sw_data)
+
+
+@st.fragment
+def _switch_port_panel(sw_data):
+    """
+    Switch selector, port metrics and the filterable port table. Runs as a fragment so
+    picking another switch or typing a filter reruns only this panel, not the page.
+    """
+    # Switch selection with better labels
+    switch_options = []
+    for switch_id, switch_ports in sw_data.items():
+        # Try to get a meaningful name from the first port's device info
+        if switch_ports and len(switch_ports) > 0:
+            first_port = switch_ports[0]
+            device_name = first_port.get("deviceName", "")
+            description = first_port.get("description", "")
+
+            if device_name and device_name != "N/A":
+                label = f"{device_name} ({switch_id})"
+            elif description and description != "N/A":
+                label = f"{description} ({switch_id})"
+            else:
+                label = f"Switch {switch_id}"
+        else:
+            label = f"Switch {switch_id}"
+
+        switch_options.append((label, switch_id))
+
+    # Create a mapping for display
+    switch_display_map = {label: switch_id for label, switch_id in switch_options}
+
+    if len(switch_options) > 1:
+        sel_sw_label = st.selectbox("Select Switch", list(switch_display_map.keys()), key="switch_selection")
+        sel_sw = switch_display_map[sel_sw_label]
+    else:
+        # If only one switch, show it directly
+        sel_sw_label = switch_options[0][0]
+        sel_sw = switch_options[0][1]
+
+    ports = sw_data[sel_sw]
+
+    if not ports:
+        st.info(f"스위치의 포트 정보를 가져올수 없습니다. {sel_sw}")
+    else:
+        port_analysis_df = port_status_frame(ports)
+
+        # Port metrics
+        status_counts = port_analysis_df["Status"].str.split(" ", n=1).str[1].str.lower().value_counts()
+        total_ports = len(port_analysis_df)
+        connected_ports = int(status_counts.get("connected", 0))
+        disconnected_ports = int(status_counts.get("disconnected", 0))
+        error_ports = int(status_counts.get("error", 0) + status_counts.get("alerting", 0))
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("🔌 총 포트", total_ports)
+        with col2:
+            st.metric("✅ 연결됨", f"{connected_ports}/{total_ports}")
+        with col3:
+            st.metric("❌ 연결 끊김", f"{disconnected_ports}/{total_ports}")
+        with col4:
+            st.metric("⚠️ 오류", f"{error_ports}/{total_ports}")
+
+        st.markdown("---")
+
+        # Port status visualization - HIDDEN (숨김 처리)
+        # col1, col2 = st.columns(2)
+
+
+
+
+        # Comprehensive Switch Port Analysis Table
+        st.subheader("📊 포트 상세 설정정보")
+
+        if ports:
+            # Add filtering options for the comprehensive table
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                min_ports = st.number_input("Minimum Ports per Status", min_value=1, value=1, step=1, key="port_min_filter")
+            with col2:
+                status_search = st.text_input("Search by Status", placeholder="e.g., Connected, Error", key="port_status_search")
+            with col3:
+                speed_search = st.text_input("Search by Speed", placeholder="e.g., 1000, 100", key="port_speed_search")
+
+            # Apply filters to comprehensive table
+            filtered_analysis = port_analysis_df.copy()
+
+            if status_search:
+                filtered_analysis = filtered_analysis[filtered_analysis["Status"].str.contains(status_search, case=False, na=False, regex=False)]
+
+            if speed_search:
+                filtered_analysis = filtered_analysis[filtered_analysis["Speed"].str.contains(speed_search, case=False, na=False, regex=False)]
+
+            if min_ports > 1:
+                # Drop statuses shared by fewer than min_ports of the remaining ports
+                status_sizes = filtered_analysis["Status"].map(filtered_analysis["Status"].value_counts())
+                filtered_analysis = filtered_analysis[status_sizes >= min_ports]
+
+            # Display filtered comprehensive table; status colour comes from the marker in the text
+            if len(filtered_analysis) > 0:
+                st.dataframe(filtered_analysis, use_container_width=True, hide_index=True, column_config=PORT_COLUMNS)
+
+                # Summary metrics for comprehensive analysis - HIDDEN (숨김 처리)
+                # col1, col2, col3, col4 = st.columns(4)
+                # with col1:
+                #     st.metric("Total Ports", len(filtered_analysis))
+                # with col2:
+                #     connected_count = len(filtered_analysis[filtered_analysis["Status"] == "Connected"])
+                #     st.metric("Connected", connected_count)
+                # with col3:
+                #     error_count = len(filtered_analysis[filtered_analysis["Status"] == "Error"])
+                #     st.metric("Errors", error_count)
+                # with col4:
+                #     unique_speeds = filtered_analysis["Speed"].nunique()
+                #     st.metric("Speed Types", unique_speeds)
+
+                # Port status summary by speed - HIDDEN (숨김 처리)
+                # st.markdown("**📈 Port Status by Speed:**")
+                # speed_status_summary = filtered_analysis.groupby(["Speed", "Status"]).size().unstack(fill_value=0)
+                # st.dataframe(speed_status_summary, use_container_width=True)
+
+            else:
+                st.info("No ports match the comprehensive analysis filters")
+        else:
+            st.info("No port data available for comprehensive analysis")
+
+
+def prefetch(ctx):
+    """
+    Warm the switch port cache render() reads
+    """
+    if ctx.enable_switch_ports:
+        load_switch_ports(ctx.api_key, ctx.org_id)
@@ -0,0 +1,676 @@
+# 트래픽 분석 page
+# Traffic analysis: per-network traffic, top applications and usage charts
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from meraki_anomaly import ANOMALY_WARMUP, ANOMALY_Z_THRESHOLD, NETWORK_TOTAL, baseline_progress, recent_anomalies
+from meraki_data import (SHOW_DEBUG_INFO, aggregate_cross_network_traffic, combine_traffic_data,
+                         load_network_clients_overview, load_traffic, load_traffic_analysis_data_parallel,
+                         parallel_api_calls)
+from meraki_downsample import downsample
+from meraki_lazy import lazy_import
+from meraki_logging import get_logger
+
+log = get_logger("pages")
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+
+DATA = ("devices",)
+
+APP_DETAIL_COLUMNS = {
+    "Traffic (MB)": st.column_config.NumberColumn("Traffic (MB)", format="%.1f"),
+    "Clients": st.column_config.NumberColumn("Clients", format="%d"),
+    "Upload (MB)": st.column_config.NumberColumn("Upload (MB)", format="%.1f"),
+    "Download (MB)": st.column_config.NumberColumn("Download (MB)", format="%.1f"),
+}
+
+
+def top_apps_summary(top_apps, total_traffic_mb):
+    """
+    Numbered markdown list "name: MB (share %)" built with column string operations
+    """
+    share = top_apps["TotalMB"] / total_traffic_mb * 100 if total_traffic_mb > 0 else top_apps["TotalMB"] * 0
+    rank = pd.Series(range(1, len(top_apps) + 1), index=top_apps.index).astype(str)
+    lines = (rank + ". **" + top_apps["application"].astype(str) + "**: "
+             + top_apps["TotalMB"].map("{:.1f}".format) + "MB (" + share.map("{:.1f}".format) + "%)")
+    return "  \n".join(lines)
+
+
+def app_details_frame(top_apps):
+    """
+    Application details table; values stay numeric and are formatted by APP_DETAIL_COLUMNS
+    """
+    return pd.DataFrame({
+        "Application": top_apps["application"].astype(str) + " (" + top_apps["TotalMB"].map("{:.1f}".format) + "MB)",
+        "Traffic (MB)": top_apps["TotalMB"],
+        "Clients": top_apps["numClients"],
+        "Upload (MB)": top_apps["sent"] / (1024 * 1024),
+        "Download (MB)": top_apps["recv"] / (1024 * 1024),
+    })
+
+
+def render(ctx):
+    api_key = ctx.api_key
+    sel_nets = ctx.sel_nets
+    net_map = ctx.net_map
+    timespan = ctx.timespan
+    resolution = ctx.resolution
+    filtered = ctx.devices
+    enable_traffic = ctx.enable_traffic
+
+    st.header("🌐 트래픽 분석 (네트워크 트래픽 패턴 및 애플리케이션 사용량)")
+    
+    if not enable_traffic:
+        st.info("🔧 사이드바에서 트래픽 분석을 활성화하여 트래픽 데이터를 확인하세요")
+    else:
+        # Load traffic data only when user visits this page (on-demand loading)
+        
+        with st.spinner("트래픽 데이터 로딩 중..."):
+            traffic_data = load_traffic_analysis_data_parallel(api_key, sel_nets, timespan, resolution)
+        
+        log.debug("Traffic analysis data loaded in %.2f seconds", traffic_data['load_time'])
+        
+        for net_id in sel_nets:
+            # Find the display name for this network ID
+            display_name = next((name for name, nid in net_map.items() if nid == net_id), f"Network_{net_id}")
+            
+            # Extract data from parallel results
+            network_data = traffic_data['network_data'].get(net_id, {})
+            comprehensive_traffic = network_data.get('traffic', {})
+            bandwidth_data = network_data.get('bandwidth', [])
+            clients_data = network_data.get('clients', [])
+            
+            # Check if we have any traffic data
+            has_traffic_data = any(data for data in comprehensive_traffic.values()) if comprehensive_traffic else False
+            
+            if not has_traffic_data and not bandwidth_data:
+                # Skip networks with no data instead of showing warning
+                continue
+            
+            # Get time range information for display
+            timespan_hours = timespan / 3600 if timespan else 1
+            time_range_text = f"{timespan_hours:.1f}시간" if timespan_hours < 24 else f"{timespan_hours/24:.1f}일"
+            
+            # Create a visually distinct card for each network
+            st.markdown("""
+            <div style="
+                height: 3px;
+                background: linear-gradient(90deg, #667eea, #764ba2, #667eea);
+                margin: 2rem 0;
+                border-radius: 2px;
+            "></div>
+            """, unsafe_allow_html=True)
+            
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                padding: 1.5rem;
+                border-radius: 15px;
+                margin: 1rem 0;
+                box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+                border: 1px solid rgba(255,255,255,0.2);
+            ">
+                <h2 style="
+                    color: white;
+                    margin: 0 0 0.5rem 0;
+                    font-size: 1.8rem;
+                    text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+                ">🌐 {display_name}</h2>
+                <p style="
+                    color: rgba(255,255,255,0.9);
+                    margin: 0;
+                    font-size: 1.1rem;
+                ">종합 트래픽 분석 (모든 디바이스 타입) • {time_range_text} 기준</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Create content container for better organization
+            with st.container():
+                
+                # Display device type breakdown
+                if comprehensive_traffic:
+                    st.markdown("### 📊 디바이스 타입별 데이터 현황")
+                col1, col2, col3, col4 = st.columns(4)
+                
+                device_type_names = {
+                    'combined': '🔄 통합',
+                    'wireless': '📶 무선',
+                    'switch': '🔌 스위치', 
+                    'appliance': '🛡️ 어플라이언스'
+                }
+                
+                for i, (device_type, data) in enumerate(comprehensive_traffic.items()):
+                    with [col1, col2, col3, col4][i]:
+                        app_count = len(data) if data else 0
+                        st.metric(
+                            device_type_names.get(device_type, device_type.upper()),
+                            f"{app_count}",
+                            help=f"{device_type} 디바이스 타입에서 감지된 애플리케이션 수"
+                        )
+            
+            # Combine all traffic data from all device types
+            all_apps = combine_traffic_data(comprehensive_traffic)
+            top_apps = pd.DataFrame()
+            
+            # Initialize traffic metrics
+            total_traffic_mb = 0
+            total_traffic_gb = 0
+            total_downstream_bytes = 0
+            total_upstream_bytes = 0
+            total_bytes = 0
+            
+            if not all_apps.empty:
+                # Convert to MB for display
+                all_apps["sent_MB"] = all_apps["sent"] / (1024 * 1024)
+                all_apps["recv_MB"] = all_apps["recv"] / (1024 * 1024)
+                all_apps["TotalMB"] = all_apps["sent_MB"] + all_apps["recv_MB"]
+                
+                # Sort by TotalMB descending and get top 15 for display only
+                top_apps = all_apps.nlargest(15, "TotalMB").reset_index(drop=True)
+                
+                # Calculate total traffic from combined data
+                total_sent_bytes = all_apps["sent"].sum()
+                total_recv_bytes = all_apps["recv"].sum()
+                total_bytes = total_sent_bytes + total_recv_bytes
+                total_traffic_mb = total_bytes / (1024 * 1024)
+                total_traffic_gb = total_traffic_mb / 1024
+                total_downstream_bytes = total_recv_bytes
+                total_upstream_bytes = total_sent_bytes
+            else:
+                # Show detailed information when no data is available
+                st.warning(f"⚠️ {display_name}에서 애플리케이션 트래픽 데이터를 찾을 수 없습니다.")
+                # Fallback to bandwidth data if no traffic data
+                if bandwidth_data:
+                    df = pd.DataFrame(bandwidth_data)
+                    if len(df) > 0 and 'downstream' in df.columns and 'upstream' in df.columns:
+                        # Convert Mbps to bytes (assuming Mbps values)
+                        df["downstream_bytes"] = df["downstream"] * 1024 * 1024 / 8
+                        df["upstream_bytes"] = df["upstream"] * 1024 * 1024 / 8
+                        df["total_bytes"] = df["downstream_bytes"] + df["upstream_bytes"]
+                        
+                        total_downstream_bytes = df["downstream_bytes"].sum()
+                        total_upstream_bytes = df["upstream_bytes"].sum()
+                        total_bytes = total_downstream_bytes + total_upstream_bytes
+                        total_traffic_mb = total_bytes / (1024 * 1024)
+                        total_traffic_gb = total_traffic_mb / 1024
+                else:
+                    st.error("❌ 대체 데이터 소스도 사용할 수 없습니다.")
+                    continue
+                
+                # Enhanced metrics display with time range information
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("📊 총 트래픽", f"{total_traffic_mb:.2f} MB", 
+                             help=f"지난 {time_range_text} 동안의 총 트래픽 볼륨 (업로드 + 다운로드)")
+                    st.metric("📊 총 트래픽 (GB)", f"{total_traffic_gb:.3f} GB", 
+                             help=f"지난 {time_range_text} 동안의 총 트래픽 볼륨 (GB 단위)")
+            
+            with col2:
+                upload_mb = total_upstream_bytes / (1024 * 1024)
+                download_mb = total_downstream_bytes / (1024 * 1024)
+                st.metric("📤 총 업로드", f"{upload_mb:.2f} MB", 
+                             help=f"지난 {time_range_text} 동안의 총 업로드 트래픽")
+                st.metric("📥 총 다운로드", f"{download_mb:.2f} MB", 
+                             help=f"지난 {time_range_text} 동안의 총 다운로드 트래픽")
+            
+            with col3:
+                # Get accurate client count using multiple methods
+                total_client_count = 0
+                client_count_source = "N/A"
+                
+                # Method 1: Try to get from clients overview API (most accurate)
+                try:
+                    clients_overview = load_network_clients_overview(api_key, net_id)
+                    if clients_overview and 'counts' in clients_overview:
+                        counts = clients_overview['counts']
+                        total_client_count = counts.get('total', 0)
+                        client_count_source = "Overview API"
+                    elif clients_overview and 'total' in clients_overview:
+                        total_client_count = clients_overview['total']
+                        client_count_source = "Overview API"
+                except:
+                    pass
+                
+                # Method 2: Fallback to actual connected clients count
+                if total_client_count == 0 and clients_data:
+                    total_client_count = len(clients_data)
+                    client_count_source = "Connected Clients"
+                
+                # Method 3: Fallback to application data
+                if total_client_count == 0 and len(all_apps) > 0:
+                    total_client_count = all_apps["numClients"].max()  # Use max instead of sum
+                    client_count_source = "Application Data (Max)"
+                
+                st.metric("👥 총 클라이언트", f"{total_client_count}", 
+                         help=f"클라이언트 수 ({client_count_source}) - 최대 5000개까지 로드")
+            
+            with col4:
+                # Get total application count (no limit)
+                total_applications = len(all_apps) if len(all_apps) > 0 else 0
+                st.metric("📱 총 애플리케이션", f"{total_applications}", 
+                         help=f"지난 {time_range_text} 동안 감지된 모든 애플리케이션 수")
+                
+            # Enhanced traffic breakdown with time range context
+            st.markdown("---")
+            st.subheader(f"📊 트래픽 상세 분석 ({time_range_text} 기준)")
+            
+            # Time range context box
+            st.info(f"⏰ **분석 기간**: 지난 {time_range_text} | **데이터 포인트**: {len(all_apps) if not all_apps.empty else 0}개 | **네트워크**: {display_name}")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**📈 트래픽 분포:**")
+                upload_percentage = (total_upstream_bytes / total_bytes * 100) if total_bytes > 0 else 0
+                download_percentage = (total_downstream_bytes / total_bytes * 100) if total_bytes > 0 else 0
+                upload_mb = total_upstream_bytes / (1024 * 1024)
+                download_mb = total_downstream_bytes / (1024 * 1024)
+                st.write(f"• 업로드: {upload_mb:.2f} MB ({upload_percentage:.1f}%)")
+                st.write(f"• 다운로드: {download_mb:.2f} MB ({download_percentage:.1f}%)")
+                st.write(f"• 총 트래픽: {total_traffic_mb:.2f} MB")
+                st.write(f"• 시간당 평균: {total_traffic_mb / timespan_hours:.2f} MB/h")
+                
+            with col2:
+                st.markdown("**📊 데이터 품질:**")
+                st.write(f"• 데이터 포인트: {len(all_apps) if not all_apps.empty else 0}개")
+                st.write(f"• 애플리케이션 수: {total_applications}개")
+                st.write(f"• 평균 앱당 트래픽: {total_traffic_mb / total_applications:.2f} MB" if total_applications > 0 else "• 평균 앱당 트래픽: N/A")
+                st.write(f"• 클라이언트당 평균: {total_traffic_mb / total_client_count:.2f} MB" if total_client_count > 0 else "• 클라이언트당 평균: N/A")
+            
+            st.markdown("---")
+            
+            # Bandwidth over time from the stored series, LTTB-downsampled to the chart point budget
+            if bandwidth_data:
+                bw = pd.DataFrame(bandwidth_data)
+                if {'ts', 'upstream', 'downstream'} <= set(bw.columns):
+                    st.subheader(f"📈 대역폭 추이 ({time_range_text} 기준)")
+                    bw['ts'] = pd.to_datetime(bw['ts'])
+                    chart = downsample(bw, 'ts', ['downstream', 'upstream'])
+                    fig = px.line(chart, x='ts', y=['downstream', 'upstream'], height=300,
+                                  labels={'ts': '시간', 'value': 'Kbps', 'variable': '방향'})
+                    fig.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                                      margin=dict(t=20))
+                    st.plotly_chart(fig, use_container_width=True, key=f"bandwidth_chart_{net_id}")
+                    if len(chart) < len(bw):
+                        st.caption(f"{len(bw):,}개 포인트 중 형태를 유지하는 {len(chart):,}개를 표시합니다")
+                    st.markdown("---")
+            
+            # Enhanced traffic visualization with time range
+            st.subheader(f"📊 애플리케이션 트래픽 개요 ({time_range_text} 기준)")
+            
+            # Show comprehensive application statistics
+            if len(all_apps) > 0:
+                st.info(f"📊 **전체 통계**: {len(all_apps)}개 애플리케이션, 총 {total_client_count}명 클라이언트")
+                
+                # Show top applications chart
+                if len(top_apps) > 0:
+                    try:
+                        # Validate data before creating chart
+                        if not top_apps.empty and 'TotalMB' in top_apps.columns and 'application' in top_apps.columns:
+                            # Create enhanced horizontal bar chart with better formatting
+                            fig = px.bar(
+                                top_apps,
+                                x="TotalMB",
+                                y="application",
+                                orientation="h",
+                                height=max(400, len(top_apps) * 30),  # Dynamic height based on number of apps
+                                title=f"상위 {len(top_apps)}개 애플리케이션 트래픽 - {display_name} ({time_range_text})",
+                                color="TotalMB",
+                                color_continuous_scale="viridis",
+                                text="TotalMB"
+                            )
+                            
+                            # Format text labels
+                            fig.update_traces(
+                                texttemplate='%{text:.1f}MB',
+                                textposition='outside',
+                                hovertemplate='<b>%{y}</b><br>트래픽: %{x:.2f}MB<br>클라이언트: %{customdata[0]}<extra></extra>',
+                                customdata=top_apps[['numClients']].values
+                            )
+                            
+                            fig.update_layout(
+                                xaxis_title="트래픽 볼륨 (MB)",
+                                yaxis_title="애플리케이션",
+                                showlegend=False,
+                                plot_bgcolor='rgba(0,0,0,0)',
+                                paper_bgcolor='rgba(0,0,0,0)',
+                                margin=dict(l=200)  # More space for app names
+                            )
+                            fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
+                            fig.update_yaxes(showgrid=False)
+                            st.plotly_chart(fig, use_container_width=True, key=f"traffic_chart_{net_id}")
+                        else:
+                            st.warning("차트 생성에 필요한 데이터가 부족합니다.")
+                    except Exception:
+                        # Hide chart section when error occurs
+                        pass
+                
+                # Additional traffic insights with time context
+                st.markdown("---")
+                st.subheader(f"📈 트래픽 인사이트 ({time_range_text} 기준)")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("**🔥 상위 5개 애플리케이션:**")
+                    st.markdown(top_apps_summary(top_apps.head(5), total_traffic_mb))
+                
+                with col2:
+                    st.markdown("**📊 전체 트래픽 통계:**")
+                    if len(all_apps) > 0:
+                        st.write(f"• 총 애플리케이션: {len(all_apps)}개")
+                        st.write(f"• 최대 앱 트래픽: {all_apps['TotalMB'].max():.1f}MB")
+                        st.write(f"• 평균 앱 트래픽: {all_apps['TotalMB'].mean():.1f}MB")
+                        st.write(f"• 중간값 앱 트래픽: {all_apps['TotalMB'].median():.1f}MB")
+                        st.write(f"• 상위 5개 앱 비율: {(top_apps.head(5)['TotalMB'].sum() / total_traffic_mb * 100):.1f}%" if total_traffic_mb > 0 else "• 상위 5개 앱 비율: 0%")
+                        st.write(f"• 시간당 평균: {total_traffic_mb / timespan_hours:.2f} MB/h")
+                
+                # Show ALL applications table
+                st.markdown("---")
+                st.subheader(f"📋 모든 애플리케이션 목록 ({len(all_apps)}개)")
+                
+                if len(all_apps) > 0:
+                    # Create comprehensive display table
+                    display_apps = all_apps.copy()
+                    display_apps['Percentage'] = (display_apps['TotalMB'] / total_traffic_mb * 100).round(2) if total_traffic_mb > 0 else 0
+                    display_apps = display_apps.sort_values('TotalMB', ascending=False)
+                    
+                    # Format the display
+                    display_apps['TotalMB'] = display_apps['TotalMB'].round(2)
+                    display_apps['numClients'] = display_apps['numClients'].astype(int)
+                    
+                    st.dataframe(
+                        display_apps[['application', 'TotalMB', 'numClients', 'deviceType', 'Percentage']].rename(columns={
+                            'application': '애플리케이션',
+                            'TotalMB': '트래픽 (MB)',
+                            'numClients': '클라이언트 수',
+                            'deviceType': '디바이스 타입',
+                            'Percentage': '비율 (%)'
+                        }),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                
+                # Close the content container for this network
+                st.markdown("</div>", unsafe_allow_html=True)
+                
+                # Add separator line after each network
+                st.markdown("""
+                <div style="
+                    height: 2px;
+                    background: linear-gradient(90deg, transparent, #667eea, transparent);
+                    margin: 2rem 0;
+                "></div>
+                """, unsafe_allow_html=True)
+                
+                # Enhanced debug information with time context
+                if SHOW_DEBUG_INFO:
+                    with st.expander(f"🔍 Debug: Traffic Calculation & API Data ({time_range_text} 기준)", expanded=True):
+                        st.write("**📊 트래픽 계산 상세:**")
+                        st.write(f"- 분석 기간: {time_range_text} ({timespan}초)")
+                        st.write("- 사용된 API: Network Traffic + Network Bandwidth")
+                        st.write(f"- Traffic 데이터 포인트: {len(traffic_data) if traffic_data else 0}개")
+                        st.write(f"- Bandwidth 데이터 포인트: {len(bandwidth_data) if bandwidth_data else 0}개")
+                        st.write(f"- 클라이언트 데이터: {len(clients_data) if clients_data else 0}개")
+                        st.write(f"- 총 업로드 바이트: {total_upstream_bytes:,} bytes")
+                        st.write(f"- 총 다운로드 바이트: {total_downstream_bytes:,} bytes")
+                        st.write(f"- 총 바이트: {total_bytes:,} bytes")
+                        st.write(f"- 총 트래픽 (MB): {total_traffic_mb:.2f} MB")
+                        st.write(f"- 총 트래픽 (GB): {total_traffic_gb:.3f} GB")
+                        st.write(f"- 시간당 평균: {total_traffic_mb / timespan_hours:.2f} MB/h")
+                        st.write(f"- 총 클라이언트: {total_client_count}")
+                        st.write(f"- 총 애플리케이션: {total_applications}")
+                        st.write(f"- 표시된 애플리케이션: {len(top_apps)}개 (상위 15개)")
+                        
+                        st.write("**📈 전체 데이터 품질 검증:**")
+                        if len(all_apps) > 0:
+                            st.write(f"- 평균 앱당 트래픽: {total_traffic_mb / len(all_apps):.2f} MB")
+                            st.write(f"- 최대 앱 트래픽: {all_apps['TotalMB'].max():.2f} MB")
+                            st.write(f"- 최소 앱 트래픽: {all_apps['TotalMB'].min():.2f} MB")
+                            st.write(f"- 총 클라이언트 수 (모든 앱): {all_apps['numClients'].sum()}")
+                        st.write(f"- 업로드 비율: {upload_percentage:.1f}%")
+                        st.write(f"- 다운로드 비율: {download_percentage:.1f}%")
+                        
+                        st.write("**🔍 디바이스 타입별 API 데이터:**")
+                        if comprehensive_traffic:
+                            for device_type, data in comprehensive_traffic.items():
+                                if data:
+                                    st.write(f"**{device_type.upper()} ({len(data)}):**")
+                                    st.json(data[0] if len(data) > 0 else {})
+                                    st.write("---")
+                        
+                        st.write("**🔍 통합된 데이터 샘플:**")
+                        if not all_apps.empty:
+                            st.json(all_apps.iloc[0].to_dict())
+                        
+                        st.write("**📋 처리된 DataFrame 샘플:**")
+                        st.dataframe(df.head())
+                        
+                        st.write("**📊 상위 애플리케이션 상세:**")
+                        st.dataframe(top_apps.head(10))
+            else:
+                st.info("No application data available")
+            
+            # Detailed traffic table with intuitive format
+            st.markdown("---")
+            st.subheader("🔍 Application Traffic Details")
+            
+            if len(top_apps) > 0:
+                st.dataframe(
+                    app_details_frame(top_apps),
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config=APP_DETAIL_COLUMNS
+                )
+                
+                # Show raw data for debugging
+                if SHOW_DEBUG_INFO:
+                    with st.expander("🔍 Debug: Raw Application Data", expanded=True):
+                        st.write("**Top Applications DataFrame:**")
+                        st.dataframe(top_apps)
+                        
+                        st.write("**Data Processing Steps:**")
+                        st.write("1. Group by application name")
+                        st.write("2. Sum TotalMB (sent + received)")
+                        st.write("3. Take max numClients per application")
+                        st.write("4. Sort by TotalMB descending")
+            else:
+                st.info("No detailed traffic data available")
+                
+                # Close the content container for this network
+                st.markdown("</div>", unsafe_allow_html=True)
+        
+        # Add comprehensive traffic analysis table across all networks
+        st.markdown("---")
+        st.subheader("🌐 Cross-Network Traffic Analysis")
+        
+        # Every network's traffic in one parallel batch, aggregated in a single groupby
+        names = {nid: name for name, nid in net_map.items()}
+        results = parallel_api_calls([{'key': net_id, 'func': load_traffic, 'args': [api_key, net_id, timespan]}
+                                      for net_id in sel_nets])
+        comprehensive_traffic = aggregate_cross_network_traffic(
+            {names.get(net_id, f"Network_{net_id}"): results.get(net_id) for net_id in sel_nets}
+        )
+        
+        if not comprehensive_traffic.empty:
+            _cross_network_table(comprehensive_traffic)
+        else:
+            st.info("네트워크 전체에서 사용 가능한 트래픽 데이터가 없습니다")
+            
+    # Advanced Analytics and Insights section removed - functionality not implemented
+    
+# Traffic trends analysis section removed
+    
+# Application insights section removed
+    
+    # Deviations from each network's and application's usual traffic for the hour of day
+    st.markdown("---")
+    anomalies = _traffic_anomalies(sel_nets, net_map)
+    
+    # Performance optimization
+    if st.session_state.get('show_performance_optimization', False):
+        st.markdown("---")
+        st.subheader("⚡ 성능 최적화 제안")
+        
+        # Real-time performance metrics
+        st.markdown("**📈 실시간 성능 지표:**")
+        
+        # Calculate real performance metrics
+        total_devices = len(filtered)
+        online_devices = len([d for d in filtered if d.get('status') == 'online'])
+        offline_devices = len([d for d in filtered if d.get('status') == 'offline'])
+        alerting_devices = len([d for d in filtered if d.get('status') == 'alerting'])
+        
+        # Calculate network efficiency
+        if total_devices > 0:
+            network_efficiency = (online_devices / total_devices) * 100
+        else:
+            network_efficiency = 0
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("네트워크 효율성", f"{network_efficiency:.1f}%", 
+                     delta=f"{network_efficiency-85:.1f}%" if network_efficiency > 0 else None,
+                     help="온라인 디바이스 비율")
+        with col2:
+            st.metric("트래픽 이상 징후", f"{len(anomalies)}건",
+                     help=f"지난 24시간 동안 시간대별 기준선 대비 |z| ≥ {ANOMALY_Z_THRESHOLD:g}인 네트워크/애플리케이션")
+        with col3:
+            device_health = ((total_devices - offline_devices - alerting_devices) / total_devices * 100) if total_devices > 0 else 0
+            st.metric("디바이스 상태", f"{device_health:.1f}%", 
+                     delta=f"{device_health-98:.1f}%" if device_health > 0 else None,
+                     help="정상 작동 디바이스 비율")
+        with col4:
+            # Security score based on device status
+            security_score = max(0, 100 - (offline_devices + alerting_devices) * 10)
+            st.metric("보안 점수", f"{security_score:.1f}%", 
+                     delta=f"{security_score-92:.1f}%" if security_score > 0 else None,
+                     help="디바이스 상태 기반 보안 점수")
+            
+            st.markdown("---")
+
+
+def _traffic_anomalies(sel_nets, net_map):
+    """
+    Traffic anomalies of the selected networks over the last 24 hours (EWMA baseline per hour
+    of day). Returns the anomalies shown.
+    """
+    st.subheader("🚨 트래픽 이상 징후 (지난 24시간)")
+    anomalies = recent_anomalies(sel_nets, time.time() - 86400)
+    observations = baseline_progress(sel_nets)
+    if observations < ANOMALY_WARMUP:
+        st.info(f"⏳ 기준선 수집 중입니다 - 시간대별 관측 {observations}/{ANOMALY_WARMUP}회. "
+                "트래픽 분석 페이지에 표시된 네트워크는 매시간 수집됩니다.")
+    elif not anomalies:
+        st.success("✅ 모든 네트워크와 애플리케이션의 트래픽이 평소 범위 안에 있습니다")
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("이상 징후", f"{len(anomalies)}건",
+                      help=f"시간대별 기준선 대비 |z| ≥ {ANOMALY_Z_THRESHOLD:g}인 네트워크/애플리케이션")
+        with col2:
+            st.metric("영향받은 네트워크", f"{len({a['network_id'] for a in anomalies})}개")
+        _anomaly_table(anomalies, net_map)
+    return anomalies
+
+
+def _anomaly_table(anomalies, net_map):
+    """
+    Recent anomalies, strongest first, with the baseline they were measured against
+    """
+    names = {nid: name for name, nid in net_map.items()}
+    table = pd.DataFrame(anomalies)
+    table["network"] = table["network_id"].map(names).fillna(table["network_id"])
+    table["application"] = table["application"].replace({NETWORK_TOTAL: "전체 트래픽"})
+    table["time"] = pd.to_datetime(table["bucket"], unit="s", utc=True).dt.tz_convert(datetime.now().astimezone().tzinfo)
+    table["direction"] = (table["z"] > 0).map({True: "▲ 급증", False: "▼ 급감"})
+    table["value_MB"] = table["value"] / (1024 * 1024)
+    table["baseline_MB"] = table["baseline"] / (1024 * 1024)
+    st.dataframe(
+        table,
+        use_container_width=True,
+        hide_index=True,
+        column_order=["time", "network", "application", "direction", "value_MB", "baseline_MB", "z"],
+        column_config={
+            "time": st.column_config.DatetimeColumn("시간", format="MM-DD HH:mm"),
+            "network": "네트워크",
+            "application": "애플리케이션",
+            "direction": "변화",
+            "value_MB": st.column_config.NumberColumn("트래픽 (MB)", format="%.1f"),
+            "baseline_MB": st.column_config.NumberColumn("평소 (MB)", format="%.1f"),
+            "z": st.column_config.NumberColumn("z-score", format="%.1f"),
+        },
+    )
+
+
+@st.fragment
+def _cross_network_table(comprehensive_traffic):
+    """
+    Filterable all-network application table. Runs as a fragment so the traffic filter
+    and search box rerun only this table instead of reloading every network's traffic.
+    """
+    # Display comprehensive table
+    st.markdown("**📊 All Networks - Application Traffic Summary**")
+
+    # Add filtering options
+    col1, col2 = st.columns(2)
+    with col1:
+        min_traffic = st.number_input("Minimum Traffic (MB)", min_value=0.0, value=1.0, step=0.1, key="traffic_min_filter")
+    with col2:
+        app_search = st.text_input("Search Applications", placeholder="Enter application name", key="traffic_app_search")
+
+    # Apply filters
+    filtered_traffic = comprehensive_traffic[comprehensive_traffic["TotalMB"] >= min_traffic]
+    if app_search:
+        filtered_traffic = filtered_traffic[filtered_traffic["application"].str.contains(app_search, case=False, na=False)]
+
+    # Display filtered results; numbers stay numeric and are formatted by the column config
+    if len(filtered_traffic) > 0:
+        st.dataframe(
+            filtered_traffic,
+            use_container_width=True,
+            hide_index=True,
+            column_order=["application", "TotalMB", "TotalGB", "numClients", "sent_MB", "recv_MB",
+                          "NetworkCount", "Networks"],
+            column_config={
+                "application": "애플리케이션",
+                "TotalMB": st.column_config.NumberColumn("총 트래픽 (MB)", format="%.2f"),
+                "TotalGB": st.column_config.NumberColumn("총 트래픽 (GB)", format="%.3f"),
+                "numClients": st.column_config.NumberColumn("최대 클라이언트", format="%d"),
+                "sent_MB": st.column_config.NumberColumn("업로드 (MB)", format="%.2f"),
+                "recv_MB": st.column_config.NumberColumn("다운로드 (MB)", format="%.2f"),
+                "NetworkCount": st.column_config.NumberColumn("네트워크 수", format="%d"),
+                "Networks": st.column_config.ListColumn("네트워크"),
+            },
+        )
+
+        # Summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("총 애플리케이션", len(filtered_traffic))
+        with col2:
+            st.metric("총 트래픽", f"{filtered_traffic['TotalMB'].sum():.2f} MB")
+        with col3:
+            st.metric("총 업로드", f"{filtered_traffic['sent_MB'].sum():.2f} MB")
+        with col4:
+            st.metric("총 다운로드", f"{filtered_traffic['recv_MB'].sum():.2f} MB")
+    else:
+        st.info("현재 필터와 일치하는 애플리케이션이 없습니다")
+
+
+def prefetch(ctx):
+    """
+    Warm the loader caches render() reads, with the same arguments
+    """
+    if not ctx.enable_traffic:
+        return
+    load_traffic_analysis_data_parallel(ctx.api_key, ctx.sel_nets, ctx.timespan, ctx.resolution)
+    calls = []
+    for net_id in ctx.sel_nets:
+        calls.append({'key': f"{net_id}_clients_overview", 'func': load_network_clients_overview,
+                      'args': [ctx.api_key, net_id]})
+        calls.append({'key': f"{net_id}_traffic", 'func': load_traffic, 'args': [ctx.api_key, net_id, ctx.timespan]})
+    parallel_api_calls(calls)
@@ -0,0 +1,193 @@
+# Background prefetch of the next likely page
+# After a page renders, the data of the page the operator most probably opens next is loaded
+# into the same st.cache_data entries on one low-priority worker thread, so the next click is a
+# warm rerun. The next page is learned from observed page changes and defaults to the usual
+# 메인화면 → 트래픽 분석 → 클라이언트 분석 walk. Prefetch API calls share Meraki's per-org rate
+# limit with the foreground, so they go through a small token bucket and pause after any 429.
+import contextvars
+import threading
+import time
+from collections import Counter, defaultdict
+
+from meraki_api_telemetry import seconds_since_rate_limited, set_request_gate
+from meraki_logging import get_logger
+from meraki_pages import PAGES, load_page
+
+log = get_logger("prefetch")
+
+try:
+    from config import PREFETCH_ENABLED
+except ImportError:
+    PREFETCH_ENABLED = True
+
+try:
+    from config import PREFETCH_RATE_LIMIT
+except ImportError:
+    PREFETCH_RATE_LIMIT = 3.0   # API calls/second for prefetching (Meraki allows 10/s per organization)
+
+PREFETCH_BACKOFF = 30       # seconds prefetching stays paused after any HTTP 429
+PREFETCH_FRESH = 240        # seconds a finished prefetch counts as warm (page loaders cache for 300s)
+MIN_OBSERVED = 3            # page changes seen from a page before they override DEFAULT_NEXT
+
+# Usual operator walk through the sidebar
+DEFAULT_NEXT = {
+    "메인화면": "트래픽 분석",
+    "트래픽 분석": "클라이언트 분석",
+}
+
+# Set on the prefetch worker; parallel_api_calls copies it onto its pool threads
+_low_priority = contextvars.ContextVar("meraki_prefetch_low_priority", default=False)
+
+
+class _TokenBucket:
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until one call is allowed; returns the seconds waited"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+_bucket = _TokenBucket(PREFETCH_RATE_LIMIT)
+_lock = threading.Lock()
+_wake = threading.Condition(_lock)
+_worker = None
+_pending = None             # (key, page name, ctx); only the newest request is kept
+_running = None             # key of the job on the worker
+_promoted = False           # the running job's page is being rendered - stop throttling it
+_warm = {}                  # key -> time.monotonic() the prefetch finished
+_transitions = defaultdict(Counter)   # page -> Counter(next page)
+_stats = {"jobs": 0, "skipped": 0, "calls": 0, "throttled_s": 0.0, "last_page": None, "last_s": 0.0}
+
+
+def _gate():
+    # Runs before every Meraki API call; only prefetch calls are held back
+    if not _low_priority.get():
+        return
+    while True:
+        backoff = PREFETCH_BACKOFF - seconds_since_rate_limited()
+        if backoff <= 0:
+            break
+        time.sleep(min(backoff, 1.0))
+    waited = 0.0 if _promoted else _bucket.acquire()
+    with _lock:
+        _stats["calls"] += 1
+        _stats["throttled_s"] += waited
+
+
+def _job_key(page, ctx):
+    return (page, ctx.org_id, tuple(ctx.sel_nets), ctx.timespan, ctx.resolution)
+
+
+def predict_next(page):
+    """
+    The page most often opened after `page` (DEFAULT_NEXT until enough changes were seen)
+    """
+    with _lock:
+        seen = _transitions.get(page)
+        if seen and sum(seen.values()) >= MIN_OBSERVED:
+            return seen.most_common(1)[0][0]
+    return DEFAULT_NEXT.get(page)
+
+
+def promote_prefetch(page, ctx):
+    """
+    Call before rendering a page: if its prefetch is still running, the foreground rerun is
+    now waiting on the same cache entries, so lift the prefetch rate budget
+    """
+    global _promoted
+    with _lock:
+        if _running is not None and _running == _job_key(page, ctx):
+            _promoted = True
+            log.debug("Prefetch of %s promoted to foreground", page)
+
+
+def schedule_prefetch(page, ctx, previous_page=None):
+    """
+    Record the page change and queue the data of the page likely opened next.
+    Returns the predicted page, or None when nothing is prefetched.
+    """
+    global _pending, _worker
+    if not PREFETCH_ENABLED or not ctx.sel_nets:
+        return None
+    if previous_page and previous_page != page:
+        with _lock:
+            _transitions[previous_page][page] += 1
+
+    target = predict_next(page)
+    if target is None or target == page or target not in PAGES:
+        return None
+
+    key = _job_key(target, ctx)
+    with _lock:
+        finished = _warm.get(key)
+        if key == _running or (finished and time.monotonic() - finished < PREFETCH_FRESH):
+            _stats["skipped"] += 1
+            return target
+        _pending = (key, target, ctx)
+        if _worker is None or not _worker.is_alive():
+            set_request_gate(_gate)
+            _worker = threading.Thread(target=_run, name="meraki-prefetch", daemon=True)
+            _worker.start()
+        _wake.notify()
+    return target
+
+
+def _run():
+    global _pending, _running, _promoted
+    _low_priority.set(True)
+    while True:
+        with _wake:
+            while _pending is None:
+                _wake.wait()
+            key, target, ctx = _pending
+            _pending = None
+            _running = key
+            _promoted = False
+
+        start = time.monotonic()
+        try:
+            prefetch = getattr(load_page(target), "prefetch", None)
+            if prefetch is not None:
+                prefetch(ctx)
+        except Exception as e:
+            log.warning("Prefetch of %s failed: %s", target, e)
+            finished = None
+        else:
+            finished = time.monotonic()
+            log.debug("Prefetched %s for %d networks in %.2fs", target, len(ctx.sel_nets), finished - start)
+
+        with _lock:
+            _running = None
+            if finished is not None:
+                for stale in [k for k, t in _warm.items() if finished - t >= PREFETCH_FRESH]:
+                    del _warm[stale]
+                _warm[key] = finished
+                _stats["jobs"] += 1
+                _stats["last_page"] = target
+                _stats["last_s"] = finished - start
+
+
+def get_prefetch_stats():
+    """
+    Snapshot of prefetch counters for the diagnostics panel
+    """
+    with _lock:
+        stats = dict(_stats)
+        stats["running"] = _running[0] if _running else None
+    return stats
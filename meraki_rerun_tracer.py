@@ -0,0 +1,274 @@
+# Meraki Dashboard Rerun Tracer
+# Opt-in, per-rerun span recording for the Streamlit script:
+#   - top-level UI sections (mark_section)
+#   - every cached loader call with cache hit/miss (traced_cache_data)
+# Each traced rerun is written as a Chrome trace (open in Perfetto, chrome://tracing
+# or speedscope) plus a collapsed-stack .folded file for flamegraph.pl.
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from meraki_logging import get_logger
+
+log = get_logger("tracer")
+
+try:
+    from config import RERUN_TRACE_ENABLED
+except ImportError:
+    RERUN_TRACE_ENABLED = False
+
+try:
+    from config import RERUN_TRACE_DIR
+except ImportError:
+    RERUN_TRACE_DIR = os.path.join("logs", "traces")
+
+RERUN_TRACE_ENABLED = RERUN_TRACE_ENABLED or os.environ.get("MERAKI_RERUN_TRACE") == "1"
+
+
+class Span:
+    __slots__ = ("name", "cat", "start", "end", "tid", "parent", "args")
+
+    def __init__(self, name, cat, tid, parent):
+        self.name = name
+        self.cat = cat
+        self.start = time.perf_counter()
+        self.end = None
+        self.tid = tid
+        self.parent = parent
+        self.args = {}
+
+    def stack(self):
+        names = []
+        span = self
+        while span is not None:
+            names.append(span.name)
+            span = span.parent
+        return names[::-1]
+
+
+class RerunTrace:
+    """
+    Spans recorded during one script run of one session
+    """
+
+    def __init__(self, label, script_tid):
+        self.label = label
+        self.script_tid = script_tid
+        self.started_at = datetime.now()
+        self.spans = []
+        self.stacks = {}        # thread id -> open spans, innermost last
+        self.lock = threading.Lock()
+        self.root = self.open("rerun", "rerun", script_tid)
+        self.section = None
+
+    def open(self, name, cat, tid):
+        with self.lock:
+            stack = self.stacks.setdefault(tid, [])
+            # Worker threads hang their spans under whatever the script thread is doing
+            parent = stack[-1] if stack else self._script_top()
+            span = Span(name, cat, tid, parent)
+            stack.append(span)
+            self.spans.append(span)
+        return span
+
+    def close(self, span):
+        span.end = time.perf_counter()
+        with self.lock:
+            stack = self.stacks.get(span.tid, [])
+            if span in stack:
+                # Closing an outer span also closes anything left open inside it
+                while stack:
+                    top = stack.pop()
+                    if top.end is None:
+                        top.end = span.end
+                    if top is span:
+                        break
+
+    def _script_top(self):
+        stack = self.stacks.get(self.script_tid)
+        return stack[-1] if stack else None
+
+    def current(self, tid):
+        stack = self.stacks.get(tid)
+        return stack[-1] if stack else None
+
+    def to_chrome_trace(self):
+        origin = self.root.start
+        events = [{
+            "name": "process_name", "ph": "M", "pid": 1,
+            "args": {"name": f"streamlit rerun: {self.label}"},
+        }]
+        for span in self.spans:
+            end = span.end if span.end is not None else time.perf_counter()
+            events.append({
+                "name": span.name,
+                "cat": span.cat,
+                "ph": "X",
+                "pid": 1,
+                "tid": span.tid,
+                "ts": round((span.start - origin) * 1e6, 1),
+                "dur": round((end - span.start) * 1e6, 1),
+                "args": span.args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"label": self.label, "started_at": self.started_at.isoformat()}}
+
+    def to_folded(self):
+        # Self time per stack; children running in parallel can exceed the parent's
+        # wall time, so self time is clamped at zero
+        child_time = {}
+        for span in self.spans:
+            if span.parent is not None and span.end is not None:
+                child_time[id(span.parent)] = child_time.get(id(span.parent), 0.0) + (span.end - span.start)
+        folded = {}
+        for span in self.spans:
+            if span.end is None:
+                continue
+            self_time = max(0.0, (span.end - span.start) - child_time.get(id(span), 0.0))
+            key = ";".join(n.replace(";", ":") for n in span.stack())
+            folded[key] = folded.get(key, 0) + int(self_time * 1e6)
+        return "\n".join(f"{stack} {us}" for stack, us in folded.items() if us > 0) + "\n"
+
+
+# Active traces by Streamlit session; loaders may run on parallel_api_calls threads
+_lock = threading.Lock()
+_active = {}    # session id -> RerunTrace
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        return None
+    return ctx.session_id if ctx else None
+
+
+def _current_trace():
+    if not _active:
+        return None
+    session_id = _session_id()
+    with _lock:
+        if session_id is not None:
+            return _active.get(session_id)
+        # Worker thread without a script context: attribute to the only active trace
+        if len(_active) == 1:
+            return next(iter(_active.values()))
+    return None
+
+
+def tracing_requested():
+    """
+    True when tracing is on via config/env or the session's diagnostics toggle
+    """
+    return RERUN_TRACE_ENABLED or st.session_state.get("rerun_trace", False)
+
+
+def begin_rerun(label):
+    """
+    Start tracing this script run if tracing is requested.
+    A trace left open by an earlier run (st.stop, exception) is written out first.
+    """
+    session_id = _session_id() or "bare"
+    with _lock:
+        leftover = _active.pop(session_id, None)
+    if leftover is not None:
+        leftover.label += " (stopped)"
+        _export(leftover)
+    if not tracing_requested():
+        return None
+    trace = RerunTrace(label, threading.get_ident())
+    with _lock:
+        _active[session_id] = trace
+    return trace
+
+
+def mark_section(name):
+    """
+    Close the current top-level UI section and open `name`
+    """
+    trace = _current_trace()
+    if trace is None:
+        return
+    if trace.section is not None:
+        trace.close(trace.section)
+    trace.section = trace.open(name, "section", threading.get_ident())
+
+
+def end_rerun(label=None):
+    """
+    Finish the current run's trace and write it; returns the Chrome trace path or None
+    """
+    session_id = _session_id() or "bare"
+    with _lock:
+        trace = _active.pop(session_id, None)
+    if trace is None:
+        return None
+    if label:
+        trace.label = label
+    return _export(trace)
+
+
+def _export(trace):
+    trace.close(trace.root)
+    os.makedirs(RERUN_TRACE_DIR, exist_ok=True)
+    safe_label = "".join(c if c.isalnum() else "_" for c in trace.label)[:40]
+    base = os.path.join(RERUN_TRACE_DIR, f"rerun-{trace.started_at:%Y%m%d-%H%M%S-%f}-{safe_label}")
+    try:
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(trace.to_chrome_trace(), f, ensure_ascii=False)
+        with open(base + ".folded", "w", encoding="utf-8") as f:
+            f.write(trace.to_folded())
+    except OSError as e:
+        log.warning("Failed to write rerun trace: %s", e)
+        return None
+    global _last_export
+    _last_export = base + ".json"
+    return _last_export
+
+
+_last_export = None
+
+
+def last_trace_path():
+    return _last_export
+
+
+def traced_cache_data(**cache_kwargs):
+    """
+    Drop-in for st.cache_data(...) that records a span per call and whether it was a cache hit.
+    The wrapped function body only runs on a miss, which is how misses are detected.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def on_miss(*args, **kwargs):
+            trace = _current_trace()
+            if trace is not None:
+                span = trace.current(threading.get_ident())
+                if span is not None and span.name == func.__name__:
+                    span.args["cache"] = "miss"
+            return func(*args, **kwargs)
+
+        cached = st.cache_data(**cache_kwargs)(on_miss)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            trace = _current_trace()
+            if trace is None:
+                return cached(*args, **kwargs)
+            span = trace.open(func.__name__, "loader", threading.get_ident())
+            span.args["cache"] = "hit"
+            try:
+                return cached(*args, **kwargs)
+            finally:
+                trace.close(span)
+
+        call.clear = cached.clear
+        return call
+
+    return decorator
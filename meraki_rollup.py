@@ -0,0 +1,126 @@
+# Device status rollups
+# When a device snapshot is ingested (load_devices), its devices are counted once into a small
+# cube keyed by (networkId, productType, status), with the offline/alerting devices indexed per
+# network. The main page reads the cube for the selected networks instead of walking every device
+# dict on each rerun, so its cards cost the same for 100 or 100k devices. Webhook status patches
+# (meraki_device_status) are applied to the cube as count deltas.
+import threading
+from collections import Counter
+
+from meraki_device_status import status_patches
+
+STATUSES = ("online", "offline", "alerting", "dormant")
+ISSUE_STATUSES = ("offline", "alerting")
+
+# Process-wide like the status overlay: every session reads the same rollup per org
+_lock = threading.Lock()
+_rollups = {}   # org_id -> StatusRollup
+
+
+class StatusRollup:
+    """
+    Counts of one org snapshot by (networkId, productType, status)
+    """
+
+    def __init__(self, devices, fetched_at=None):
+        self.fetched_at = fetched_at
+        self.cells = Counter()
+        self.device_cells = {}     # serial -> (networkId, productType, status)
+        self.issues = {status: {} for status in ISSUE_STATUSES}   # status -> networkId -> [device]
+        for device in devices:
+            cell = (device.get("networkId"), device.get("productType", "unknown"), device.get("status", "unknown"))
+            self.cells[cell] += 1
+            if device.get("serial"):
+                self.device_cells[device["serial"]] = cell
+            if cell[2] in self.issues:
+                self.issues[cell[2]].setdefault(cell[0], []).append(device)
+
+    def view(self, network_ids, patches=None):
+        """
+        Aggregates for the selected networks, with webhook patches applied
+        """
+        cells = self.cells
+        issues = self.issues
+        if patches:
+            # Copy-on-write: only the cells and issue lists a patch touches are copied
+            cells = cells.copy()
+            issues = {status: dict(by_net) for status, by_net in issues.items()}
+            for serial, patch in patches.items():
+                cell = self.device_cells.get(serial)
+                if cell is None or cell[2] == patch["status"]:
+                    continue
+                net, product, old_status = cell
+                new_status = patch["status"]
+                cells[cell] -= 1
+                cells[(net, product, new_status)] += 1
+                device = {"serial": serial, "networkId": net, "productType": product}
+                if old_status in issues:
+                    remaining = []
+                    for d in issues[old_status].get(net, []):
+                        if d.get("serial") == serial:
+                            device = d
+                        else:
+                            remaining.append(d)
+                    issues[old_status][net] = remaining
+                if new_status in issues:
+                    device = {**device, "status": new_status, "statusSource": "webhook"}
+                    if patch.get("occurredAt"):
+                        device["lastReportedAt"] = patch["occurredAt"]
+                    issues[new_status][net] = issues[new_status].get(net, []) + [device]
+        return RollupView(cells, issues, network_ids)
+
+
+class RollupView:
+    """
+    What the main page shows for a network selection:
+    by_product[productType] -> {status: n, "total": n}, by_network[networkId] -> {status: n},
+    totals[status] -> n, issues[status] -> [device] (offline/alerting, selection order)
+    """
+
+    def __init__(self, cells, issues, network_ids):
+        selected = set(network_ids)
+        self.by_product = {}
+        self.by_network = {}
+        self.totals = Counter()
+        for (net, product, status), count in cells.items():
+            if net not in selected or count <= 0:
+                continue
+            stats = self.by_product.setdefault(product, {**{s: 0 for s in STATUSES}, "total": 0})
+            stats[status] = stats.get(status, 0) + count
+            stats["total"] += count
+            network = self.by_network.setdefault(net, {s: 0 for s in STATUSES})
+            if status in network:
+                network[status] += count
+            self.totals[status] += count
+        self.total = sum(self.totals.values())
+        self.issues = {status: [d for net in network_ids for d in by_net.get(net, [])]
+                       for status, by_net in issues.items()}
+
+
+def build_rollup(org_id, devices, fetched_at=None):
+    """
+    Count a freshly fetched device snapshot into the org's rollup
+    """
+    rollup = StatusRollup(devices, fetched_at)
+    with _lock:
+        _rollups[org_id] = rollup
+    return rollup
+
+
+def get_rollup(org_id):
+    """
+    The org's latest rollup, or None if no snapshot was ingested in this process yet
+    """
+    with _lock:
+        return _rollups.get(org_id)
+
+
+def rollup_view(org_id, network_ids, devices=None):
+    """
+    Patched aggregates for the selected networks. `devices` is only used to build the
+    rollup when none exists yet (e.g. the snapshot was fetched before this module loaded).
+    """
+    rollup = get_rollup(org_id)
+    if rollup is None:
+        rollup = build_rollup(org_id, devices) if devices is not None else StatusRollup([])
+    return rollup.view(network_ids, status_patches(org_id, rollup.fetched_at))
@@ -0,0 +1,148 @@
+# Device system information
+# The device tables' OS version, power and CPU columns needed three calls per serial
+# (status, management interface, performance), so they were left "N/A". After each device
+# snapshot (load_devices) a background worker refreshes them for the whole organization:
+#   firmware (OS version)  - getOrganizationDevices, one paginated call
+#   power                  - getOrganizationDevicesPowerModulesStatusesByDevice for devices with
+#                            power modules; any other device that is reporting is powered
+#   CPU (wireless)         - getOrganizationWirelessDevicesSystemCpuLoadHistory, latest sample
+#   CPU (appliance)        - getDevicePerformance per MX: there is no org-level endpoint, so these
+#                            calls are paced at SYSTEM_INFO_RATE and pause after any HTTP 429
+# Results are kept per org next to the snapshot and read by serial when the tables render;
+# rendering never waits on the collection.
+import threading
+import time
+
+from meraki_api_telemetry import seconds_since_rate_limited
+from meraki_logging import get_logger
+
+log = get_logger("data")
+
+try:
+    from config import SYSTEM_INFO_REFRESH
+except ImportError:
+    SYSTEM_INFO_REFRESH = 900    # seconds before an organization's system info is collected again
+
+try:
+    from config import SYSTEM_INFO_RATE
+except ImportError:
+    SYSTEM_INFO_RATE = 2.0       # per-device API calls/second (Meraki allows 10/s per organization)
+
+RATE_LIMIT_BACKOFF = 30          # seconds per-device calls stay paused after any HTTP 429
+CPU_LOOKBACK = 900               # seconds of wireless CPU load history requested (latest sample used)
+CPU_LOAD_SCALE = 65536           # cpuLoad5 is a fixed-point load average (sysinfo() scaling)
+REPORTING = ("online", "alerting")
+
+# Process-wide like the status rollups: every session reads the same collection per org
+_lock = threading.Lock()
+_info = {}          # org_id -> {serial: {"firmware", "power", "cpu"}}
+_collected = {}     # org_id -> time.time() the last collection started
+_running = set()    # org_ids being collected
+
+
+def system_info(org_id):
+    """
+    {serial: {"firmware": str, "power": "on"/"off", "cpu": percent}} collected so far for an
+    organization; fields that are unknown (or not collected yet) are missing
+    """
+    with _lock:
+        return _info.get(org_id, {})
+
+
+def schedule_collection(api, org_id, devices):
+    """
+    Start a background collection for the organization unless one ran within SYSTEM_INFO_REFRESH
+    """
+    with _lock:
+        if org_id in _running or time.time() - _collected.get(org_id, 0) < SYSTEM_INFO_REFRESH:
+            return False
+        _running.add(org_id)
+        _collected[org_id] = time.time()
+    threading.Thread(target=_run, args=(api, org_id, list(devices)), name="meraki-system-info", daemon=True).start()
+    return True
+
+
+def _power(modules):
+    # "on" if any power module supplies power
+    return "on" if any(slot.get("status") == "powering" for slot in modules) else "off"
+
+
+def _cpu_percent(device):
+    # Latest 5-minute load average as a percentage of the device's cores
+    series = [p for p in device.get("series") or [] if p.get("cpuLoad5") is not None]
+    if not series:
+        return None
+    latest = max(series, key=lambda p: p["ts"])
+    return latest["cpuLoad5"] / CPU_LOAD_SCALE / (device.get("cpuCount") or 1) * 100
+
+
+def _publish(org_id, info):
+    with _lock:
+        _info[org_id] = info
+
+
+def collect(api, org_id, devices):
+    """
+    Collect firmware, power and CPU of every device of the organization. Org-level results are
+    published before the per-appliance calls start. Returns {serial: info}.
+    """
+    info = {d["serial"]: {} for d in devices if d.get("serial")}
+    for device in devices:
+        if device.get("serial") and device.get("status") in REPORTING:
+            info[device["serial"]]["power"] = "on"
+
+    org_calls = (
+        ("firmware", lambda: api.organizations.getOrganizationDevices(org_id, total_pages=-1)),
+        ("power", lambda: api.organizations.getOrganizationDevicesPowerModulesStatusesByDevice(org_id, total_pages=-1)),
+        ("cpu", lambda: api.wireless.getOrganizationWirelessDevicesSystemCpuLoadHistory(
+            org_id, timespan=CPU_LOOKBACK, perPage=20, total_pages=-1)),
+    )
+    for field, call in org_calls:
+        try:
+            rows = call()
+        except Exception as e:
+            log.warning("System info (%s) for org %s failed: %s", field, org_id, e)
+            continue
+        for row in rows or []:
+            target = info.get(row.get("serial"))
+            if target is None:
+                continue
+            if field == "firmware" and row.get("firmware"):
+                target["firmware"] = row["firmware"]
+            elif field == "power" and row.get("slots"):
+                target["power"] = _power(row["slots"])
+            elif field == "cpu":
+                cpu = _cpu_percent(row)
+                if cpu is not None:
+                    target["cpu"] = cpu
+    _publish(org_id, {serial: dict(fields) for serial, fields in info.items()})
+
+    # Appliance CPU has no org-level endpoint: one paced call per MX that is reporting
+    appliances = [d["serial"] for d in devices
+                  if d.get("productType") == "appliance" and d.get("status") in REPORTING and d.get("serial")]
+    for serial in appliances:
+        while seconds_since_rate_limited() < RATE_LIMIT_BACKOFF:
+            time.sleep(1.0)
+        try:
+            score = api.appliance.getDeviceAppliancePerformance(serial).get("perfScore")
+        except Exception as e:
+            log.debug("Appliance performance of %s failed: %s", serial, e)
+        else:
+            if score is not None:
+                info[serial]["cpu"] = float(score)
+        time.sleep(1 / SYSTEM_INFO_RATE)
+    if appliances:
+        _publish(org_id, {serial: dict(fields) for serial, fields in info.items()})
+    return info
+
+
+def _run(api, org_id, devices):
+    start = time.time()
+    try:
+        info = collect(api, org_id, devices)
+        log.debug("System info of %d devices in org %s collected in %.1fs", len(info), org_id, time.time() - start)
+    except Exception as e:
+        log.warning("System info collection for org %s failed: %s", org_id, e)
+    finally:
+        with _lock:
+            _running.discard(org_id)
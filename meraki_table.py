@@ -0,0 +1,186 @@
+# Paged tables for large device and client lists
+# st.dataframe/st.selectbox serialize every row to the browser on each rerun. These helpers keep
+# the full frame on the server, filter and sort it there through a per-frame index (lower-cased
+# search text, value -> row positions, lazily built sort orders) and ship only the visible page,
+# so payload and render time stay flat however many rows the org has. Call them from inside an
+# @st.fragment so paging and searching rerun only the table.
+import streamlit as st
+
+from meraki_lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+try:
+    from config import TABLE_PAGE_SIZE
+except ImportError:
+    TABLE_PAGE_SIZE = 50
+
+ALL = "전체"
+SEARCH_OPTION_LIMIT = 200   # options shown by search_select before the search must be narrowed
+
+
+class TableIndex:
+    """
+    Filter/sort index over one DataFrame; built once and reused for every page/filter change
+    """
+
+    def __init__(self, df, search_columns=None):
+        self.df = df
+        # pandas 3 gives text columns the "str" dtype rather than object
+        columns = search_columns or [c for c in df.columns
+                                     if pd.api.types.is_string_dtype(df[c]) or pd.api.types.is_object_dtype(df[c])]
+        if columns:
+            # Nulls stay NaN through astype(str) in pandas 3; search them as empty text
+            text = self._text(columns[0])
+            for column in columns[1:]:
+                text = text + "\u0000" + self._text(column)
+            self.search_text = text.str.lower().to_numpy()
+        else:
+            self.search_text = None
+        self._groups = {}
+        self._orders = {}
+
+    def _text(self, column):
+        return self.df[column].astype(object).fillna("").astype(str)
+
+    def groups(self, column):
+        """value -> row positions for an equality filter"""
+        if column not in self._groups:
+            self._groups[column] = self.df.groupby(column, sort=False).indices
+        return self._groups[column]
+
+    def order(self, column):
+        """Row positions sorted ascending by column (stable)"""
+        if column not in self._orders:
+            values = self.df[column]
+            if pd.api.types.is_string_dtype(values) or pd.api.types.is_object_dtype(values):
+                values = values.astype(object).fillna("")
+            try:
+                self._orders[column] = np.argsort(values.to_numpy(), kind="stable")
+            except TypeError:
+                self._orders[column] = np.argsort(values.astype(str).to_numpy(), kind="stable")
+        return self._orders[column]
+
+    def select(self, search="", filters=None, sort_by=None, descending=False):
+        """Row positions matching the search and {column: value} filters, in display order"""
+        mask = np.ones(len(self.df), dtype=bool)
+        for column, value in (filters or {}).items():
+            if value is None or value == ALL:
+                continue
+            column_mask = np.zeros(len(self.df), dtype=bool)
+            column_mask[self.groups(column).get(value, [])] = True
+            mask &= column_mask
+        if search and self.search_text is not None:
+            term = search.lower()
+            mask &= np.fromiter((term in text for text in self.search_text), dtype=bool, count=len(self.df))
+        if sort_by:
+            order = self.order(sort_by)
+            if descending:
+                order = order[::-1]
+            return order[mask[order]]
+        return np.flatnonzero(mask)
+
+
+def _fingerprint(df):
+    # Content hash of the frame: a full rerun rebuilds an equal frame as a new object, and
+    # the index should survive that as well as fragment reruns
+    try:
+        rows = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:   # unhashable cells (lists, dicts)
+        return id(df)
+    return (len(df), tuple(df.columns), int(rows.sum()), int((rows * np.arange(1, len(rows) + 1, dtype="uint64")).sum()))
+
+
+def table_index(df, key, search_columns=None):
+    """
+    The TableIndex for df, reused while a frame with the same content is passed under this
+    key (one index per key; a different frame replaces it)
+    """
+    slot = f"_table_index_{key}"
+    signature = (_fingerprint(df), tuple(search_columns or ()))
+    cached = st.session_state.get(slot)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    index = TableIndex(df, search_columns)
+    st.session_state[slot] = (signature, index)
+    return index
+
+
+def paged_table(df, key, search_columns=None, filters=None, page_size=None, sortable=True, **dataframe_kwargs):
+    """
+    Search box, sort and pager over df; only the current page is sent to the browser.
+    The search box is left out when df has no text column to search.
+    filters: {column: value} equality filters chosen by the caller ("전체"/None = no filter).
+    Returns the filtered frame (all pages) for summary metrics.
+    """
+    page_size = page_size or TABLE_PAGE_SIZE
+    index = table_index(df, key, search_columns)
+
+    searchable = index.search_text is not None
+    if sortable:
+        col1, col2, col3 = st.columns([3, 2, 1]) if searchable else (None, *st.columns([2, 1]))
+    else:
+        col1, col2, col3 = st.container() if searchable else None, None, None
+    search = ""
+    if searchable:
+        with col1:
+            search = st.text_input("🔍 검색", key=f"{key}_search", placeholder="이름, 모델, 시리얼 등")
+    sort_by, descending = None, False
+    if sortable:
+        with col2:
+            sort_by = st.selectbox("정렬", [None] + list(df.columns), key=f"{key}_sort",
+                                   format_func=lambda c: "기본 순서" if c is None else c)
+        with col3:
+            descending = st.toggle("내림차순", key=f"{key}_desc")
+
+    positions = index.select(search, filters, sort_by, descending)
+    total = len(positions)
+    pages = max(1, -(-total // page_size))
+
+    # Back to the first page whenever the result set changes
+    signature = (search, tuple(sorted((filters or {}).items())), sort_by, descending, len(df))
+    page_key = f"{key}_page"
+    if st.session_state.get(f"{key}_signature") != signature:
+        st.session_state[f"{key}_signature"] = signature
+        st.session_state[page_key] = 1
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+
+    start = (st.session_state.get(page_key, 1) - 1) * page_size
+    window = df.iloc[positions[start:start + page_size]]
+    dataframe_kwargs.setdefault("hide_index", True)
+    dataframe_kwargs.setdefault("use_container_width", True)
+    st.dataframe(window, **dataframe_kwargs)
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        if pages > 1:
+            st.number_input("페이지", min_value=1, max_value=pages, step=1, key=page_key)
+    with col2:
+        if total:
+            st.caption(f"{start + 1:,}–{start + len(window):,} / {total:,}행 (전체 {len(df):,}행)")
+        else:
+            st.caption(f"일치하는 행이 없습니다 (전체 {len(df):,}행)")
+    return df.iloc[positions]
+
+
+def search_select(label, options, key, format_func=str, limit=SEARCH_OPTION_LIMIT, **selectbox_kwargs):
+    """
+    st.selectbox over a long option list: a search box narrows the options server-side and at
+    most `limit` of them are sent to the browser. Returns the selected option (None if no match).
+    """
+    search = st.text_input(f"🔍 {label} 검색", key=f"{key}_search",
+                           placeholder=f"{len(options):,}개 중 검색")
+    if search:
+        term = search.lower()
+        matches = [o for o in options if term in format_func(o).lower()]
+    else:
+        matches = list(options)
+    if len(matches) > limit:
+        st.caption(f"{len(matches):,}개 중 {limit}개만 표시합니다 - 검색어로 범위를 좁혀주세요")
+        matches = matches[:limit]
+    if not matches:
+        st.info("검색과 일치하는 항목이 없습니다")
+        return None
+    return st.selectbox(label, matches, format_func=format_func, key=key, **selectbox_kwargs)
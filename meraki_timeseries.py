@@ -0,0 +1,345 @@
+# Meraki Time-Series Store
+# Local history for bandwidth series so a cache miss only downloads what is new:
+#   client_bandwidth - getNetworkClientsBandwidthUsageHistory points (upstream/downstream/total)
+#   uplink_usage     - getNetworkApplianceUplinksUsageHistory points per uplink interface
+#   uplink_loss_latency - getOrganizationDevicesUplinksLossAndLatency samples of every appliance uplink
+# Points are upserted by (network, resolution, ts) and a coverage table remembers which interval
+# of each series has been fetched. A request is answered by a range scan after fetching only the
+# gaps: normally just the tail since the last refresh (t0/t1), plus any older part not stored yet.
+# plan_resolution() maps a (timespan, requested resolution) pair onto one the endpoint accepts.
+# getNetworkClientsBandwidthUsageHistory takes no resolution (the API picks the interval from the
+# t0..t1 span), so client bandwidth is stored at whatever interval it returns under NATIVE and
+# charts thin it with LTTB (meraki_downsample).
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from meraki_downsample import CHART_POINT_BUDGET
+from meraki_logging import get_logger
+
+log = get_logger("timeseries")
+
+try:
+    from config import TIMESERIES_DB
+except ImportError:
+    TIMESERIES_DB = os.path.join("data", "timeseries.db")
+
+try:
+    from config import TIMESERIES_RETENTION_DAYS
+except ImportError:
+    TIMESERIES_RETENTION_DAYS = 31   # the Dashboard API looks back at most 30 days
+
+# A stored tail younger than this is served without an API call
+TAIL_MIN_AGE = 60
+COMPACTION_INTERVAL = 3600
+DAY = 86400
+
+# Resolutions each endpoint accepts, and the longest t0..t1 window one request may span
+RESOLUTIONS = {
+    "uplink_usage": (60, 300, 600, 1800, 3600, 86400),
+    "uplink_loss_latency": (60,),
+}
+MAX_WINDOW = {
+    "client_bandwidth": 31 * DAY,
+    "uplink_usage": 14 * DAY,
+    "uplink_loss_latency": 300,
+}
+
+# Loss/latency samples are published with a delay (t1 at most this far in the past), and a cold
+# store is backfilled only this far; older samples accumulate as the history is refreshed
+LOSS_LATENCY_DELAY = 120
+LOSS_LATENCY_BACKFILL = 900
+
+# Resolution key of series stored at the interval the API returned, and the finest such interval
+# (the stored tail is refetched from this far back, as its last bucket was still filling)
+NATIVE = 0
+CLIENT_BANDWIDTH_STEP = 300
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS client_bandwidth (
+    network_id TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    upstream REAL,
+    downstream REAL,
+    total REAL,
+    PRIMARY KEY (network_id, resolution, ts)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS uplink_usage (
+    network_id TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    interface TEXT NOT NULL,
+    sent INTEGER,
+    received INTEGER,
+    PRIMARY KEY (network_id, resolution, ts, interface)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS uplink_loss_latency (
+    org_id TEXT NOT NULL,
+    serial TEXT NOT NULL,
+    uplink TEXT NOT NULL,
+    ip TEXT NOT NULL,
+    ts REAL NOT NULL,
+    network_id TEXT,
+    loss REAL,
+    latency REAL,
+    PRIMARY KEY (org_id, serial, uplink, ip, ts)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS uplink_loss_latency_ts ON uplink_loss_latency (org_id, ts);
+
+CREATE TABLE IF NOT EXISTS coverage (
+    metric TEXT NOT NULL,
+    network_id TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    covered_from REAL NOT NULL,
+    covered_to REAL NOT NULL,
+    PRIMARY KEY (metric, network_id, resolution)
+);
+"""
+
+_lock = threading.Lock()
+_conn = None
+_last_compaction = 0.0
+_stats = {"requests": 0, "api_calls": 0, "points_fetched": 0, "points_served": 0}
+
+
+def _get_connection():
+    """
+    Open the store on first use (shared by all sessions in this process)
+    """
+    global _conn
+    if _conn is None:
+        directory = os.path.dirname(TIMESERIES_DB)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _conn = sqlite3.connect(TIMESERIES_DB, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.executescript(_SCHEMA)
+    return _conn
+
+
+def parse_ts(value):
+    """ISO 8601 (Dashboard API) -> epoch seconds"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def format_ts(ts):
+    """Epoch seconds -> ISO 8601 the way the Dashboard API writes it"""
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def plan_resolution(metric, timespan, requested=None, budget=None):
+    """
+    Coarsest resolution of `metric` that still gives about one point per chart pixel (`budget`)
+    over `timespan`. Never finer than `requested` or than the endpoint accepts, so e.g.
+    지난 1개월 + 1분 간격 becomes a 30-minute series instead of a 43,200-point request.
+    """
+    budget = budget or CHART_POINT_BUDGET
+    # A bucket longer than the timespan would leave nothing to draw
+    allowed = [r for r in RESOLUTIONS[metric] if r <= timespan] or RESOLUTIONS[metric][:1]
+    floor = next((r for r in allowed if r >= (requested or 0)), allowed[-1])
+    fitting = [r for r in allowed if timespan / r >= budget]
+    return max(floor, fitting[-1] if fitting else allowed[0])
+
+
+def _gaps(coverage, start, now, resolution):
+    """
+    Intervals to fetch so [start, now] is covered, and the coverage afterwards
+    """
+    if coverage is None or coverage[1] < start or coverage[0] > now:
+        return [(start, now)], (start, now)
+    gaps = []
+    if start < coverage[0]:
+        gaps.append((start, coverage[0]))
+    if now - coverage[1] >= TAIL_MIN_AGE:
+        # Refetch the last stored bucket too: it was still filling when it was fetched
+        gaps.append((max(start, coverage[1] - resolution), now))
+    return gaps, (min(start, coverage[0]), max(now, coverage[1]))
+
+
+def _series(metric, network_id, timespan, resolution, fetch, store, scan, now=None, backfill=None, step=None):
+    """
+    Serve [now - timespan, now] of one series, fetching only uncovered intervals.
+    fetch(t0, t1) returns API rows; store(conn, rows) upserts them; scan(conn, start, end) reads.
+    With `backfill`, nothing older than now - backfill is fetched (the scan still spans the timespan).
+    `step` is the bucket length when `resolution` is NATIVE.
+    """
+    now = now or time.time()
+    start = now - timespan
+    fetch_start = max(start, now - backfill) if backfill else start
+    with _lock:
+        conn = _get_connection()
+        coverage = conn.execute(
+            "SELECT covered_from, covered_to FROM coverage WHERE metric = ? AND network_id = ? AND resolution = ?",
+            (metric, network_id, resolution)
+        ).fetchone()
+        _stats["requests"] += 1
+    gaps, covered = _gaps(coverage, fetch_start, now, step or resolution)
+
+    fetched = []
+    window = MAX_WINDOW[metric]
+    try:
+        for t0, t1 in gaps:
+            # Longer gaps are split into the longest windows the endpoint allows
+            while t0 < t1:
+                fetched.append(fetch(t0, min(t1, t0 + window)))
+                t0 += window
+    except Exception as e:
+        # Serve what is stored; coverage is left unchanged so the gap is retried next time
+        log.warning("%s fetch for %s failed, serving stored points: %s", metric, network_id, e)
+        fetched, covered = None, None
+
+    with _lock:
+        conn = _get_connection()
+        if fetched is not None:
+            with conn:
+                for rows in fetched:
+                    store(conn, network_id, resolution, rows)
+                    _stats["points_fetched"] += len(rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?, ?)",
+                    (metric, network_id, resolution, covered[0], covered[1])
+                )
+            _stats["api_calls"] += len(fetched)
+        result = scan(conn, network_id, resolution, start, now)
+        _stats["points_served"] += len(result)
+        due = time.time() - _last_compaction >= COMPACTION_INTERVAL
+    if due:
+        compact()
+    return result
+
+
+def _store_client_bandwidth(conn, network_id, resolution, rows):
+    conn.executemany(
+        "INSERT OR REPLACE INTO client_bandwidth VALUES (?, ?, ?, ?, ?, ?)",
+        [(network_id, resolution, parse_ts(r["ts"]), r.get("upstream"), r.get("downstream"), r.get("total"))
+         for r in rows if r.get("ts")]
+    )
+
+
+def _scan_client_bandwidth(conn, network_id, resolution, start, end):
+    cursor = conn.execute(
+        "SELECT ts, upstream, downstream, total FROM client_bandwidth "
+        "WHERE network_id = ? AND resolution = ? AND ts >= ? AND ts <= ? ORDER BY ts",
+        (network_id, resolution, start - start % CLIENT_BANDWIDTH_STEP, end)
+    )
+    return [{"ts": format_ts(ts), "upstream": up, "downstream": down, "total": total}
+            for ts, up, down, total in cursor.fetchall()]
+
+
+def client_bandwidth_history(api, network_id, timespan, now=None):
+    """
+    getNetworkClientsBandwidthUsageHistory for the last `timespan` seconds, oldest first, at the
+    intervals the API returned (finer for recently refreshed tails, coarser for long backfills)
+    """
+    def fetch(t0, t1):
+        return api.networks.getNetworkClientsBandwidthUsageHistory(
+            network_id, t0=format_ts(t0), t1=format_ts(t1), total_pages=-1
+        )
+    return _series("client_bandwidth", network_id, timespan, NATIVE, fetch,
+                   _store_client_bandwidth, _scan_client_bandwidth, now, step=CLIENT_BANDWIDTH_STEP)
+
+
+def _store_uplink_usage(conn, network_id, resolution, rows):
+    conn.executemany(
+        "INSERT OR REPLACE INTO uplink_usage VALUES (?, ?, ?, ?, ?, ?)",
+        [(network_id, resolution, parse_ts(r["startTime"]), i.get("interface"), i.get("sent"), i.get("received"))
+         for r in rows if r.get("startTime") for i in r.get("byInterface", [])]
+    )
+
+
+def _scan_uplink_usage(conn, network_id, resolution, start, end):
+    cursor = conn.execute(
+        "SELECT ts, interface, sent, received FROM uplink_usage "
+        "WHERE network_id = ? AND resolution = ? AND ts >= ? AND ts <= ? ORDER BY ts, interface",
+        (network_id, resolution, start - start % resolution, end)
+    )
+    points = []
+    for ts, interface, sent, received in cursor.fetchall():
+        if not points or points[-1]["_ts"] != ts:
+            points.append({"_ts": ts, "startTime": format_ts(ts), "endTime": format_ts(ts + resolution),
+                           "byInterface": []})
+        points[-1]["byInterface"].append({"interface": interface, "sent": sent, "received": received})
+    for point in points:
+        del point["_ts"]
+    return points
+
+
+def uplink_usage_history(api, network_id, timespan, resolution, now=None):
+    """
+    getNetworkApplianceUplinksUsageHistory for the last `timespan` seconds, oldest first
+    """
+    def fetch(t0, t1):
+        return api.appliance.getNetworkApplianceUplinksUsageHistory(
+            network_id, t0=format_ts(t0), t1=format_ts(t1), resolution=resolution
+        )
+    return _series("uplink_usage", network_id, timespan, resolution, fetch,
+                   _store_uplink_usage, _scan_uplink_usage, now)
+
+
+def _store_uplink_loss_latency(conn, org_id, resolution, rows):
+    conn.executemany(
+        "INSERT OR REPLACE INTO uplink_loss_latency VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [(org_id, r["serial"], r.get("uplink") or "", r.get("ip") or "", parse_ts(p["ts"]), r.get("networkId"),
+          p.get("lossPercent"), p.get("latencyMs"))
+         for r in rows if r.get("serial") for p in r.get("timeSeries") or [] if p.get("ts")]
+    )
+
+
+def _scan_uplink_loss_latency(conn, org_id, resolution, start, end):
+    cursor = conn.execute(
+        "SELECT network_id, serial, uplink, ip, ts, loss, latency FROM uplink_loss_latency "
+        "WHERE org_id = ? AND ts >= ? AND ts <= ? ORDER BY serial, uplink, ip, ts",
+        (org_id, start, end)
+    )
+    return [{"networkId": network_id, "serial": serial, "uplink": uplink, "ip": ip, "ts": format_ts(ts),
+             "lossPercent": loss, "latencyMs": latency}
+            for network_id, serial, uplink, ip, ts, loss, latency in cursor.fetchall()]
+
+
+def uplink_loss_latency_history(api, org_id, timespan, now=None):
+    """
+    Loss/latency samples of every appliance uplink in the organization for the last `timespan`
+    seconds, one flat row per (serial, uplink, ip, minute). The endpoint answers at most five
+    minutes per call, so after the backfill each refresh is a single org-wide call for the tail.
+    """
+    def fetch(t0, t1):
+        return api.organizations.getOrganizationDevicesUplinksLossAndLatency(
+            org_id, t0=format_ts(t0), t1=format_ts(t1)
+        )
+    now = (now or time.time()) - LOSS_LATENCY_DELAY
+    return _series("uplink_loss_latency", org_id, timespan, 60, fetch,
+                   _store_uplink_loss_latency, _scan_uplink_loss_latency, now, backfill=LOSS_LATENCY_BACKFILL)
+
+
+def compact(now=None):
+    """
+    Drop points (and coverage) older than the retention window. Returns points deleted.
+    """
+    global _last_compaction
+    now = now or time.time()
+    cutoff = now - TIMESERIES_RETENTION_DAYS * DAY
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            deleted = conn.execute("DELETE FROM client_bandwidth WHERE ts < ?", (cutoff,)).rowcount
+            deleted += conn.execute("DELETE FROM uplink_usage WHERE ts < ?", (cutoff,)).rowcount
+            deleted += conn.execute("DELETE FROM uplink_loss_latency WHERE ts < ?", (cutoff,)).rowcount
+            conn.execute("UPDATE coverage SET covered_from = ? WHERE covered_from < ?", (cutoff, cutoff))
+            conn.execute("DELETE FROM coverage WHERE covered_to < ?", (cutoff,))
+        _last_compaction = now
+    return deleted
+
+
+def get_timeseries_stats():
+    """
+    Request/API call/point counters since startup, for diagnostics
+    """
+    with _lock:
+        return dict(_stats)
@@ -0,0 +1,276 @@
+# Application traffic history
+# getNetworkTraffic only answers "the last N seconds", so each 트래픽 분석 timespan was a fresh set
+# of calls (one per device type) whose results could not be reused for any other timespan.
+# A collector thread snapshots the last hour of every network the traffic page has loaded within
+# TRAFFIC_TRACK_TTL, right after each hour boundary, and re-rolls the hour's day and week so the store holds a pyramid:
+#   hour buckets (HOUR_RETENTION_DAYS) -> day buckets -> week buckets (TIMESERIES_RETENTION_DAYS)
+# A timespan is answered by covering it with the fewest stored week/day/hour buckets and summing
+# them in one GROUP BY. Until enough history exists (MIN_COVERAGE) callers use the live API.
+import os
+import sqlite3
+import threading
+import time
+
+from meraki_anomaly import compact_anomalies, update_baselines
+from meraki_logging import get_logger
+from meraki_timeseries import TIMESERIES_DB, TIMESERIES_RETENTION_DAYS
+
+log = get_logger("timeseries")
+
+try:
+    from config import TRAFFIC_HISTORY_ENABLED
+except ImportError:
+    TRAFFIC_HISTORY_ENABLED = True
+
+try:
+    from config import TRAFFIC_TRACK_TTL
+except ImportError:
+    TRAFFIC_TRACK_TTL = 86400    # seconds a network stays collected after it was last requested
+
+HOUR, DAY, WEEK = 3600, 86400, 604800
+LEVELS = (WEEK, DAY, HOUR)       # coarsest first when covering a timespan
+DEVICE_TYPES = ("combined", "wireless", "switch", "appliance")
+COLLECT_DELAY = 15               # seconds after the hour boundary a snapshot starts
+COLLECT_WINDOW = 300             # later than this the last hour straddles two buckets - wait for the next
+COLLECT_RATE = 5.0               # collector API calls/second
+MIN_COVERAGE = 0.9               # fraction of a timespan that must be stored to answer it locally
+HOUR_RETENTION_DAYS = 8          # hour buckets are kept this long, days and weeks for the full retention
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS app_traffic (
+    network_id TEXT NOT NULL,
+    device_type TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    application TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    protocol TEXT NOT NULL,
+    port INTEGER NOT NULL,
+    sent REAL,
+    recv REAL,
+    num_clients INTEGER,
+    active_time INTEGER,
+    flows INTEGER,
+    PRIMARY KEY (network_id, device_type, level, bucket, application, destination, protocol, port)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS traffic_buckets (
+    network_id TEXT NOT NULL,
+    device_type TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    hours INTEGER NOT NULL,
+    PRIMARY KEY (network_id, device_type, level, bucket)
+);
+"""
+
+_KEY = "application, destination, protocol, port"
+_SUMS = "SUM(sent), SUM(recv), MAX(num_clients), SUM(active_time), SUM(flows)"
+
+_lock = threading.Lock()
+_conn = None
+_tracked = {}                    # network_id -> (dashboard API object, time.time() last requested)
+_worker = None
+_last_collected = 0
+
+
+def _connection():
+    # Own connection to the time-series database (WAL lets it write alongside the bandwidth store)
+    global _conn
+    if _conn is None:
+        directory = os.path.dirname(TIMESERIES_DB)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _conn = sqlite3.connect(TIMESERIES_DB, timeout=30, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.executescript(_SCHEMA)
+    return _conn
+
+
+def _row(network_id, device_type, level, bucket, item):
+    # NULL key parts are stored as ''/-1 (primary key columns cannot be NULL)
+    return (network_id, device_type, level, bucket, item.get("application") or "",
+            item.get("destination") or "", item.get("protocol") or "", item.get("port") or -1,
+            item.get("sent") or 0, item.get("recv") or 0, item.get("numClients") or 0,
+            item.get("activeTime") or 0, item.get("flows") or 0)
+
+
+def _roll_up(conn, network_id, device_type, child, parent, bucket):
+    # Rebuild the parent bucket containing `bucket` from its children
+    start = bucket - bucket % parent
+    params = (network_id, device_type, child, start, start + parent)
+    conn.execute("DELETE FROM app_traffic WHERE network_id = ? AND device_type = ? AND level = ? AND bucket = ?",
+                 (network_id, device_type, parent, start))
+    conn.execute(
+        f"INSERT INTO app_traffic SELECT network_id, device_type, {parent}, {start}, {_KEY}, {_SUMS} "
+        "FROM app_traffic WHERE network_id = ? AND device_type = ? AND level = ? AND bucket >= ? AND bucket < ? "
+        f"GROUP BY {_KEY}", params
+    )
+    hours = conn.execute(
+        "SELECT SUM(hours) FROM traffic_buckets "
+        "WHERE network_id = ? AND device_type = ? AND level = ? AND bucket >= ? AND bucket < ?", params
+    ).fetchone()[0]
+    conn.execute("INSERT OR REPLACE INTO traffic_buckets VALUES (?, ?, ?, ?, ?)",
+                 (network_id, device_type, parent, start, hours or 0))
+    return start
+
+
+def store_hour(network_id, device_type, hour, rows):
+    """
+    Store one hourly getNetworkTraffic snapshot and refresh the day and week it belongs to
+    """
+    hour -= hour % HOUR
+    with _lock:
+        conn = _connection()
+        with conn:
+            conn.execute("DELETE FROM app_traffic WHERE network_id = ? AND device_type = ? AND level = ? AND bucket = ?",
+                         (network_id, device_type, HOUR, hour))
+            # Rows that differ only in NULL key parts are merged
+            conn.executemany(
+                "INSERT INTO app_traffic VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                f"ON CONFLICT ({'network_id, device_type, level, bucket, ' + _KEY}) DO UPDATE SET "
+                "sent = sent + excluded.sent, recv = recv + excluded.recv, "
+                "num_clients = MAX(num_clients, excluded.num_clients), "
+                "active_time = active_time + excluded.active_time, flows = flows + excluded.flows",
+                [_row(network_id, device_type, HOUR, hour, item) for item in rows or []]
+            )
+            conn.execute("INSERT OR REPLACE INTO traffic_buckets VALUES (?, ?, ?, ?, 1)",
+                         (network_id, device_type, HOUR, hour))
+            day = _roll_up(conn, network_id, device_type, HOUR, DAY, hour)
+            _roll_up(conn, network_id, device_type, DAY, WEEK, day)
+
+
+def _cover(present, start, end):
+    # Fewest stored buckets tiling [start, end): the coarsest level that fits at each position
+    chosen, hours = [], 0
+    position = start
+    while position < end:
+        for size in LEVELS:
+            if position % size == 0 and position + size <= end and (size, position) in present:
+                chosen.append((size, position))
+                hours += present[(size, position)]
+                position += size
+                break
+        else:
+            position += HOUR   # hour not collected
+    return chosen, hours
+
+
+def traffic_history(network_id, timespan, device_types=DEVICE_TYPES, now=None):
+    """
+    {device_type: getNetworkTraffic-style rows} for the last `timespan` seconds (whole hours, up
+    to the last completed one) summed from stored buckets, or None if less than MIN_COVERAGE of
+    the span has been collected
+    """
+    if not TRAFFIC_HISTORY_ENABLED:
+        return None
+    now = now or time.time()
+    end = int(now - now % HOUR)
+    start = end - max(1, -(-int(timespan) // HOUR)) * HOUR
+    wanted = (end - start) // HOUR
+    result = {}
+    with _lock:
+        conn = _connection()
+        for device_type in device_types:
+            present = {(level, bucket): hours for level, bucket, hours in conn.execute(
+                "SELECT level, bucket, hours FROM traffic_buckets "
+                "WHERE network_id = ? AND device_type = ? AND bucket >= ? AND bucket < ?",
+                (network_id, device_type, start, end)
+            )}
+            chosen, hours = _cover(present, start, end)
+            if hours < wanted * MIN_COVERAGE:
+                return None
+            cursor = conn.execute(
+                f"SELECT {_KEY}, {_SUMS} FROM app_traffic WHERE network_id = ? AND device_type = ? "
+                f"AND (level, bucket) IN (VALUES {', '.join(['(?, ?)'] * len(chosen))}) "
+                f"GROUP BY {_KEY} ORDER BY SUM(sent) + SUM(recv) DESC",
+                (network_id, device_type, *[v for pair in chosen for v in pair])
+            )
+            result[device_type] = [{
+                "application": application, "destination": destination or None,
+                "protocol": protocol or None, "port": None if port == -1 else port,
+                "sent": sent, "recv": recv, "numClients": clients, "activeTime": active, "flows": flows,
+            } for application, destination, protocol, port, sent, recv, clients, active, flows in cursor.fetchall()]
+    return result
+
+
+def track_network(api, network_id):
+    """
+    Have the collector snapshot this network every hour until TRAFFIC_TRACK_TTL passes
+    without it being requested again
+    """
+    global _worker
+    if not TRAFFIC_HISTORY_ENABLED:
+        return
+    with _lock:
+        _tracked[network_id] = (api, time.time())
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="meraki-traffic-collector", daemon=True)
+            _worker.start()
+
+
+def collect(hour):
+    """
+    Snapshot the last hour of every tracked network as bucket `hour`, first dropping networks not
+    requested within TRAFFIC_TRACK_TTL (each costs four calls an hour). Returns snapshots stored.
+    """
+    cutoff = time.time() - TRAFFIC_TRACK_TTL
+    with _lock:
+        expired = [network_id for network_id, (_, requested) in _tracked.items() if requested < cutoff]
+        for network_id in expired:
+            del _tracked[network_id]
+        tracked = [(network_id, api) for network_id, (api, _) in _tracked.items()]
+    if expired:
+        log.debug("Stopped collecting traffic of %d networks not requested for %ds", len(expired), TRAFFIC_TRACK_TTL)
+    stored = 0
+    for network_id, api in tracked:
+        for device_type in DEVICE_TYPES:
+            try:
+                rows = api.networks.getNetworkTraffic(network_id, timespan=HOUR, deviceType=device_type)
+            except Exception as e:
+                log.warning("Traffic snapshot of %s (%s) failed: %s", network_id, device_type, e)
+            else:
+                store_hour(network_id, device_type, hour, rows)
+                if device_type == "combined":
+                    update_baselines(network_id, hour, rows)
+                stored += 1
+            time.sleep(1 / COLLECT_RATE)
+    log.debug("Stored %d hourly traffic snapshots for %d networks", stored, len(tracked))
+    return stored
+
+
+def compact(now=None):
+    """
+    Drop hour buckets after HOUR_RETENTION_DAYS and everything after the time-series retention
+    """
+    now = now or time.time()
+    with _lock:
+        conn = _connection()
+        with conn:
+            for table in ("app_traffic", "traffic_buckets"):
+                conn.execute(f"DELETE FROM {table} WHERE level = ? AND bucket < ?", (HOUR, now - HOUR_RETENTION_DAYS * DAY))
+                conn.execute(f"DELETE FROM {table} WHERE bucket < ?", (now - TIMESERIES_RETENTION_DAYS * DAY - WEEK,))
+
+
+def _run():
+    global _last_collected
+    while True:
+        now = time.time()
+        boundary = int(now - now % HOUR)
+        since = now - boundary
+        if boundary <= _last_collected or since > COLLECT_WINDOW:
+            time.sleep(boundary + HOUR + COLLECT_DELAY - now)
+            continue
+        if since < COLLECT_DELAY:
+            time.sleep(COLLECT_DELAY - since)
+            continue
+        try:
+            collect(boundary - HOUR)
+            compact()
+            compact_anomalies()
+        except Exception as e:
+            # An API or store failure skips this hour instead of killing the collector thread
+            log.warning("Traffic history collection for %d failed: %s", boundary - HOUR, e)
+        finally:
+            _last_collected = boundary
@@ -3,108 +3,250 @@
 import streamlit as st
 import json
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
+from collections import Counter, deque
 import os
+import sys
+import zlib
 import hashlib
 import hmac
 import base64
 import time
 
-# Store webhook events in memory (for demo/development)
-# In production, consider using a database
-if 'webhook_events' not in st.session_state:
-    st.session_state.webhook_events = []
+from meraki_device_status import apply_webhook_event
+from meraki_webhook_history import record_event, query_history, get_history_summary
+from meraki_logging import get_logger
+
+log = get_logger("webhooks")
+
+# Maximum number of events kept in memory
+try:
+    from config import WEBHOOK_STORE_EVENTS
+except ImportError:
+    WEBHOOK_STORE_EVENTS = 1000
+
+# zlib level for stored raw payloads; JSON webhooks compress roughly 4-8x
+RAW_DATA_COMPRESSION_LEVEL = 6
+
+
+class WebhookEvent:
+    """
+    Compact webhook event record
+    Extracted fields are stored once as slots, repeated strings (types, models,
+    network/org names) are interned, and the raw payload is kept zlib-compressed
+    and only decoded when raw_data or alert_data is read.
+    """
+    __slots__ = (
+        "id", "ts", "type", "type_id", "level",
+        "device_name", "device_serial", "device_model", "device_mac",
+        "network_id", "network_name", "org_id", "org_name",
+        "key", "_raw",
+    )
+
+    def __init__(self, webhook_data, raw_body=None):
+        intern = sys.intern
+        self.id = str(webhook_data.get("alertId", "Unknown"))
+        self.type = intern(str(webhook_data.get("alertType", "Unknown")))
+        self.type_id = intern(str(webhook_data.get("alertTypeId", "Unknown")))
+        self.level = intern(str(webhook_data.get("alertLevel", "informational")))
+        self.ts = _parse_occurred_at(webhook_data.get("occurredAt"))
+        
+        self.device_name = intern(str(webhook_data.get("deviceName", "Unknown")))
+        self.device_serial = intern(str(webhook_data.get("deviceSerial", "Unknown")))
+        self.device_model = intern(str(webhook_data.get("deviceModel", "Unknown")))
+        self.device_mac = intern(str(webhook_data.get("deviceMac", "Unknown")))
+        
+        self.network_id = intern(str(webhook_data.get("networkId", "Unknown")))
+        self.network_name = intern(str(webhook_data.get("networkName", "Unknown")))
+        self.org_id = intern(str(webhook_data.get("organizationId", "Unknown")))
+        self.org_name = intern(str(webhook_data.get("organizationName", "Unknown")))
+        self.key = _event_key(webhook_data)
+        
+        # Reuse the received body when we have it instead of re-serializing the dict
+        if raw_body is None:
+            raw_body = json.dumps(webhook_data, separators=(",", ":"), default=str).encode("utf-8")
+        elif isinstance(raw_body, str):
+            raw_body = raw_body.encode("utf-8")
+        self._raw = zlib.compress(bytes(raw_body), RAW_DATA_COMPRESSION_LEVEL)
+
+    @property
+    def timestamp(self):
+        return datetime.fromtimestamp(self.ts, tz=timezone.utc)
+
+    @property
+    def raw_data(self):
+        return json.loads(zlib.decompress(self._raw))
+
+    @property
+    def alert_data(self):
+        return self.raw_data.get("alertData", {}) or {}
+
+    @property
+    def device(self):
+        return {
+            "name": self.device_name,
+            "serial": self.device_serial,
+            "model": self.device_model,
+            "mac": self.device_mac
+        }
+
+    @property
+    def network(self):
+        return {"id": self.network_id, "name": self.network_name}
+
+    @property
+    def organization(self):
+        return {"id": self.org_id, "name": self.org_name}
+
+    # Dict-style access so callers written against the old nested dict keep working
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "type": self.type,
+            "type_id": self.type_id,
+            "level": self.level,
+            "device": self.device,
+            "network": self.network,
+            "organization": self.organization,
+            "alert_data": self.alert_data,
+            "raw_data": self.raw_data
+        }
+
+
+def _event_key(webhook_data):
+    """
+    Identity of an alert across redeliveries: its alertId, or a hash of the payload without
+    sentAt (the only field a retry changes) when the alert has no id
+    """
+    alert_id = webhook_data.get("alertId")
+    if alert_id:
+        return f"id:{alert_id}"
+    payload = {k: v for k, v in webhook_data.items() if k != "sentAt"}
+    digest = hashlib.sha1(json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+    return "sha1:" + digest.hexdigest()
+
+
+def _parse_occurred_at(occurred_at):
+    """
+    Convert the webhook occurredAt ISO 8601 string to a UTC epoch, falling back to now
+    """
+    if occurred_at:
+        try:
+            return datetime.fromisoformat(occurred_at.replace("Z", "+00:00")).timestamp()
+        except (ValueError, AttributeError):
+            pass
+    return time.time()
+
+
+def _get_event_store():
+    """
+    Return this session's bounded event buffer, creating it on first use
+    """
+    if 'webhook_events' not in st.session_state:
+        st.session_state.webhook_events = deque(maxlen=WEBHOOK_STORE_EVENTS)
+    return st.session_state.webhook_events
+
+# Keyed HMAC templates, one per shared secret.
+# Copying a keyed template skips re-deriving the inner/outer key pads on every request.
+_hmac_templates = {}
+
+def _get_hmac_template(shared_secret):
+    """
+    Return the precomputed keyed HMAC-SHA256 object for a shared secret
+    """
+    template = _hmac_templates.get(shared_secret)
+    if template is None:
+        key = shared_secret.encode('utf-8') if isinstance(shared_secret, str) else bytes(shared_secret)
+        template = hmac.new(key=key, digestmod=hashlib.sha256)
+        _hmac_templates[shared_secret] = template
+    return template
 
 def verify_webhook(data, shared_secret, signature):
     """
     Verify the webhook signature using the shared secret
+    data should be the raw request body (bytes, bytearray or memoryview) exactly as received,
+    so it is hashed without a decode/re-encode round trip. str is still accepted.
     """
     if not shared_secret or not signature:
         return False
     
-    # Calculate HMAC signature
-    computed_hash = hmac.new(
-        key=shared_secret.encode('utf-8'),
-        msg=data.encode('utf-8'),
-        digestmod=hashlib.sha256
-    ).digest()
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    
+    # Calculate HMAC signature from a copy of the keyed template
+    mac = _get_hmac_template(shared_secret).copy()
+    mac.update(data)
     
     # Encode in base64
-    computed_signature = base64.b64encode(computed_hash).decode()
+    computed_signature = base64.b64encode(mac.digest())
+    
+    if isinstance(signature, str):
+        try:
+            signature = signature.encode('ascii')
+        except UnicodeEncodeError:
+            return False
     
     # Compare signatures
     return hmac.compare_digest(computed_signature, signature)
 
-def process_webhook(webhook_data):
+def verify_webhooks(requests_batch, shared_secret):
+    """
+    Verify a batch of (raw_body, signature) pairs against one shared secret
+    Returns a list of booleans in the same order
+    """
+    if not shared_secret:
+        return [False for _ in requests_batch]
+    
+    template = _get_hmac_template(shared_secret)
+    results = []
+    for data, signature in requests_batch:
+        if not signature:
+            results.append(False)
+            continue
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if isinstance(signature, str):
+            try:
+                signature = signature.encode('ascii')
+            except UnicodeEncodeError:
+                results.append(False)
+                continue
+        mac = template.copy()
+        mac.update(data)
+        results.append(hmac.compare_digest(base64.b64encode(mac.digest()), signature))
+    return results
+
+def process_webhook(webhook_data, raw_body=None):
     """
     Process incoming webhook data
+    raw_body is the request body the payload was parsed from, if available;
+    it is stored compressed instead of re-serializing webhook_data.
     """
     try:
-        # Extract main webhook data
-        alert_id = webhook_data.get("alertId", "Unknown")
-        alert_type = webhook_data.get("alertType", "Unknown")
-        alert_type_id = webhook_data.get("alertTypeId", "Unknown")
-        alert_level = webhook_data.get("alertLevel", "informational")
-        occurred_at = webhook_data.get("occurredAt")
-        
-        # Extract device information
-        device_name = webhook_data.get("deviceName", "Unknown")
-        device_serial = webhook_data.get("deviceSerial", "Unknown")
-        device_model = webhook_data.get("deviceModel", "Unknown")
-        device_mac = webhook_data.get("deviceMac", "Unknown")
-        
-        # Extract network information
-        network_id = webhook_data.get("networkId", "Unknown")
-        network_name = webhook_data.get("networkName", "Unknown")
+        # Create compact event record
+        event = WebhookEvent(webhook_data, raw_body)
         
-        # Extract organization information
-        org_id = webhook_data.get("organizationId", "Unknown")
-        org_name = webhook_data.get("organizationName", "Unknown")
-        
-        # Extract alert data
-        alert_data = webhook_data.get("alertData", {})
-        
-        # Format occurred_at as datetime if available
-        timestamp = None
-        if occurred_at:
-            try:
-                timestamp = datetime.fromisoformat(occurred_at.replace("Z", "+00:00"))
-            except ValueError:
-                timestamp = datetime.now()  # Fallback to current time
-        else:
-            timestamp = datetime.now()
-            
-        # Create event record
-        event = {
-            "id": alert_id,
-            "timestamp": timestamp,
-            "type": alert_type,
-            "type_id": alert_type_id,
-            "level": alert_level,
-            "device": {
-                "name": device_name,
-                "serial": device_serial,
-                "model": device_model,
-                "mac": device_mac
-            },
-            "network": {
-                "id": network_id,
-                "name": network_name
-            },
-            "organization": {
-                "id": org_id,
-                "name": org_name
-            },
-            "alert_data": alert_data,
-            "raw_data": webhook_data
-        }
+        # Store event - the deque drops the oldest events beyond WEBHOOK_STORE_EVENTS
+        _get_event_store().append(event)
         
-        # Store event
-        st.session_state.webhook_events.append(event)
+        # Persist to the tiered history store; a storage failure must not drop the live event
+        try:
+            record_event(event)
+        except Exception as e:
+            log.warning("Failed to persist webhook event %s: %s", event.id, e)
         
-        # Limit stored events (optional)
-        if len(st.session_state.webhook_events) > 1000:
-            st.session_state.webhook_events = st.session_state.webhook_events[-1000:]
+        # Patch the cached device snapshot (device up/down) or flag it for refresh (config change)
+        apply_webhook_event(webhook_data)
         
         return True, event
     except Exception as e:
@@ -114,25 +256,22 @@ def get_webhook_events(max_events=100, filter_level=None, filter_type=None):
     """
     Get stored webhook events with optional filtering
     """
-    events = st.session_state.webhook_events
+    events = _get_event_store()
     
     # Apply filters
     if filter_level:
-        events = [e for e in events if e.get("level") == filter_level]
+        events = [e for e in events if e.level == filter_level]
     if filter_type:
-        events = [e for e in events if e.get("type_id") == filter_type]
+        events = [e for e in events if e.type_id == filter_type]
     
-    # Sort by timestamp (newest first)
-    events = sorted(events, key=lambda x: x.get("timestamp", datetime.now()), reverse=True)
-    
-    # Limit number of events
-    return events[:max_events]
+    # Newest first
+    return sorted(events, key=lambda e: e.ts, reverse=True)[:max_events]
 
 def get_webhook_stats():
     """
     Get statistics about webhook events
     """
-    events = st.session_state.webhook_events
+    events = _get_event_store()
     
     if not events:
         return {
@@ -144,41 +283,57 @@ def get_webhook_stats():
             "latest_timestamp": None
         }
     
-    # Count by level
-    level_counts = {}
-    for e in events:
-        level = e.get("level", "unknown")
-        level_counts[level] = level_counts.get(level, 0) + 1
-    
-    # Count by type
-    type_counts = {}
-    for e in events:
-        alert_type = e.get("type", "unknown")
-        type_counts[alert_type] = type_counts.get(alert_type, 0) + 1
+    return {
+        "total_count": len(events),
+        "level_counts": dict(Counter(e.level for e in events)),
+        "type_counts": dict(Counter(e.type for e in events)),
+        "network_counts": dict(Counter(e.network_name for e in events)),
+        "device_counts": dict(Counter(e.device_name for e in events)),
+        "latest_timestamp": datetime.fromtimestamp(max(e.ts for e in events), tz=timezone.utc)
+    }
+
+HISTORY_RANGES = {
+    "Last 24 hours": 86400,
+    "Last 7 days": 7 * 86400,
+    "Last 30 days": 30 * 86400,
+    "Last 90 days": 90 * 86400,
+    "Last year": 365 * 86400
+}
+
+def render_webhook_history():
+    """
+    Render event trends from the tiered history store
+    """
+    st.subheader("Event History")
+    history_range = st.selectbox("History Range", list(HISTORY_RANGES.keys()),
+                                 key="webhook_history_range")
+    # Hourly buckets up to a week, daily beyond that; counts are aggregated in SQL from
+    # whichever tier covers the range instead of loading every event
+    span = HISTORY_RANGES[history_range]
+    tier, counts = query_history(time.time() - span, bucket=3600 if span <= 7 * 86400 else 86400)
     
-    # Count by network
-    network_counts = {}
-    for e in events:
-        network_name = e.get("network", {}).get("name", "unknown")
-        network_counts[network_name] = network_counts.get(network_name, 0) + 1
+    summary = get_history_summary()
+    st.caption(f"Source: {'raw events' if tier == 'raw' else 'hourly rollups'} "
+               f"(raw kept {summary['raw_retention_days']} days, "
+               f"rollups kept {summary['rollup_retention_days']} days)")
     
-    # Count by device
-    device_counts = {}
-    for e in events:
-        device_name = e.get("device", {}).get("name", "unknown")
-        device_counts[device_name] = device_counts.get(device_name, 0) + 1
+    if not counts["trend"]:
+        st.info("No webhook history for this range.")
+        return
     
-    # Get latest timestamp
-    latest_timestamp = max([e.get("timestamp", datetime.fromtimestamp(0)) for e in events])
+    trend = pd.DataFrame(counts["trend"], columns=["time", "level", "count"])
+    trend["time"] = pd.to_datetime(trend["time"], unit="s", utc=True)
+    st.bar_chart(trend.pivot(index="time", columns="level", values="count").fillna(0))
     
-    return {
-        "total_count": len(events),
-        "level_counts": level_counts,
-        "type_counts": type_counts,
-        "network_counts": network_counts,
-        "device_counts": device_counts,
-        "latest_timestamp": latest_timestamp
-    }
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**By Type**")
+        st.dataframe(pd.DataFrame(counts["by_type"], columns=["type", "count"]).set_index("type"),
+                     use_container_width=True)
+    with col2:
+        st.markdown("**By Network**")
+        st.dataframe(pd.DataFrame(counts["by_network"], columns=["network_name", "count"]).set_index("network_name"),
+                     use_container_width=True)
 
 def render_webhooks_dashboard():
     """
@@ -210,6 +365,8 @@ def render_webhooks_dashboard():
         latest_time_str = stats["latest_timestamp"].strftime("%Y-%m-%d %H:%M:%S")
         st.info(f"Latest event received: {latest_time_str}")
     
+    render_webhook_history()
+    
     # Filter options
     st.subheader("Event Filters")
     col1, col2 = st.columns(2)
@@ -240,12 +397,12 @@ def render_webhooks_dashboard():
     event_rows = []
     for event in filtered_events:
         event_rows.append({
-            "Time": event.get("timestamp").strftime("%Y-%m-%d %H:%M:%S") if event.get("timestamp") else "Unknown",
-            "Level": event.get("level", "Unknown"),
-            "Type": event.get("type", "Unknown"),
-            "Device": event.get("device", {}).get("name", "Unknown"),
-            "Network": event.get("network", {}).get("name", "Unknown"),
-            "ID": event.get("id", "Unknown")
+            "Time": event.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            "Level": event.level,
+            "Type": event.type,
+            "Device": event.device_name,
+            "Network": event.network_name,
+            "ID": event.id
         })
     
     events_df = pd.DataFrame(event_rows)
@@ -254,8 +411,7 @@ def render_webhooks_dashboard():
     # Event details section
     st.subheader("Event Details")
     selected_event_id = st.selectbox("Select Event", 
-                                    [f"{e['id']} - {e['type']} ({e['timestamp'].strftime('%H:%M:%S')})" 
-                                     if e.get("timestamp") else f"{e['id']} - {e['type']}"
+                                    [f"{e.id} - {e.type} ({e.timestamp.strftime('%H:%M:%S')})"
                                      for e in filtered_events],
                                     key="webhook_event_selector")
     
@@ -263,7 +419,7 @@ def render_webhooks_dashboard():
     selected_id = selected_event_id.split(" - ")[0]
     
     # Find the selected event
-    selected_event = next((e for e in filtered_events if e["id"] == selected_id), None)
+    selected_event = next((e for e in filtered_events if e.id == selected_id), None)
     
     if selected_event:
         # Display event details
@@ -271,28 +427,28 @@ def render_webhooks_dashboard():
         
         with col1:
             st.markdown("### Event Information")
-            st.write(f"**ID:** {selected_event['id']}")
-            st.write(f"**Type:** {selected_event['type']}")
-            st.write(f"**Level:** {selected_event['level']}")
-            if selected_event.get("timestamp"):
-                st.write(f"**Time:** {selected_event['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
+            st.write(f"**ID:** {selected_event.id}")
+            st.write(f"**Type:** {selected_event.type}")
+            st.write(f"**Level:** {selected_event.level}")
+            st.write(f"**Time:** {selected_event.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
         
         with col2:
             st.markdown("### Device & Network")
-            st.write(f"**Device:** {selected_event['device']['name']}")
-            st.write(f"**Model:** {selected_event['device']['model']}")
-            st.write(f"**Serial:** {selected_event['device']['serial']}")
-            st.write(f"**Network:** {selected_event['network']['name']}")
+            st.write(f"**Device:** {selected_event.device_name}")
+            st.write(f"**Model:** {selected_event.device_model}")
+            st.write(f"**Serial:** {selected_event.device_serial}")
+            st.write(f"**Network:** {selected_event.network_name}")
         
-        # Alert data (if any)
-        if selected_event.get("alert_data"):
+        # Alert data (if any) - decompressed only for the selected event
+        alert_data = selected_event.alert_data
+        if alert_data:
             st.markdown("### Alert Data")
-            for key, value in selected_event["alert_data"].items():
+            for key, value in alert_data.items():
                 st.write(f"**{key}:** {value}")
         
         # Raw data (for debugging)
         with st.expander("Raw Data"):
-            st.json(selected_event["raw_data"])
+            st.json(selected_event.raw_data)
 
 def create_webhook_endpoint(app, api_key=None, webhook_secret=None):
     """
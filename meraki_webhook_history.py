@@ -0,0 +1,212 @@
+# Meraki Webhook History Store
+# Tiered retention for webhook events:
+#   raw tier    - every event with its compressed payload, kept WEBHOOK_RAW_RETENTION_DAYS
+#   hourly tier - event counts per hour/type/level/network/device, kept WEBHOOK_ROLLUP_RETENTION_DAYS
+# Rollups are updated on ingest, so compaction only has to delete expired rows.
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    from config import WEBHOOK_HISTORY_DB
+except ImportError:
+    WEBHOOK_HISTORY_DB = os.path.join("data", "webhook_history.db")
+
+try:
+    from config import WEBHOOK_RAW_RETENTION_DAYS
+except ImportError:
+    WEBHOOK_RAW_RETENTION_DAYS = 7
+
+try:
+    from config import WEBHOOK_ROLLUP_RETENTION_DAYS
+except ImportError:
+    WEBHOOK_ROLLUP_RETENTION_DAYS = 365
+
+# How often ingest triggers an automatic compaction pass
+COMPACTION_INTERVAL = 3600
+
+HOUR = 3600
+DAY = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT,
+    ts REAL NOT NULL,
+    type TEXT,
+    type_id TEXT,
+    level TEXT,
+    device_serial TEXT,
+    device_name TEXT,
+    device_model TEXT,
+    network_id TEXT,
+    network_name TEXT,
+    org_id TEXT,
+    raw BLOB,
+    key TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+
+CREATE TABLE IF NOT EXISTS hourly (
+    hour REAL NOT NULL,
+    type_id TEXT NOT NULL,
+    type TEXT,
+    level TEXT NOT NULL,
+    network_id TEXT NOT NULL,
+    network_name TEXT,
+    device_serial TEXT NOT NULL,
+    device_name TEXT,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (hour, type_id, level, network_id, device_serial)
+);
+"""
+
+_lock = threading.Lock()
+_conn = None
+_last_compaction = 0.0
+
+
+def _get_connection():
+    """
+    Open the history database on first use (shared by all sessions in this process)
+    """
+    global _conn
+    if _conn is None:
+        directory = os.path.dirname(WEBHOOK_HISTORY_DB)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _conn = sqlite3.connect(WEBHOOK_HISTORY_DB, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.executescript(_SCHEMA)
+        _add_event_key(_conn)
+    return _conn
+
+
+def _add_event_key(conn):
+    # Meraki retries a webhook until it is acknowledged; events.key (the alert id, or a payload
+    # hash for alerts without one - see WebhookEvent.key) identifies the redeliveries. Stores
+    # created before the key existed get it from the stored id and may hold retries; keep one
+    # copy of each before adding the unique index.
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_events_dedupe'").fetchone():
+        return
+    with conn:
+        if "key" not in [row[1] for row in conn.execute("PRAGMA table_info(events)")]:
+            conn.execute("ALTER TABLE events ADD COLUMN key TEXT")
+        conn.execute(
+            "UPDATE events SET key = CASE WHEN id IS NOT NULL AND id != 'Unknown' THEN 'id:' || id "
+            "ELSE 'row:' || rowid END WHERE key IS NULL"
+        )
+        conn.execute("DELETE FROM events WHERE rowid NOT IN (SELECT MIN(rowid) FROM events GROUP BY key)")
+        conn.execute("DROP INDEX IF EXISTS idx_events_key")
+        conn.execute("CREATE UNIQUE INDEX idx_events_dedupe ON events (key)")
+
+
+def record_event(event):
+    """
+    Persist a WebhookEvent to the raw tier and add it to its hourly rollup.
+    Redelivered events are ignored; returns False for those.
+    """
+    hour = event.ts - event.ts % HOUR
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (event.id, event.ts, event.type, event.type_id, event.level,
+                 event.device_serial, event.device_name, event.device_model,
+                 event.network_id, event.network_name, event.org_id, event._raw, event.key)
+            ).rowcount == 1
+            if inserted:
+                conn.execute(
+                    "INSERT INTO hourly VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1) "
+                    "ON CONFLICT (hour, type_id, level, network_id, device_serial) "
+                    "DO UPDATE SET count = count + 1",
+                    (hour, event.type_id, event.type, event.level,
+                     event.network_id, event.network_name,
+                     event.device_serial, event.device_name)
+                )
+        due = time.time() - _last_compaction >= COMPACTION_INTERVAL
+    if due:
+        compact()
+    return inserted
+
+
+def compact(now=None):
+    """
+    Drop raw events and hourly rollups that have aged out of their tier.
+    Returns (raw_deleted, hourly_deleted).
+    """
+    global _last_compaction
+    now = now or time.time()
+    raw_cutoff = now - WEBHOOK_RAW_RETENTION_DAYS * DAY
+    rollup_cutoff = now - WEBHOOK_ROLLUP_RETENTION_DAYS * DAY
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            raw_deleted = conn.execute("DELETE FROM events WHERE ts < ?", (raw_cutoff,)).rowcount
+            hourly_deleted = conn.execute("DELETE FROM hourly WHERE hour < ?", (rollup_cutoff,)).rowcount
+        _last_compaction = now
+    return raw_deleted, hourly_deleted
+
+
+def get_tier(start_ts, now=None):
+    """
+    Return 'raw' if the raw tier still covers start_ts, otherwise 'hourly'
+    """
+    now = now or time.time()
+    return "raw" if start_ts >= now - WEBHOOK_RAW_RETENTION_DAYS * DAY else "hourly"
+
+
+# tier -> (table, time column, event count of a row)
+_TIER_SOURCES = {
+    "raw": ("events", "ts", "1"),
+    "hourly": ("hourly", "hour", "count"),
+}
+
+
+def query_history(start_ts, end_ts=None, bucket=HOUR):
+    """
+    Event counts for a time range from whichever tier covers it, aggregated in SQL into
+    `bucket`-second buckets (an hour or more, so both tiers give the same answer).
+    Returns (tier, {"trend": [(bucket_ts, level, count)], "by_type": [(type, count)],
+    "by_network": [(network_name, count)]}), the last two sorted by count.
+    """
+    end_ts = end_ts or time.time()
+    tier = get_tier(start_ts)
+    table, column, count = _TIER_SOURCES[tier]
+    # Hourly rows are stamped with the start of their hour
+    window = (start_ts if tier == "raw" else start_ts - start_ts % HOUR, end_ts)
+    where = f"FROM {table} WHERE {column} >= ? AND {column} <= ?"
+    with _lock:
+        conn = _get_connection()
+        trend = conn.execute(
+            f"SELECT CAST({column} AS INTEGER) - CAST({column} AS INTEGER) % ? AS bucket, level, "
+            f"SUM({count}) {where} GROUP BY bucket, level ORDER BY bucket",
+            (bucket, *window)
+        ).fetchall()
+        by_type = conn.execute(
+            f"SELECT type, SUM({count}) AS n {where} GROUP BY type ORDER BY n DESC", window
+        ).fetchall()
+        by_network = conn.execute(
+            f"SELECT network_name, SUM({count}) AS n {where} GROUP BY network_name ORDER BY n DESC", window
+        ).fetchall()
+    return tier, {"trend": trend, "by_type": by_type, "by_network": by_network}
+
+
+def get_history_summary():
+    """
+    Row counts and time coverage of each tier
+    """
+    with _lock:
+        conn = _get_connection()
+        raw_count, raw_oldest = conn.execute("SELECT COUNT(*), MIN(ts) FROM events").fetchone()
+        hourly_count, hourly_oldest = conn.execute("SELECT COUNT(*), MIN(hour) FROM hourly").fetchone()
+    return {
+        "raw_events": raw_count,
+        "raw_oldest": raw_oldest,
+        "hourly_rows": hourly_count,
+        "hourly_oldest": hourly_oldest,
+        "raw_retention_days": WEBHOOK_RAW_RETENTION_DAYS,
+        "rollup_retention_days": WEBHOOK_ROLLUP_RETENTION_DAYS
+    }
@@ -0,0 +1,830 @@
+#!/usr/bin/env python3
+"""
+🧪 Local Meraki Dashboard API stand-in
+
+Serves deterministic synthetic organizations over the v1 REST paths the dashboard
+uses, so loaders, parallel_api_calls and pages can be exercised and benchmarked
+without a live org or API key.
+
+Emulates:
+  - configurable scale (orgs, networks, devices, clients, traffic rows)
+  - per-request latency with jitter
+  - per-organization rate limiting (429 + Retry-After), like the real 10 req/s budget
+  - Link-header pagination with perPage / startingAfter / endingBefore
+  - t0/t1/timespan/resolution on time-series endpoints, with values fixed per bucket
+
+Usage:
+    python mock_meraki_api.py --networks 100 --devices-per-network 20 --port 8765
+    MERAKI_BASE_URL=http://127.0.0.1:8765/api/v1 streamlit run meraki_dashboard_complete_final.py
+
+Any non-empty API key is accepted. Link headers carry paths relative to the API
+base (the SDK only follows absolute URLs on meraki.com hosts and prefixes
+everything else with base_url).
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+API_PREFIX = "/api/v1"
+
+PRODUCT_MODELS = {
+    "appliance": ["MX67", "MX85", "MX105"],
+    "switch": ["MS120-8LP", "MS225-48LP", "MS250-24P"],
+    "wireless": ["MR36", "MR46", "MR56"],
+    "camera": ["MV12", "MV22"],
+    "sensor": ["MT10", "MT12"],
+}
+# Device mix per network, roughly what a branch deployment looks like
+PRODUCT_WEIGHTS = [("appliance", 1), ("switch", 4), ("wireless", 10), ("camera", 2), ("sensor", 1)]
+STATUS_WEIGHTS = [("online", 90), ("alerting", 4), ("offline", 5), ("dormant", 1)]
+APPLICATIONS = ["Google HTTPS", "Microsoft 365", "YouTube", "Zoom", "Slack", "Dropbox",
+                "Salesforce", "Netflix", "AWS", "Webex", "Teams", "Miscellaneous web"]
+EVENT_TYPES = {
+    "appliance": [("vpn_connectivity_change", "VPN connectivity changed"), ("dhcp_lease", "DHCP lease")],
+    "switch": [("port_status", "Port status change"), ("stp_port_role_change", "STP role change")],
+    "wireless": [("association", "802.11 association"), ("disassociation", "802.11 disassociation")],
+    "camera": [("motion_alert", "Motion alert")],
+    "sensor": [("sensor_alert", "Sensor alert")],
+}
+
+
+def _weighted(rng, choices):
+    return rng.choices([c for c, _ in choices], weights=[w for _, w in choices])[0]
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _parse_iso(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class MockDataset:
+    """
+    Deterministic synthetic Meraki inventory.
+    Orgs, networks and devices are built up front; per-network clients, traffic and
+    events are generated on demand from a seed derived from the network id.
+    """
+
+    def __init__(self, orgs=1, networks=10, devices_per_network=20, clients_per_network=50,
+                 traffic_rows=50, events_per_device=20, seed=42):
+        self.seed = seed
+        self.clients_per_network = clients_per_network
+        self.traffic_rows = traffic_rows
+        self.events_per_device = events_per_device
+        self.epoch = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+        rng = random.Random(seed)
+        self.orgs = []
+        self.networks = {}           # org_id -> [network]
+        self.devices = {}            # org_id -> [device]
+        self.network_index = {}      # network_id -> (org_id, network)
+        self.device_index = {}       # serial -> (org_id, device)
+        self.network_devices = {}    # network_id -> [device]
+
+        for o in range(orgs):
+            org_id = str(100000 + o)
+            self.orgs.append({
+                "id": org_id,
+                "name": f"Mock Org {o + 1}",
+                "url": f"https://n1.meraki.com/o/mock{o}/manage/organization/overview",
+                "api": {"enabled": True},
+                "licensing": {"model": "co-term"},
+                "cloud": {"region": {"name": "North America"}},
+            })
+            self.networks[org_id] = []
+            self.devices[org_id] = []
+            for n in range(networks):
+                net_id = f"L_{org_id}{n:06d}"
+                network = {
+                    "id": net_id,
+                    "organizationId": org_id,
+                    "name": f"Branch {n + 1:04d}",
+                    "productTypes": [p for p, _ in PRODUCT_WEIGHTS],
+                    "timeZone": "Asia/Seoul",
+                    "tags": [],
+                    "url": f"https://n1.meraki.com/Branch-{n + 1}/n/mock/manage/usage/list",
+                    "isBoundToConfigTemplate": False,
+                }
+                self.networks[org_id].append(network)
+                self.network_index[net_id] = (org_id, network)
+                self.network_devices[net_id] = []
+                for d in range(devices_per_network):
+                    product = _weighted(rng, PRODUCT_WEIGHTS)
+                    serial = f"Q2{o:02d}-{n:04d}-{d:04d}"
+                    status = _weighted(rng, STATUS_WEIGHTS)
+                    device = {
+                        "name": f"{product[:2].upper()}-{n + 1:04d}-{d + 1:02d}",
+                        "serial": serial,
+                        "mac": f"e0:55:3d:{o:02x}:{n % 256:02x}:{d % 256:02x}",
+                        "model": rng.choice(PRODUCT_MODELS[product]),
+                        "productType": product,
+                        "networkId": net_id,
+                        "firmware": f"{product}-18-{rng.randint(100, 211)}",
+                        "lanIp": f"10.{n % 256}.{d // 256}.{d % 256 + 1}",
+                        "tags": [],
+                        "status": status,
+                        "lastReportedAt": _iso(self.epoch - timedelta(seconds=rng.randint(0, 3600 if status != "offline" else 86400 * 3))),
+                        "publicIp": f"203.0.{n % 256}.{d % 256 + 1}",
+                    }
+                    self.devices[org_id].append(device)
+                    self.device_index[serial] = (org_id, device)
+                    self.network_devices[net_id].append(device)
+
+    def org_for_path(self, kind, ident):
+        """Resolve the organization a request is billed against for rate limiting"""
+        if kind == "organizations":
+            return ident
+        if kind == "networks" and ident in self.network_index:
+            return self.network_index[ident][0]
+        if kind == "devices" and ident in self.device_index:
+            return self.device_index[ident][0]
+        return None
+
+    def _rng(self, *parts):
+        return random.Random(f"{self.seed}:" + ":".join(str(p) for p in parts))
+
+    @lru_cache(maxsize=4096)
+    def clients(self, network_id):
+        rng = self._rng("clients", network_id)
+        devices = self.network_devices.get(network_id, [])
+        aps = [d for d in devices if d["productType"] == "wireless"] or devices
+        clients = []
+        for c in range(self.clients_per_network):
+            ap = rng.choice(aps) if aps else None
+            sent = rng.randint(1_000, 5_000_000)
+            recv = rng.randint(1_000, 20_000_000)
+            clients.append({
+                "id": f"k{network_id[-6:]}{c:05d}",
+                "mac": f"a4:83:e7:{c // 65536 % 256:02x}:{c // 256 % 256:02x}:{c % 256:02x}",
+                "description": f"client-{c + 1}",
+                "ip": f"192.168.{c // 250 % 256}.{c % 250 + 2}",
+                "user": None,
+                "vlan": str(rng.choice([1, 10, 20, 30])),
+                "firstSeen": _iso(self.epoch - timedelta(days=rng.randint(1, 90))),
+                "lastSeen": _iso(self.epoch - timedelta(seconds=rng.randint(0, 3600))),
+                "manufacturer": rng.choice(["Apple", "Samsung", "Dell", "Lenovo", "HP", "Intel"]),
+                "os": rng.choice(["iOS", "Android", "Windows 11", "macOS", "Linux"]),
+                "recentDeviceSerial": ap["serial"] if ap else None,
+                "recentDeviceName": ap["name"] if ap else None,
+                "ssid": "Mock-Corp" if ap and ap["productType"] == "wireless" else None,
+                "status": rng.choice(["Online", "Online", "Online", "Offline"]),
+                "usage": {"sent": sent, "recv": recv, "total": sent + recv},
+            })
+        return clients
+
+    def traffic(self, network_id):
+        rng = self._rng("traffic", network_id)
+        rows = []
+        for i in range(self.traffic_rows):
+            sent = rng.uniform(0.1, 5000.0)
+            recv = rng.uniform(0.1, 20000.0)
+            rows.append({
+                "application": APPLICATIONS[i % len(APPLICATIONS)] if i < len(APPLICATIONS) else f"App {i}",
+                "destination": f"dest{i}.example.com",
+                "protocol": rng.choice(["TCP", "UDP"]),
+                "port": rng.choice([443, 80, 53, 8443, 3478]),
+                "sent": round(sent, 2),
+                "recv": round(recv, 2),
+                "numClients": rng.randint(1, max(1, self.clients_per_network)),
+                "activeTime": rng.randint(60, 86400),
+                "flows": rng.randint(1, 100000),
+            })
+        return rows
+
+    @lru_cache(maxsize=1024)
+    def events(self, network_id):
+        rng = self._rng("events", network_id)
+        events = []
+        for device in self.network_devices.get(network_id, []):
+            kinds = EVENT_TYPES[device["productType"]]
+            for _ in range(self.events_per_device):
+                event_type, description = rng.choice(kinds)
+                occurred = self.epoch - timedelta(seconds=rng.randint(600, 7 * 86400))
+                events.append({
+                    "occurredAt": _iso(occurred),
+                    "networkId": network_id,
+                    "type": event_type,
+                    "description": description,
+                    "category": device["productType"],
+                    "clientId": None,
+                    "clientDescription": None,
+                    "deviceSerial": device["serial"],
+                    "deviceName": device["name"],
+                    "productType": device["productType"],
+                    "eventData": {"detail": rng.randint(1, 1000)},
+                })
+        events.sort(key=lambda e: e["occurredAt"])
+        return events
+
+    @lru_cache(maxsize=64)
+    def inventory(self, org_id):
+        """Claimed devices of an org: every deployed device plus unassigned spares (about 1 in 20)"""
+        rng = self._rng("inventory", org_id)
+        devices = self.devices.get(org_id, [])
+        spares = []
+        for i in range(len(devices) // 20):
+            product = _weighted(rng, PRODUCT_WEIGHTS)
+            spares.append({
+                "name": "",
+                "serial": f"Q2SP-{org_id[-4:]}-{i:04d}",
+                "mac": f"e0:55:3e:{i // 65536 % 256:02x}:{i // 256 % 256:02x}:{i % 256:02x}",
+                "model": rng.choice(PRODUCT_MODELS[product]),
+                "productType": product,
+                "networkId": None,
+                "tags": [],
+            })
+        inventory = []
+        for d in devices + spares:
+            claimed = self.epoch - timedelta(days=rng.randint(30, 1500))
+            inventory.append({
+                "mac": d["mac"], "serial": d["serial"], "name": d["name"], "model": d["model"],
+                "networkId": d["networkId"], "orderNumber": f"4C{rng.randint(1_000_000, 9_999_999)}",
+                "claimedAt": _iso(claimed), "licenseExpirationDate": None, "tags": d["tags"],
+                "productType": d["productType"], "countryCode": "KR", "details": [],
+            })
+        return sorted(inventory, key=lambda d: d["serial"])
+
+
+class RateLimiter:
+    """
+    Token bucket per organization (rate per second with an equal burst allowance)
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key):
+        if not self.rate:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (self.rate * 2, now))
+            tokens = min(self.rate * 2, tokens + (now - last) * self.rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return False
+            self._buckets[key] = (tokens - 1, now)
+            return True
+
+
+class RequestStats:
+    """
+    Thread-safe request counters per route (plus 'rate_limited' and 'unmatched')
+    """
+
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, name):
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+    @property
+    def total(self):
+        with self._lock:
+            return sum(v for k, v in self._counts.items() if k != "rate_limited")
+
+
+def paginate(items, params, path, key, default_per_page=1000, max_per_page=1000):
+    """
+    Slice items by perPage / startingAfter / endingBefore and build the Link header.
+    Items must be sorted by key.
+    """
+    per_page = min(int(params.get("perPage", default_per_page)), max_per_page)
+    keys = [key(i) for i in items]
+    start = 0
+    if "startingAfter" in params:
+        after = params["startingAfter"]
+        start = next((idx for idx, k in enumerate(keys) if k > after), len(items))
+        end = min(start + per_page, len(items))
+    elif "endingBefore" in params:
+        before = params["endingBefore"]
+        end = next((idx for idx, k in enumerate(keys) if k >= before), len(items))
+        start = max(0, end - per_page)
+    else:
+        end = min(per_page, len(items))
+    page = items[start:end]
+
+    base = {k: v for k, v in params.items() if k not in ("startingAfter", "endingBefore")}
+    base["perPage"] = per_page
+
+    def link(rel, extra):
+        # startingAfter / endingBefore must stay last; the SDK splits the URL on it
+        query = urllib.parse.urlencode({**base, **extra})
+        return f"<{path}?{query}>; rel={rel}"
+
+    links = [link("first", {})]
+    if start > 0 and page:
+        links.append(link("prev", {"endingBefore": keys[start]}))
+    if end < len(items) and page:
+        links.append(link("next", {"startingAfter": keys[end - 1]}))
+    return page, ", ".join(links)
+
+
+class MockMerakiHandler(BaseHTTPRequestHandler):
+    dataset = None
+    limiter = None
+    stats = None
+    latency = 0.0
+    jitter = 0.0
+    quiet = True
+
+    # (regex, handler method name); paths are relative to API_PREFIX
+    ROUTES = [
+        (r"/organizations", "organizations"),
+        (r"/organizations/(?P<org>[^/]+)", "organization"),
+        (r"/organizations/(?P<org>[^/]+)/networks", "org_networks"),
+        (r"/organizations/(?P<org>[^/]+)/devices", "org_devices"),
+        (r"/organizations/(?P<org>[^/]+)/devices/statuses", "org_device_statuses"),
+        (r"/organizations/(?P<org>[^/]+)/inventoryDevices", "org_inventory_devices"),   # legacy path
+        (r"/organizations/(?P<org>[^/]+)/inventory/devices", "org_inventory_devices"),
+        (r"/organizations/(?P<org>[^/]+)/devices/uplinksLossAndLatency", "org_uplinks_loss_latency"),
+        (r"/organizations/(?P<org>[^/]+)/devices/powerModules/statuses/byDevice", "org_power_modules"),
+        (r"/organizations/(?P<org>[^/]+)/wireless/devices/system/cpu/load/history", "org_wireless_cpu_load"),
+        (r"/organizations/(?P<org>[^/]+)/configurationChanges", "org_config_changes"),
+        (r"/organizations/(?P<org>[^/]+)/firmware/upgrades", "org_firmware_upgrades"),
+        (r"/organizations/(?P<org>[^/]+)/licenses/overview", "org_licenses_overview"),
+        (r"/organizations/(?P<org>[^/]+)/licensing/coterm/licenses", "org_coterm_licenses"),
+        (r"/networks/(?P<net>[^/]+)", "network"),
+        (r"/networks/(?P<net>[^/]+)/clients", "network_clients"),
+        (r"/networks/(?P<net>[^/]+)/clients/overview", "network_clients_overview"),
+        (r"/networks/(?P<net>[^/]+)/clients/bandwidthUsageHistory", "network_clients_bandwidth"),
+        (r"/networks/(?P<net>[^/]+)/traffic", "network_traffic"),
+        (r"/networks/(?P<net>[^/]+)/events", "network_events"),
+        (r"/networks/(?P<net>[^/]+)/health/alerts", "network_health_alerts"),
+        (r"/networks/(?P<net>[^/]+)/appliance/trafficShaping/uplinkBandwidth", "network_uplink_bandwidth"),
+        (r"/networks/(?P<net>[^/]+)/appliance/uplinks/usageHistory", "network_uplinks_usage"),
+        (r"/devices/(?P<serial>[^/]+)", "device"),
+        (r"/devices/(?P<serial>[^/]+)/managementInterface", "device_management_interface"),
+        (r"/devices/(?P<serial>[^/]+)/switch/ports", "device_switch_ports"),
+        (r"/devices/(?P<serial>[^/]+)/switch/ports/statuses", "device_switch_port_statuses"),
+        (r"/devices/(?P<serial>[^/]+)/appliance/performance", "device_appliance_performance"),
+    ]
+    COMPILED_ROUTES = [(re.compile(pattern + r"/?$"), name) for pattern, name in ROUTES]
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    # ---- plumbing ----
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _error(self, status, message, headers=None):
+        self._send_json(status, {"errors": [message]}, headers)
+
+    def do_GET(self):
+        parsed = urllib.parse.urlsplit(self.path)
+        if not parsed.path.startswith(API_PREFIX):
+            return self._error(404, "Not found")
+        path = parsed.path[len(API_PREFIX):] or "/"
+        params = dict(urllib.parse.parse_qsl(parsed.query))
+
+        if not (self.headers.get("X-Cisco-Meraki-API-Key") or self.headers.get("Authorization")):
+            return self._error(401, "Invalid API key")
+
+        for pattern, name in self.COMPILED_ROUTES:
+            match = pattern.match(path)
+            if match:
+                break
+        else:
+            self.stats.record("unmatched")
+            return self._error(404, f"No mock route for {path}")
+
+        kind, _, ident = path.strip("/").partition("/")
+        ident = ident.split("/")[0]
+        org_id = self.dataset.org_for_path(kind, ident) if ident else None
+        if ident and org_id is None:
+            return self._error(404, "Not found")
+
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+        # Rate limit per org; org-less calls (GET /organizations) share the API key's bucket
+        bucket = org_id or self.headers.get("X-Cisco-Meraki-API-Key") or self.headers.get("Authorization")
+        if not self.limiter.acquire(bucket):
+            self.stats.record("rate_limited")
+            return self._error(429, "API rate limit exceeded for organization", {"Retry-After": "1"})
+
+        self.stats.record(name)
+        result = getattr(self, "route_" + name)(params, path, **match.groupdict())
+        if isinstance(result, tuple):
+            body, link = result
+            self._send_json(200, body, {"Link": link} if link else None)
+        else:
+            self._send_json(200, result)
+
+    # ---- organizations ----
+
+    def route_organizations(self, params, path):
+        return paginate(self.dataset.orgs, params, path, key=lambda o: o["id"], default_per_page=9000, max_per_page=9000)
+
+    def route_organization(self, params, path, org):
+        return next(o for o in self.dataset.orgs if o["id"] == org)
+
+    def route_org_networks(self, params, path, org):
+        return paginate(self.dataset.networks[org], params, path, key=lambda n: n["id"], max_per_page=100000)
+
+    def route_org_devices(self, params, path, org):
+        devices = [{k: v for k, v in d.items() if k not in ("status", "lastReportedAt", "publicIp")}
+                   for d in self._filter_devices(org, params)]
+        return paginate(devices, params, path, key=lambda d: d["serial"])
+
+    def route_org_device_statuses(self, params, path, org):
+        statuses = [{
+            "name": d["name"], "serial": d["serial"], "mac": d["mac"], "publicIp": d["publicIp"],
+            "networkId": d["networkId"], "status": d["status"], "lastReportedAt": d["lastReportedAt"],
+            "lanIp": d["lanIp"], "productType": d["productType"], "model": d["model"], "tags": d["tags"],
+        } for d in self._filter_devices(org, params)]
+        return paginate(statuses, params, path, key=lambda d: d["serial"])
+
+    def route_org_inventory_devices(self, params, path, org):
+        inventory = self.dataset.inventory(org)
+        used_state = params.get("usedState")
+        if used_state in ("used", "unused"):
+            inventory = [d for d in inventory if (d["networkId"] is not None) == (used_state == "used")]
+        if "productTypes[]" in params:
+            inventory = [d for d in inventory if d["productType"] == params["productTypes[]"]]
+        return paginate(inventory, params, path, key=lambda d: d["serial"])
+
+    def _filter_devices(self, org, params):
+        devices = self.dataset.devices[org]
+        network_ids = [v for k, v in urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query)
+                       if k in ("networkIds[]", "networkIds")]
+        if network_ids:
+            wanted = set(network_ids)
+            devices = [d for d in devices if d["networkId"] in wanted]
+        if "productTypes[]" in params:
+            devices = [d for d in devices if d["productType"] == params["productTypes[]"]]
+        return sorted(devices, key=lambda d: d["serial"])
+
+    def route_org_uplinks_loss_latency(self, params, path, org):
+        # At most five minutes per request, ending no later than two minutes ago
+        now = datetime.now(timezone.utc).timestamp() - 120
+        if "t0" in params:
+            start = _parse_iso(params["t0"]).timestamp()
+            end = min(now, _parse_iso(params["t1"]).timestamp() if "t1" in params else start + 300, start + 300)
+        else:
+            end = now
+            start = end - min(int(params.get("timespan", 300)), 300)
+        minutes = range(int(start // 60) + 1, int(end // 60) + 1)
+        results = []
+        for d in self.dataset.devices[org]:
+            if d["productType"] != "appliance":
+                continue
+            for uplink in ("wan1", "wan2"):
+                series = []
+                for minute in minutes:
+                    # Samples depend only on (uplink, minute) so overlapping fetches agree
+                    rng = self.dataset._rng("uplink", d["serial"], uplink, minute)
+                    series.append({
+                        "ts": _iso(datetime.fromtimestamp(minute * 60, timezone.utc)),
+                        "lossPercent": round(max(0.0, rng.gauss(0.5, 1.5)), 1),
+                        "latencyMs": round(max(1.0, rng.gauss(25, 10)), 1),
+                    })
+                results.append({"networkId": d["networkId"], "serial": d["serial"], "uplink": uplink,
+                                "ip": "8.8.8.8", "timeSeries": series})
+        return results
+
+    def route_org_power_modules(self, params, path, org):
+        # Rackmount MX/MS models carry two power supplies; one is occasionally unplugged
+        devices = [d for d in self.dataset.devices[org]
+                   if d["productType"] in ("appliance", "switch") and d["status"] != "offline"]
+        modules = []
+        for d in devices:
+            rng = self.dataset._rng("power", d["serial"])
+            modules.append({
+                "serial": d["serial"], "name": d["name"], "model": d["model"], "productType": d["productType"],
+                "network": {"id": d["networkId"]}, "tags": d["tags"],
+                "slots": [{"number": n, "serial": f"PSU-{d['serial']}-{n}", "model": "PWR-MS320-640WAC",
+                           "status": "powering" if n == 1 or rng.random() < 0.9 else "not connected"}
+                          for n in (1, 2)],
+            })
+        return paginate(sorted(modules, key=lambda m: m["serial"]), params, path, key=lambda m: m["serial"])
+
+    def route_org_wireless_cpu_load(self, params, path, org):
+        end = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        timespan = min(int(params.get("timespan", 86400)), 86400)
+        points = range(max(1, timespan // 300))
+        history = []
+        for d in self.dataset.devices[org]:
+            if d["productType"] != "wireless":
+                continue
+            rng = self.dataset._rng("cpu", d["serial"], end.isoformat())
+            history.append({
+                "serial": d["serial"], "name": d["name"], "model": d["model"], "tags": d["tags"],
+                "network": {"id": d["networkId"]}, "cpuCount": 4,
+                "series": [{"ts": _iso(end - timedelta(seconds=300 * i)), "cpuLoad5": rng.randint(2_000, 150_000)}
+                           for i in points],
+            })
+        history.sort(key=lambda d: d["serial"])
+        return paginate(history, params, path, key=lambda d: d["serial"], default_per_page=10, max_per_page=20)
+
+    def route_org_config_changes(self, params, path, org):
+        rng = self.dataset._rng("changes", org)
+        networks = self.dataset.networks[org]
+        changes = sorted(({
+            "ts": _iso(self.dataset.epoch - timedelta(seconds=rng.randint(0, 7 * 86400))),
+            "adminName": rng.choice(["Alice Admin", "Bob Operator"]),
+            "adminEmail": "admin@example.com",
+            "adminId": "212406",
+            "networkName": (net := rng.choice(networks))["name"] if networks else None,
+            "networkId": net["id"] if networks else None,
+            "page": rng.choice(["Switch ports", "SSIDs", "Firewall", "Group policies"]),
+            "label": rng.choice(["VLAN", "Enabled", "Rule", "Name"]),
+            "oldValue": "1",
+            "newValue": "2",
+        } for _ in range(min(500, 5 * len(networks) + 10))), key=lambda c: c["ts"], reverse=True)
+        return paginate(changes, params, path, key=lambda c: c["ts"], default_per_page=5000, max_per_page=5000)
+
+    def route_org_firmware_upgrades(self, params, path, org):
+        upgrades = [{
+            "upgradeId": f"{org}{i:04d}", "upgradeBatchId": f"b{org}", "status": "Completed",
+            "productTypes": product,
+            "network": {"id": n["id"], "name": n["name"]},
+            "toVersion": {"shortName": f"{product.upper()} 18.211"},
+            "fromVersion": {"shortName": f"{product.upper()} 18.107"},
+            "completedAt": _iso(self.dataset.epoch - timedelta(days=i % 30)),
+        } for i, (n, product) in enumerate((n, p) for n in self.dataset.networks[org] for p in ("appliance", "switch"))]
+        return paginate(upgrades, params, path, key=lambda u: u["upgradeId"])
+
+    def route_org_licenses_overview(self, params, path, org):
+        counts = {}
+        for d in self.dataset.devices[org]:
+            counts[d["model"]] = counts.get(d["model"], 0) + 1
+        return {
+            "status": "OK",
+            "expirationDate": (self.dataset.epoch + timedelta(days=365)).strftime("%b %d, %Y UTC"),
+            "licensedDeviceCounts": counts,
+        }
+
+    def route_org_coterm_licenses(self, params, path, org):
+        counts = {}
+        for d in self.dataset.devices[org]:
+            counts[d["model"]] = counts.get(d["model"], 0) + 1
+        licenses = [{
+            "key": f"Z2{org}-{i:04d}",
+            "duration": 365 * (1 + i % 3),
+            "mode": "addDevices",
+            "startedAt": _iso(self.dataset.epoch - timedelta(days=100)),
+            "claimedAt": _iso(self.dataset.epoch - timedelta(days=101)),
+            "invalidated": False,
+            "invalidatedAt": None,
+            "expired": False,
+            "organizationId": org,
+            "editions": [{"edition": "Enterprise", "productType": "wireless"}],
+            "counts": [{"model": model, "count": count}],
+        } for i, (model, count) in enumerate(sorted(counts.items()))]
+        return paginate(licenses, params, path, key=lambda l: l["key"])
+
+    # ---- networks ----
+
+    def route_network(self, params, path, net):
+        return self.dataset.network_index[net][1]
+
+    def route_network_clients(self, params, path, net):
+        return paginate(self.dataset.clients(net), params, path, key=lambda c: c["id"], default_per_page=10, max_per_page=5000)
+
+    def route_network_clients_overview(self, params, path, net):
+        clients = self.dataset.clients(net)
+        total = sum(c["usage"]["total"] for c in clients)
+        return {
+            "counts": {"total": len(clients), "withHeavyUsage": len([c for c in clients if c["usage"]["total"] > 10_000_000])},
+            "usages": {
+                "average": total // max(1, len(clients)),
+                "withHeavyUsageAverage": 0,
+            },
+        }
+
+    def _series_window(self, params, default_step):
+        """(start, end, step) of a time-series request: t0/t1 or timespan, aligned to the step"""
+        now = datetime.now(timezone.utc).timestamp()
+        step = int(params.get("resolution") or default_step)
+        if "t0" in params:
+            start = _parse_iso(params["t0"]).timestamp()
+            end = min(now, _parse_iso(params["t1"]).timestamp()) if "t1" in params else now
+        else:
+            timespan = int(params.get("timespan", 86400))
+            start, end = now - timespan, now
+        return start - start % step, end, step
+
+    def route_network_clients_bandwidth(self, params, path, net):
+        timespan = int(params.get("timespan", 86400))
+        start, end, step = self._series_window(params, 300 if timespan <= 86400 else 3600)
+        history = []
+        ts = start
+        while ts < end:
+            # Values depend only on (network, bucket) so overlapping fetches agree
+            rng = self.dataset._rng("bw", net, int(ts))
+            up = rng.randint(1_000, 500_000)
+            down = rng.randint(1_000, 2_000_000)
+            history.append({"ts": _iso(datetime.fromtimestamp(ts, timezone.utc)),
+                            "upstream": up, "downstream": down, "total": up + down})
+            ts += step
+        return paginate(history, params, path, key=lambda h: h["ts"], max_per_page=1000)
+
+    def route_network_uplinks_usage(self, params, path, net):
+        start, end, step = self._series_window(params, 300)
+        history = []
+        ts = start
+        while ts < end:
+            rng = self.dataset._rng("uplink", net, int(ts))
+            history.append({
+                "startTime": _iso(datetime.fromtimestamp(ts, timezone.utc)),
+                "endTime": _iso(datetime.fromtimestamp(ts + step, timezone.utc)),
+                "byInterface": [{"interface": "wan1", "sent": rng.randint(10**6, 10**9), "received": rng.randint(10**6, 10**10)},
+                                {"interface": "wan2", "sent": rng.randint(0, 10**8), "received": rng.randint(0, 10**9)}],
+            })
+            ts += step
+        return history
+
+    def route_network_traffic(self, params, path, net):
+        # Volumes scale with the requested window so hourly snapshots add up to longer spans
+        if "t0" in params:
+            timespan = datetime.now(timezone.utc).timestamp() - _parse_iso(params["t0"]).timestamp()
+        else:
+            timespan = int(params.get("timespan", 86400))
+        scale = timespan / 86400
+        return [{**row, "sent": round(row["sent"] * scale, 2), "recv": round(row["recv"] * scale, 2),
+                 "activeTime": int(row["activeTime"] * scale), "flows": int(row["flows"] * scale)}
+                for row in self.dataset.traffic(net)]
+
+    def route_network_events(self, params, path, net):
+        events = self.dataset.events(net)
+        for field in ("deviceSerial", "productType"):
+            if field in params:
+                events = [e for e in events if e.get(field) == params[field]]
+        per_page = min(int(params.get("perPage", 10)), 1000)
+        if "startingAfter" in params:
+            page = [e for e in events if e["occurredAt"] > params["startingAfter"]][:per_page]
+        else:
+            before = params.get("endingBefore", "￿")
+            page = [e for e in events if e["occurredAt"] < before][-per_page:]
+        page_start = page[0]["occurredAt"] if page else _iso(self.dataset.epoch)
+        page_end = page[-1]["occurredAt"] if page else _iso(self.dataset.epoch)
+        base = {k: v for k, v in params.items() if k not in ("startingAfter", "endingBefore")}
+        links = []
+        if page and page[0] is not events[0]:
+            links.append(f"<{path}?{urllib.parse.urlencode({**base, 'endingBefore': page_start})}>; rel=prev")
+        if page and page[-1] is not events[-1]:
+            links.append(f"<{path}?{urllib.parse.urlencode({**base, 'startingAfter': page_end})}>; rel=next")
+        # The event log returns newest first within a page
+        return {"message": None, "pageStartAt": page_start, "pageEndAt": page_end, "events": page[::-1]}, ", ".join(links)
+
+    def route_network_health_alerts(self, params, path, net):
+        offline = [d for d in self.dataset.network_devices[net] if d["status"] == "offline"]
+        return [{
+            "id": f"alert-{d['serial']}", "category": "Device health", "type": "Device offline",
+            "severity": "critical", "scope": {"devices": [{"serial": d["serial"], "name": d["name"], "productType": d["productType"]}]},
+        } for d in offline]
+
+    def route_network_uplink_bandwidth(self, params, path, net):
+        return {"bandwidthLimits": {"wan1": {"limitUp": 100000, "limitDown": 500000},
+                                    "wan2": {"limitUp": 50000, "limitDown": 100000},
+                                    "cellular": {"limitUp": None, "limitDown": None}}}
+
+    # ---- devices ----
+
+    def route_device(self, params, path, serial):
+        device = self.dataset.device_index[serial][1]
+        return {k: v for k, v in device.items() if k not in ("status", "lastReportedAt", "publicIp")}
+
+    def route_device_management_interface(self, params, path, serial):
+        device = self.dataset.device_index[serial][1]
+        return {"ddnsHostnames": {"activeDdnsHostname": f"{device['name'].lower()}.dynamic-m.com"},
+                "wan1": {"wanEnabled": "enabled", "usingStaticIp": False, "vlan": None}}
+
+    def _ports(self, serial):
+        device = self.dataset.device_index[serial][1]
+        if device["productType"] != "switch":
+            return []
+        count = 48 if "48" in device["model"] else (24 if "24" in device["model"] else 8)
+        return [str(p) for p in range(1, count + 1)]
+
+    def route_device_switch_ports(self, params, path, serial):
+        return [{"portId": p, "name": None, "enabled": True, "poeEnabled": True, "type": "access",
+                 "vlan": 10, "voiceVlan": None, "linkNegotiation": "Auto negotiate"} for p in self._ports(serial)]
+
+    def route_device_switch_port_statuses(self, params, path, serial):
+        rng = self.dataset._rng("ports", serial)
+        statuses = []
+        for p in self._ports(serial):
+            connected = rng.random() < 0.6
+            statuses.append({
+                "portId": p, "enabled": True,
+                "status": "Connected" if connected else "Disconnected",
+                "isUplink": p == self._ports(serial)[-1],
+                "errors": [], "warnings": [],
+                "speed": "1 Gbps" if connected else "",
+                "duplex": "full" if connected else "",
+                "usageInKb": {"total": rng.randint(0, 10_000_000) if connected else 0,
+                              "sent": 0, "recv": 0},
+                "clientCount": rng.randint(0, 3) if connected else 0,
+                "powerUsageInWh": round(rng.uniform(0, 50), 1) if connected else 0,
+                "trafficInKbps": {"total": round(rng.uniform(0, 1000), 1) if connected else 0},
+            })
+        return statuses
+
+    def route_device_appliance_performance(self, params, path, serial):
+        device = self.dataset.device_index[serial][1]
+        if device["productType"] != "appliance":
+            return {"errors": ["Device is not an appliance"]}
+        return {"perfScore": self.dataset._rng("perf", serial).randint(5, 95)}
+
+
+def build_server(host="127.0.0.1", port=8765, dataset=None, rate_limit=10, latency_ms=0, jitter_ms=0, quiet=True):
+    """
+    Create (but do not start) a mock server; call serve_forever() or run it in a thread
+    """
+    handler = type("ConfiguredMockMerakiHandler", (MockMerakiHandler,), {
+        "dataset": dataset or MockDataset(),
+        "limiter": RateLimiter(rate_limit),
+        "stats": RequestStats(),
+        "latency": latency_ms / 1000.0,
+        "jitter": jitter_ms / 1000.0,
+        "quiet": quiet,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.stats = handler.stats
+    return server
+
+
+def start_in_thread(**kwargs):
+    """
+    Start a mock server on a background thread; returns (server, base_url) for DashboardAPI(base_url=...)
+    """
+    server = build_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}{API_PREFIX}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Meraki Dashboard API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--orgs", type=int, default=1)
+    parser.add_argument("--networks", type=int, default=10, help="networks per organization")
+    parser.add_argument("--devices-per-network", type=int, default=20)
+    parser.add_argument("--clients-per-network", type=int, default=50)
+    parser.add_argument("--traffic-rows", type=int, default=50, help="rows per getNetworkTraffic response")
+    parser.add_argument("--events-per-device", type=int, default=20)
+    parser.add_argument("--rate-limit", type=float, default=10, help="requests/second per organization (0 disables)")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    dataset = MockDataset(
+        orgs=args.orgs, networks=args.networks, devices_per_network=args.devices_per_network,
+        clients_per_network=args.clients_per_network, traffic_rows=args.traffic_rows,
+        events_per_device=args.events_per_device, seed=args.seed,
+    )
+    server = build_server(args.host, args.port, dataset, args.rate_limit, args.latency_ms, args.jitter_ms,
+                          quiet=not args.verbose)
+    total_devices = sum(len(d) for d in dataset.devices.values())
+    print("🧪 Mock Meraki API")
+    print(f"  {args.orgs} org(s), {args.networks} networks/org, {total_devices:,} devices")
+    print(f"  rate limit: {args.rate_limit or 'off'} req/s per org, latency {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms")
+    print(f"  base URL: http://{args.host}:{args.port}{API_PREFIX}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()